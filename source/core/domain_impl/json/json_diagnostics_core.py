@@ -55,6 +55,206 @@ def find_nearby_line(
     return None, None
 
 
+# --- Nearby-line rule registry helpers ---
+"""Line-level repair detectors registered once and swept together over one lookback window per error line."""
+
+import logging
+from typing import Any
+from core import json_diagnostics as json_diag_core
+from core.exceptions import EXPECTED_ERRORS
+
+_LOG = logging.getLogger(__name__)
+
+
+class NearbyLineRule:
+    """One detector: check(owner, text, lineno) returns a payload (hit) or None; text is stripped when strip_text."""
+
+    __slots__ = ("name", "check", "lookback", "strip_text", "arity")
+
+    def __init__(self, name: str, check: Any, lookback: int = 2, strip_text: bool = False, arity: int = 2) -> None:
+        self.name = name
+        self.check = check
+        self.lookback = int(lookback)
+        self.strip_text = bool(strip_text)
+        self.arity = int(arity)
+
+    def result(self, hit: Any) -> tuple:
+        if hit is None:
+            return (None,) * self.arity
+        lineno, text, payload = hit
+        if self.arity == 2:
+            return lineno, text
+        return int(lineno), text, payload
+
+
+# Insertion order is precedence: the order build_symbol_json_diagnostic/build_json_diagnostic consult them.
+_NEARBY_LINE_RULES: dict[str, NearbyLineRule] = {}
+
+
+def register_nearby_line_rule(name: str, check: Any, lookback: int = 2, strip_text: bool = False, arity: int = 2) -> NearbyLineRule:
+        rule = NearbyLineRule(name, check, lookback=lookback, strip_text=strip_text, arity=arity)
+        _NEARBY_LINE_RULES[name] = rule
+        return rule
+
+
+def _nearby_predicate(method_name: str, with_lineno: bool = False) -> Any:
+        if with_lineno:
+            return lambda owner, text, lineno: True if getattr(owner, method_name)(text, lineno) else None
+        return lambda owner, text, _lineno: True if getattr(owner, method_name)(text) else None
+
+
+def _nearby_insert_col(method_name: str) -> Any:
+        def check(owner, text, _lineno):
+            insert_col = getattr(owner, method_name)(text)
+            return None if insert_col is None else int(insert_col)
+        return check
+
+
+def _nearby_line_window(buffer: Any, lineno: int, lookback: int) -> list:
+        """Current line plus up to lookback previous non-empty lines, as (lineno, raw, stripped)."""
+        window = []
+        current = buffer.line(lineno)
+        window.append((lineno, current, current.strip()))
+        line = max(lineno - 1, 1)
+        while len(window) <= lookback:
+            line = buffer.prev_non_empty(line)
+            if line is None:
+                break
+            raw = buffer.line(line)
+            window.append((line, raw, raw.strip()))
+            line -= 1
+            if line < 1:
+                break
+        return window
+
+
+def sweep_nearby_lines(owner: Any, lineno: Any) -> dict:
+        """First hit of every registered rule around lineno, computed in one pass and cached on the diagnostic buffer."""
+        buffer = _diagnostic_buffer(owner)
+        lineno = int(lineno)
+        hits = buffer.nearby_sweeps.get(lineno)
+        if hits is not None:
+            return hits
+        rules = list(_NEARBY_LINE_RULES.values())
+        window = _nearby_line_window(buffer, lineno, max((rule.lookback for rule in rules), default=0))
+        hits = {}
+        for rule in rules:
+            for ln, raw, stripped in window[:rule.lookback + 1]:
+                text = stripped if rule.strip_text else raw
+                try:
+                    payload = rule.check(owner, text, ln)
+                except EXPECTED_ERRORS as exc:
+                    _LOG.debug('expected_error', exc_info=exc)
+                    payload = None
+                if payload is not None:
+                    hits[rule.name] = (ln, text, payload)
+                    break
+        buffer.nearby_sweeps[lineno] = hits
+        return hits
+
+
+def ranked_nearby_line_hits(owner: Any, lineno: Any) -> list:
+        """Sweep hits as (rule name, lineno, text, payload), highest precedence first."""
+        if not lineno:
+            return []
+        hits = sweep_nearby_lines(owner, lineno)
+        return [(name,) + hits[name] for name in _NEARBY_LINE_RULES if name in hits]
+
+
+def scan_nearby_line_rule(owner: Any, name: str, lineno: Any, lookback: Any) -> tuple:
+        """Single-rule scan of the legacy window; used for non-default lookbacks."""
+        rule = _NEARBY_LINE_RULES[name]
+        found = find_nearby_line(
+            lineno=lineno,
+            lookback=lookback,
+            get_line_text_fn=lambda ln: _diagnostic_buffer(owner).line(ln),
+            predicate_fn=lambda txt, ln: rule.check(owner, txt, ln) is not None,
+            expected_errors=EXPECTED_ERRORS,
+            strip_text=rule.strip_text,
+            predicate_kwargs_provider=lambda ln, _txt: {"ln": ln},
+        )
+        if found[0] is None:
+            return rule.result(None)
+        ln, text = found
+        return rule.result((ln, text, rule.check(owner, text, ln)))
+
+
+def nearby_line_rule_match(owner: Any, name: str, lineno: Any, lookback: Any = None) -> tuple:
+        rule = _NEARBY_LINE_RULES[name]
+        if not lineno:
+            return rule.result(None)
+        if lookback is not None and int(lookback) != rule.lookback:
+            return scan_nearby_line_rule(owner, name, lineno, lookback)
+        return rule.result(sweep_nearby_lines(owner, lineno).get(name))
+
+
+register_nearby_line_rule("property_key_invalid_escape", _nearby_predicate("_line_has_property_key_invalid_escape"))
+register_nearby_line_rule("missing_colon", _nearby_predicate("_line_has_missing_colon_key_value"))
+register_nearby_line_rule("comma_before_colon", _nearby_predicate("_line_has_comma_before_colon"))
+register_nearby_line_rule("comma_after_colon", _nearby_predicate("_line_has_comma_after_colon"))
+register_nearby_line_rule("invalid_prefix_after_colon", _nearby_predicate("_line_has_invalid_prefix_after_colon"))
+register_nearby_line_rule("comma_before_closer", _nearby_predicate("_line_has_comma_before_closer"))
+register_nearby_line_rule("comma_line_invalid_tail", _nearby_predicate("_line_has_comma_line_invalid_tail"))
+register_nearby_line_rule(
+    "top_level_close_symbol_run", _nearby_predicate("_line_has_top_level_close_symbol_run", with_lineno=True)
+)
+register_nearby_line_rule(
+    "illegal_comma_after_top_level_close",
+    _nearby_predicate("_line_has_illegal_comma_after_top_level_close", with_lineno=True),
+)
+register_nearby_line_rule(
+    "illegal_trailing_comma", _nearby_predicate("_line_has_illegal_trailing_comma_before_close", with_lineno=True)
+)
+register_nearby_line_rule(
+    "duplicate_comma_run",
+    lambda owner, text, lineno: True if owner._line_has_duplicate_comma_run(text, lineno=lineno) else None,
+)
+register_nearby_line_rule("invalid_tail_after_quoted_item", _nearby_predicate("_line_has_invalid_tail_after_quoted_item"))
+register_nearby_line_rule(
+    "invalid_symbol_after_open", _nearby_predicate("_line_has_invalid_symbol_after_open"), strip_text=True
+)
+register_nearby_line_rule(
+    "duplicate_trailing_comma", _nearby_predicate("_line_has_duplicate_trailing_comma"), strip_text=True
+)
+register_nearby_line_rule(
+    "invalid_symbol_after_closer", _nearby_predicate("_line_has_invalid_symbol_after_closer"), strip_text=True
+)
+register_nearby_line_rule(
+    "invalid_trailing_symbols",
+    _nearby_predicate("_line_has_invalid_trailing_symbols_after_string_value"),
+    strip_text=True,
+)
+register_nearby_line_rule(
+    "unclosed_quoted_value_invalid_tail",
+    lambda owner, text, _lineno: owner._unclosed_quoted_value_invalid_tail_span(text) or None,
+    arity=3,
+)
+register_nearby_line_rule(
+    "missing_value_close_quote", _nearby_insert_col("_missing_value_close_quote_insert_col"), arity=3
+)
+register_nearby_line_rule(
+    "boolean_literal_typo",
+    lambda _owner, text, _lineno: json_diag_core.boolean_literal_typo_diagnostic(text) or None,
+    lookback=3,
+    arity=3,
+)
+register_nearby_line_rule(
+    "missing_value_open_quote", _nearby_insert_col("_missing_value_open_quote_insert_col"), lookback=3, arity=3
+)
+register_nearby_line_rule(
+    "trailing_stray_quote", _nearby_predicate("_line_has_trailing_stray_quote_after_comma"), strip_text=True
+)
+register_nearby_line_rule(
+    "extra_quote_in_value", _nearby_predicate("_line_extra_quote_in_string_value"), strip_text=True
+)
+register_nearby_line_rule(
+    "unquoted_value", _nearby_predicate("_line_needs_value_quotes"), lookback=3, strip_text=True
+)
+register_nearby_line_rule(
+    "missing_key_quote_before_colon", _nearby_predicate("_line_has_missing_key_quote_before_colon")
+)
+
+
 # --- Merged from json_colon_comma_service.py ---
 """JSON colon/comma diagnostic rule helpers."""
 
@@ -873,7 +1073,7 @@ def log_json_error(owner: Any, exc: Exception, target_line: object, note: str =
         end = target_line + 2
         for ln in range(start, end + 1):
             try:
-                text = owner.text.get(f"{ln}.0", f"{ln}.0 lineend")
+                text = _diagnostic_buffer(owner).line(ln)
             except _EXPECTED_DIAG_ERRORS as text_exc:
                 _log_expected_diag_error("collect_context_line", text_exc)
                 text = ""
@@ -1198,28 +1398,7 @@ def _missing_colon_key_value_span(owner: Any, line_text):
 
 
 def _find_nearby_missing_colon_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if txt.strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_has_missing_colon_key_value(txt):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "missing_colon", lineno, lookback)
 
 
 def _is_key_colon_comma_line(owner: Any, line_text):
@@ -1265,28 +1444,7 @@ def _fix_trailing_stray_quote_after_comma(owner: Any, line_text):
 
 
 def _find_nearby_trailing_stray_quote_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend").strip()))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend").strip()
-            except EXPECTED_ERRORS:
-                break
-            if txt:
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_has_trailing_stray_quote_after_comma(txt):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "trailing_stray_quote", lineno, lookback)
 
 
 def _line_has_duplicate_trailing_comma(owner: Any, line_text):
@@ -1302,28 +1460,7 @@ def _fix_duplicate_trailing_comma(owner: Any, line_text):
 
 
 def _find_nearby_duplicate_trailing_comma_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend").strip()))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend").strip()
-            except EXPECTED_ERRORS:
-                break
-            if txt:
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_has_duplicate_trailing_comma(txt):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "duplicate_trailing_comma", lineno, lookback)
 
 
 def _line_requires_trailing_comma(owner: Any, lineno):
@@ -1377,50 +1514,15 @@ def _fix_duplicate_comma_run(owner: Any, line_text, lineno=None):
 
 
 def _find_nearby_duplicate_comma_run_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if txt.strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_has_duplicate_comma_run(txt, lineno=ln):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "duplicate_comma_run", lineno, lookback)
 
 
 def _find_nearby_comma_before_colon_line(owner: Any, lineno, lookback=2):
-        return json_nearby_line_service.find_nearby_line(
-            lineno=lineno,
-            lookback=lookback,
-            get_line_text_fn=lambda ln: owner.text.get(f"{ln}.0", f"{ln}.0 lineend"),
-            predicate_fn=lambda txt, **_kwargs: owner._line_has_comma_before_colon(txt),
-            expected_errors=EXPECTED_ERRORS,
-            strip_text=False,
-        )
+        return nearby_line_rule_match(owner, "comma_before_colon", lineno, lookback)
 
 
 def _find_nearby_comma_after_colon_line(owner: Any, lineno, lookback=2):
-        return json_nearby_line_service.find_nearby_line(
-            lineno=lineno,
-            lookback=lookback,
-            get_line_text_fn=lambda ln: owner.text.get(f"{ln}.0", f"{ln}.0 lineend"),
-            predicate_fn=lambda txt, **_kwargs: owner._line_has_comma_after_colon(txt),
-            expected_errors=EXPECTED_ERRORS,
-            strip_text=False,
-        )
+        return nearby_line_rule_match(owner, "comma_after_colon", lineno, lookback)
 
 
 def _analyze_invalid_prefix_after_colon(owner: Any, line_text):
@@ -1528,53 +1630,11 @@ def _fix_invalid_prefix_after_colon(owner: Any, line_text):
 
 
 def _find_nearby_invalid_prefix_after_colon_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if txt.strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_has_invalid_prefix_after_colon(txt):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "invalid_prefix_after_colon", lineno, lookback)
 
 
 def _find_nearby_comma_before_closer_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if txt.strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_has_comma_before_closer(txt):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "comma_before_closer", lineno, lookback)
 
 
 def _expected_missing_close_symbol(owner: Any, lineno):
@@ -1600,53 +1660,11 @@ def _fix_comma_line_invalid_tail(owner: Any, line_text, lineno=None):
 
 
 def _find_nearby_comma_line_invalid_tail_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if txt.strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_has_comma_line_invalid_tail(txt):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "comma_line_invalid_tail", lineno, lookback)
 
 
 def _find_nearby_missing_key_quote_before_colon_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if txt.strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_has_missing_key_quote_before_colon(txt):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "missing_key_quote_before_colon", lineno, lookback)
 
 
 def _missing_key_quote_before_colon_diag(owner: Any, line_no, colno=1):
@@ -1701,28 +1719,7 @@ def _line_has_invalid_tail_after_quoted_item(owner: Any, line_text):
 
 
 def _find_nearby_invalid_tail_after_quoted_item_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if txt.strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_has_invalid_tail_after_quoted_item(txt):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "invalid_tail_after_quoted_item", lineno, lookback)
 
 
 def _line_has_illegal_trailing_comma_before_close(owner: Any, line_text, lineno):
@@ -1763,28 +1760,7 @@ def _fix_illegal_trailing_comma_before_close(owner: Any, line_text):
 
 
 def _find_nearby_illegal_trailing_comma_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if txt.strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_has_illegal_trailing_comma_before_close(txt, ln):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "illegal_trailing_comma", lineno, lookback)
 
 
 def _line_has_illegal_comma_after_top_level_close(owner: Any, line_text, lineno):
@@ -1804,53 +1780,11 @@ def _line_has_top_level_close_symbol_run(owner: Any, line_text, lineno):
 
 
 def _find_nearby_top_level_close_symbol_run_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if txt.strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_has_top_level_close_symbol_run(txt, ln):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "top_level_close_symbol_run", lineno, lookback)
 
 
 def _find_nearby_illegal_comma_after_top_level_close_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if txt.strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_has_illegal_comma_after_top_level_close(txt, ln):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "illegal_comma_after_top_level_close", lineno, lookback)
 
 
 def _first_invalid_trailing_symbol_col(owner: Any, line_text, lineno=None):
@@ -1862,61 +1796,19 @@ def _first_invalid_trailing_symbol_col(owner: Any, line_text, lineno=None):
 
 
 def _find_nearby_invalid_trailing_symbols_line(owner: Any, lineno, lookback=2):
-        return json_nearby_line_service.find_nearby_line(
-            lineno=lineno,
-            lookback=lookback,
-            get_line_text_fn=lambda ln: owner.text.get(f"{ln}.0", f"{ln}.0 lineend"),
-            predicate_fn=lambda txt, **_kwargs: owner._line_has_invalid_trailing_symbols_after_string_value(txt),
-            expected_errors=EXPECTED_ERRORS,
-            strip_text=True,
-        )
+        return nearby_line_rule_match(owner, "invalid_trailing_symbols", lineno, lookback)
 
 
 def _find_nearby_invalid_symbol_after_closer_line(owner: Any, lineno, lookback=2):
-        return json_nearby_line_service.find_nearby_line(
-            lineno=lineno,
-            lookback=lookback,
-            get_line_text_fn=lambda ln: owner.text.get(f"{ln}.0", f"{ln}.0 lineend"),
-            predicate_fn=lambda txt, **_kwargs: owner._line_has_invalid_symbol_after_closer(txt),
-            expected_errors=EXPECTED_ERRORS,
-            strip_text=True,
-        )
+        return nearby_line_rule_match(owner, "invalid_symbol_after_closer", lineno, lookback)
 
 
 def _find_nearby_invalid_symbol_after_open_line(owner: Any, lineno, lookback=2):
-        return json_nearby_line_service.find_nearby_line(
-            lineno=lineno,
-            lookback=lookback,
-            get_line_text_fn=lambda ln: owner.text.get(f"{ln}.0", f"{ln}.0 lineend"),
-            predicate_fn=lambda txt, **_kwargs: owner._line_has_invalid_symbol_after_open(txt),
-            expected_errors=EXPECTED_ERRORS,
-            strip_text=True,
-        )
+        return nearby_line_rule_match(owner, "invalid_symbol_after_open", lineno, lookback)
 
 
 def _find_nearby_extra_quote_in_value_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend").strip()))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend").strip()
-            except EXPECTED_ERRORS:
-                break
-            if txt:
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_extra_quote_in_string_value(txt):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "extra_quote_in_value", lineno, lookback)
 
 
 def _quote_unquoted_value(owner: Any, line_text):
@@ -2070,55 +1962,11 @@ def _missing_value_open_quote_insert_col(owner: Any, line_text):
 
 
 def _find_nearby_missing_value_close_quote_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if str(txt or "").strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            insert_col = owner._missing_value_close_quote_insert_col(txt)
-            if insert_col is not None:
-                return int(ln), txt, int(insert_col)
-        return None, None, None
+        return nearby_line_rule_match(owner, "missing_value_close_quote", lineno, lookback)
 
 
 def _find_nearby_missing_value_open_quote_line(owner: Any, lineno, lookback=3):
-        if not lineno:
-            return None, None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if str(txt or "").strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            insert_col = owner._missing_value_open_quote_insert_col(txt)
-            if insert_col is not None:
-                return int(ln), txt, int(insert_col)
-        return None, None, None
+        return nearby_line_rule_match(owner, "missing_value_open_quote", lineno, lookback)
 
 
 def _find_wrong_closing_symbol_line(owner: Any, lineno, lookback=2):
@@ -2126,6 +1974,7 @@ def _find_wrong_closing_symbol_line(owner: Any, lineno, lookback=2):
             owner._line_text,
             lineno,
             lookback=lookback,
+            expected_closer_fn=owner._expected_closer_before_position,
         )
 
 
@@ -2246,7 +2095,7 @@ def _missing_close_target_line_any(owner: Any, exc):
 def _missing_close_insertion_point(owner: Any, open_bracket, close_bracket, exc=None):
         open_line = owner._last_unmatched_bracket_line(open_bracket, close_bracket)
         try:
-            max_line = int(owner.text.index("end-1c").split(".")[0])
+            max_line = _diagnostic_buffer(owner).line_count
         except EXPECTED_ERRORS:
             max_line = 1
         if not open_line:
@@ -2263,12 +2112,10 @@ def _missing_close_insertion_point(owner: Any, open_bracket, close_bracket, exc=
             closer_tokens.append("}")
 
         candidate = None
-        for ln in range(open_line + 1, max_line + 1):
-            text = owner._line_text(ln)
-            stripped = text.strip()
-            if not stripped:
-                continue
-            if any(stripped.startswith(tok) for tok in closer_tokens):
+        for ln in _diagnostic_buffer(owner).closer_lines_after(open_line):
+            if ln > max_line:
+                break
+            if owner._line_text(ln).strip().startswith(tuple(closer_tokens)):
                 indent = owner._line_indent_width(ln)
                 if indent <= open_indent:
                     candidate = ln
@@ -2304,7 +2151,7 @@ def _find_comma_only_line_before(owner: Any, start_line):
         line = max(start_line - 1, 1)
         while line >= 1:
             try:
-                text = owner.text.get(f"{line}.0", f"{line}.0 lineend").strip()
+                text = _diagnostic_buffer(owner).line(line).strip()
             except EXPECTED_ERRORS:
                 return None
             if text == ",":
@@ -2335,10 +2182,10 @@ def _missing_close_target_line(owner: Any, open_bracket, close_bracket):
         if not open_line:
             return None
         line = open_line + 1
-        last_line = int(owner.text.index("end-1c").split(".")[0])
+        last_line = _diagnostic_buffer(owner).line_count
         while line <= last_line:
             try:
-                text = owner.text.get(f"{line}.0", f"{line}.0 lineend")
+                text = _diagnostic_buffer(owner).line(line)
             except EXPECTED_ERRORS:
                 return open_line
             if text.strip():
@@ -2528,25 +2375,37 @@ def _format_phone(owner: Any, value):
 
 def _find_phone_format_issue(owner: Any):
         try:
-            text = owner.text.get("1.0", "end-1c")
+            text = _diagnostic_buffer(owner).text
         except EXPECTED_ERRORS:
             return None
-        for idx, line_text in enumerate(text.splitlines(), start=1):
-            match = owner.PHONE_FIELD_PATTERN.search(line_text)
-            if not match:
-                continue
+        return owner._find_phone_format_issue_in_text(text)
+
+
+def _find_phone_format_issue_in_text(owner: Any, text):
+        """Text-only phone check; safe to run on a worker thread with a snapshot string."""
+        for idx, line_start, match, formatted in _phone_format_issues(owner, text):
+            line_text = _line_text_at(text, line_start)
+            start_col = match.start(1) - line_start
+            end_col = match.end(1) - line_start
+            before_line = line_text.strip()
+            after_line = line_text[:start_col] + formatted + line_text[end_col:]
+            return idx, start_col, end_col, before_line, after_line.strip()
+        return None
+
+
+def _phone_format_issues(owner: Any, text):
+        """(lineno, line_start, match, formatted) for every line whose phone value reformats to something else."""
+        validator = contact_value_validator(owner)
+        for idx, line_start, match in _first_field_match_per_line(text, owner.PHONE_FIELD_PATTERN):
             value = match.group(1)
             if not value:
                 continue
-            formatted = owner._format_phone(value)
+            formatted = validator.cached("phone", value, lambda value=value: owner._format_phone(value))
             if not formatted:
                 continue
             if value == formatted:
                 continue
-            before_line = line_text.strip()
-            after_line = line_text[: match.start(1)] + formatted + line_text[match.end(1) :]
-            return idx, match.start(1), match.end(1), before_line, after_line.strip()
-        return None
+            yield idx, line_start, match, formatted
 
 
 def _fix_missing_space_after_colon(owner: Any, line_text):
@@ -2558,9 +2417,14 @@ def _fix_missing_space_after_colon(owner: Any, line_text):
 def _find_json_spacing_issue(owner: Any):
         """Return first missing-space-after-colon style issue in JSON text."""
         try:
-            text = owner.text.get("1.0", "end-1c")
+            text = _diagnostic_buffer(owner).text
         except EXPECTED_ERRORS:
             return None
+        return owner._find_json_spacing_issue_in_text(text)
+
+
+def _find_json_spacing_issue_in_text(owner: Any, text):
+        """Text-only spacing check; safe to run on a worker thread with a snapshot string."""
         for line_no, line_text in enumerate(text.splitlines(), start=1):
             m = re.match(r'^(?P<head>\s*"[^"]+"\s*):(?P<tail>\S.*)$', line_text)
             if not m:
@@ -2579,15 +2443,27 @@ def _find_json_spacing_issue(owner: Any):
 
 def _find_missing_email_at(owner: Any):
         try:
-            text = owner.text.get("1.0", "end-1c")
+            text = _diagnostic_buffer(owner).text
         except EXPECTED_ERRORS:
             return None
-        lines = text.splitlines()
+        for idx, line_start, match, fixed in _missing_at_issues(owner, text):
+            line_text = _line_text_at(text, line_start)
+            start_col = match.start(2) - line_start
+            end_col = match.end(2) - line_start
+            before_line = line_text.strip()
+            after_line = line_text[:start_col] + fixed + line_text[end_col:]
+            return idx, start_col, end_col, before_line, after_line.strip()
+        return None
+
+
+def _missing_at_issues(owner: Any, text):
+        """(lineno, line_start, match, fixed) for every line whose email value lacks "@", in line order."""
+        if not _has_missing_at_candidate(text, owner.EMAIL_FIELD_PATTERN):
+            return
+        validator = contact_value_validator(owner)
+        matches = list(_first_field_match_per_line(text, owner.EMAIL_FIELD_PATTERN))
         domain_roots = set()
-        for line_text in lines:
-            m = owner.EMAIL_FIELD_PATTERN.search(line_text)
-            if not m:
-                continue
+        for _idx, _line_start, m in matches:
             val = m.group(2)
             if "@" not in val:
                 continue
@@ -2595,23 +2471,27 @@ def _find_missing_email_at(owner: Any):
             parts = domain.split(".")
             if len(parts) >= 2:
                 domain_roots.add(parts[-2])
-        for idx, line_text in enumerate(lines, start=1):
-            match = owner.EMAIL_FIELD_PATTERN.search(line_text)
-            if not match:
-                continue
+        roots = domain_roots.union(validator.known_roots)
+        roots_key = frozenset(roots)
+        for idx, line_start, match in matches:
             value = match.group(2)
             if not value or "@" in value:
                 continue
-            fixed = owner._fix_missing_at(value, domain_roots.union(owner.KNOWN_EMAIL_DOMAIN_ROOTS))
-            # Prefer exact known domain match if present in value.
-            for domain in sorted(owner.KNOWN_EMAIL_DOMAINS, key=len, reverse=True):
-                if domain in value:
-                    fixed = value.replace(domain, "@" + domain, 1)
-                    break
-            before_line = line_text.strip()
-            after_line = line_text[: match.start(2)] + fixed + line_text[match.end(2) :]
-            return idx, match.start(2), match.end(2), before_line, after_line.strip()
-        return None
+            fixed = validator.cached(
+                "missing_at",
+                (value, roots_key),
+                lambda value=value: _missing_at_fix(owner, validator, value, roots),
+            )
+            yield idx, line_start, match, fixed
+
+
+def _missing_at_fix(owner: Any, validator, value, domain_roots):
+        fixed = owner._fix_missing_at(value, domain_roots)
+        # Prefer exact known domain match if present in value.
+        domain = validator.longest_known_domain(value)
+        if domain is not None:
+            fixed = value.replace(domain, "@" + domain, 1)
+        return fixed
 
 
 def _path_targets_email(owner: Any, path):
@@ -2692,6 +2572,12 @@ def _find_invalid_email_in_value(owner: Any, base_path, value):
 
 
 def _suggest_email_for_malformed(owner: Any, value):
+        return contact_value_validator(owner).cached(
+            "suggestion", value, lambda: _email_suggestion_for_malformed(owner, value)
+        )
+
+
+def _email_suggestion_for_malformed(owner: Any, value):
         value = (value or "").strip()
         if "@" not in value or value.count("@") != 1:
             return "<name>@<domain.tld>"
@@ -2706,7 +2592,7 @@ def _suggest_email_for_malformed(owner: Any, value):
         if len(sld) < 2:
             best_prefix_fix = None
             best_prefix_len = -1
-            for root in sorted(owner.KNOWN_EMAIL_DOMAIN_ROOTS, key=len, reverse=True):
+            for root in contact_value_validator(owner).roots_by_length:
                 if not root.endswith(sld):
                     continue
                 missing_prefix = root[: len(root) - len(sld)] if sld else root
@@ -2717,7 +2603,7 @@ def _suggest_email_for_malformed(owner: Any, value):
                 cand_local = local[: len(local) - len(missing_prefix)]
                 if not cand_local:
                     continue
-                if not re.fullmatch(r"^[A-Za-z0-9._%+\-]+$", cand_local):
+                if not _EMAIL_LOCAL_RE.fullmatch(cand_local):
                     continue
                 cand_domain = f"{root}.{tld}"
                 if sub_prefix:
@@ -2731,7 +2617,7 @@ def _suggest_email_for_malformed(owner: Any, value):
                 return best_prefix_fix
 
         merged_token = local + sld
-        local_re = re.compile(r"^[A-Za-z0-9._%+\-]+$")
+        local_re = _EMAIL_LOCAL_RE
         best = None
         best_score = -10**9
         original_len = len(local)
@@ -2754,6 +2640,12 @@ def _suggest_email_for_malformed(owner: Any, value):
 
 
 def _validate_email_address(owner: Any, value):
+        issue = contact_value_validator(owner).cached("email", value, lambda: _email_address_issue(owner, value))
+        # Callers get their own dict so a cached verdict cannot be edited through them.
+        return dict(issue) if issue else issue
+
+
+def _email_address_issue(owner: Any, value):
         value = (value or "").strip()
         if not value:
             return None
@@ -2782,8 +2674,7 @@ def _validate_email_address(owner: Any, value):
             }
 
         local, domain = value.split("@", 1)
-        local_re = re.compile(r"^[A-Za-z0-9._%+\-]+$")
-        if not local or not domain or not local_re.fullmatch(local) or not owner._is_valid_email_domain(domain):
+        if not local or not domain or not _EMAIL_LOCAL_RE.fullmatch(local) or not owner._is_valid_email_domain(domain):
             return {
                 "message": "Invalid Entry: malformed email address.",
                 "log_msg": "Malformed email format",
@@ -2795,6 +2686,10 @@ def _validate_email_address(owner: Any, value):
 
 
 def _is_valid_email_domain(owner: Any, domain):
+        return contact_value_validator(owner).cached("domain", domain, lambda: _email_domain_is_valid(owner, domain))
+
+
+def _email_domain_is_valid(owner: Any, domain):
         if not domain or "." not in domain:
             return False
         parts = domain.split(".")
@@ -2806,39 +2701,39 @@ def _is_valid_email_domain(owner: Any, domain):
         tld = parts[-1]
         if len(tld) < 2 or not tld.isalpha():
             return False
-        label_re = re.compile(r"^[A-Za-z0-9-]+$")
         for part in parts:
             if not part:
                 return False
             if part.startswith("-") or part.endswith("-"):
                 return False
-            if not label_re.fullmatch(part):
+            if not _EMAIL_LABEL_RE.fullmatch(part):
                 return False
         return True
 
 
 def _find_invalid_email_format_issue(owner: Any):
         try:
-            text = owner.text.get("1.0", "end-1c")
+            text = _diagnostic_buffer(owner).text
         except EXPECTED_ERRORS:
             return None
-        for idx, line_text in enumerate(text.splitlines(), start=1):
-            match = owner.EMAIL_FIELD_PATTERN.search(line_text)
-            if not match:
-                continue
+        validator = contact_value_validator(owner)
+        for idx, line_start, match in _first_field_match_per_line(text, owner.EMAIL_FIELD_PATTERN):
             value = (match.group(2) or "").strip()
             if not value or "@" not in value:
                 continue
-            issue = owner._validate_email_address(value)
+            issue = validator.cached("email", value, lambda value=value: _email_address_issue(owner, value))
             if not issue:
                 continue
+            line_text = _line_text_at(text, line_start)
+            start_col = match.start(2) - line_start
+            end_col = match.end(2) - line_start
             before_line = line_text.strip()
             suggested = issue["suggested"]
-            after_line = line_text[: match.start(2)] + suggested + line_text[match.end(2) :]
+            after_line = line_text[:start_col] + suggested + line_text[end_col:]
             return (
                 idx,
-                match.start(2),
-                match.end(2),
+                start_col,
+                end_col,
                 before_line,
                 after_line.strip(),
                 issue["message"],
@@ -2948,29 +2843,7 @@ def _unclosed_quoted_value_invalid_tail_span(owner: Any, line_text):
 
 
 def _find_nearby_unclosed_quoted_value_invalid_tail_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if str(txt or "").strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            span = owner._unclosed_quoted_value_invalid_tail_span(txt)
-            if span:
-                return int(ln), txt, span
-        return None, None, None
+        return nearby_line_rule_match(owner, "unclosed_quoted_value_invalid_tail", lineno, lookback)
 
 
 def _comma_example_line(owner: Any, lineno):
@@ -2978,7 +2851,7 @@ def _comma_example_line(owner: Any, lineno):
             return "\"item1\",\n\"item2\""
         target_line = max(lineno - 1, 1)
         try:
-            line_text = owner.text.get(f"{target_line}.0", f"{target_line}.0 lineend").strip()
+            line_text = _diagnostic_buffer(owner).line(target_line).strip()
         except EXPECTED_ERRORS:
             line_text = ""
         if not line_text:
@@ -3025,6 +2898,7 @@ from core.domain_impl.json import json_diagnostics_core as json_colon_comma_serv
 from core.domain_impl.json import json_io_core as json_edit_flow_service
 from core.domain_impl.json import json_diagnostics_core as json_error_diag_service
 from core.domain_impl.json import json_view_core as json_error_highlight_render_service
+from core.domain_impl.json import json_view_core as json_view_render_service
 from core.domain_impl.json import json_diagnostics_core as json_nearby_line_service
 from core.domain_impl.json import json_diagnostics_core as json_open_symbol_service
 from core.domain_impl.json import json_diagnostics_core as json_parse_feedback_service
@@ -3034,6 +2908,15 @@ from core.domain_impl.json import json_diagnostics_core as json_scalar_tail_serv
 from core.domain_impl.json import json_diagnostics_core as json_top_level_close_service
 from core.domain_impl.json import json_diagnostics_core as json_validation_feedback_service
 import core.domain_impl.ui.tree_view_service as tree_view_service
+def _json_view_raw_text(owner: Any):
+        """Rendered-string snapshot text, falling back to a Text read when no snapshot is available."""
+        text = owner.text
+        snapshot = json_view_render_service.json_view_text_snapshot(owner, text)
+        if snapshot is not None:
+            return str(snapshot.get("text", ""))
+        return text.get("1.0", "end-1c")
+
+
 def _configure_json_lock_tags(owner: Any):
         palette = owner._json_lock_tag_palette()
         try:
@@ -3089,14 +2972,23 @@ def _set_json_text_editable(owner: Any, editable=True):
             return
 
 
-def _tag_json_locked_key_occurrences(owner: Any, key_name):
+def _json_line_range_indexes(line_range=None):
+        """Text search bounds for an inclusive (first, last) line range; whole buffer when None."""
+        if not line_range:
+            return "1.0", "end"
+        first_line, last_line = line_range
+        return f"{max(1, int(first_line))}.0", f"{max(1, int(last_line)) + 1}.0"
+
+
+def _tag_json_locked_key_occurrences(owner: Any, key_name, line_range=None):
         token = f'"{key_name}"'
         malformed_missing_close_quote = f'"{key_name}:'
         malformed_missing_open_quote = f'{key_name}"'
-        index = "1.0"
+        start_index, stop_index = _json_line_range_indexes(line_range)
+        index = start_index
         while True:
             try:
-                hit = owner.text.search(token, index, stopindex="end", nocase=True)
+                hit = owner.text.search(token, index, stopindex=stop_index, nocase=True)
             except EXPECTED_ERRORS:
                 hit = ""
             if not hit:
@@ -3110,10 +3002,10 @@ def _tag_json_locked_key_occurrences(owner: Any, key_name):
             index = end
         # Keep lock-label context alive while users fix half-typed key quotes.
         for malformed_token in (malformed_missing_close_quote, malformed_missing_open_quote):
-            index = "1.0"
+            index = start_index
             while True:
                 try:
-                    hit = owner.text.search(malformed_token, index, stopindex="end", nocase=True)
+                    hit = owner.text.search(malformed_token, index, stopindex=stop_index, nocase=True)
                 except EXPECTED_ERRORS:
                     hit = ""
                 if not hit:
@@ -3130,12 +3022,13 @@ def _tag_json_locked_key_occurrences(owner: Any, key_name):
                 index = end
 
 
-def _tag_json_xy_key_occurrences(owner: Any, key_name):
+def _tag_json_xy_key_occurrences(owner: Any, key_name, line_range=None):
         token = f'"{key_name}"'
-        index = "1.0"
+        start_index, stop_index = _json_line_range_indexes(line_range)
+        index = start_index
         while True:
             try:
-                hit = owner.text.search(token, index, stopindex="end", nocase=False)
+                hit = owner.text.search(token, index, stopindex=stop_index, nocase=False)
             except EXPECTED_ERRORS:
                 hit = ""
             if not hit:
@@ -3149,7 +3042,7 @@ def _tag_json_xy_key_occurrences(owner: Any, key_name):
             index = end
 
 
-def _should_batch_tag_locked_keys(owner: Any, key_names):
+def _should_batch_tag_locked_keys(owner: Any, key_names, raw=None):
         if not key_names:
             return False
         if len(tuple(key_names)) < 12:
@@ -3159,10 +3052,11 @@ def _should_batch_tag_locked_keys(owner: Any, key_names):
                 return False
         except EXPECTED_ERRORS:
             return False
-        try:
-            raw = owner.text.get("1.0", "end-1c")
-        except EXPECTED_ERRORS:
-            return False
+        if raw is None:
+            try:
+                raw = _json_view_raw_text(owner)
+            except EXPECTED_ERRORS:
+                return False
         if len(raw or "") < 4000:
             return False
         return True
@@ -3183,7 +3077,7 @@ def _tag_json_key_occurrences_batch(owner: Any, locked_key_names, xy_key_names=(
         if not locked_targets and not xy_targets:
             return
         try:
-            raw = owner.text.get("1.0", "end-1c")
+            raw = _json_view_raw_text(owner)
         except EXPECTED_ERRORS:
             return
         line_no = 1
@@ -3214,7 +3108,7 @@ def _tag_json_key_occurrences_batch(owner: Any, locked_key_names, xy_key_names=(
 
 def _tag_json_string_value_literals(owner: Any, line_limit=None):
         try:
-            raw = owner.text.get("1.0", "end-1c")
+            raw = _json_view_raw_text(owner)
         except EXPECTED_ERRORS:
             return
         line_no = 1
@@ -3244,7 +3138,7 @@ def _tag_json_string_value_literals(owner: Any, line_limit=None):
 
 def _tag_json_brace_tokens(owner: Any, line_limit=None):
         try:
-            raw = owner.text.get("1.0", "end-1c")
+            raw = _json_view_raw_text(owner)
         except EXPECTED_ERRORS:
             return
         line_no = 1
@@ -3280,7 +3174,7 @@ def _tag_json_brace_tokens(owner: Any, line_limit=None):
 
 def _tag_json_boolean_literals(owner: Any, line_limit=None):
         try:
-            raw = owner.text.get("1.0", "end-1c")
+            raw = _json_view_raw_text(owner)
         except EXPECTED_ERRORS:
             return
         line_no = 1
@@ -3319,7 +3213,7 @@ def _tag_json_boolean_literals(owner: Any, line_limit=None):
 
 def _tag_json_property_keys(owner: Any, line_limit=None):
         try:
-            raw = owner.text.get("1.0", "end-1c")
+            raw = _json_view_raw_text(owner)
         except EXPECTED_ERRORS:
             return
         line_no = 1
@@ -3344,6 +3238,145 @@ def _tag_json_property_keys(owner: Any, line_limit=None):
             line_no += 1
 
 
+# Strings (terminated, or running to end of line like the per-line toggle scan), braces and bool literals.
+_JSON_HIGHLIGHT_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*(?P<close>")?|[{}\[\]]|\b(?:true|false)\b')
+_JSON_HIGHLIGHT_KEY_COLON_RE = re.compile(r"[ \t\r\n]*:")
+# Tcl argument lists stay bounded on very large nodes; one call covers typical views.
+_JSON_HIGHLIGHT_MAX_INDEXES_PER_CALL = 40000
+
+
+def _lex_json_highlight_ranges(raw, *, line_limit=None, first_line=1, locked_key_names=(), xy_key_names=()):
+        """Tokenize rendered JSON once and return {tag: [start, end, start, end, ...]} index lists.
+
+        raw may be a slice of the view; first_line is the Text line number of its first line.
+        """
+        locked_targets = {
+            str(name or "").strip().casefold()
+            for name in tuple(locked_key_names or ())
+            if str(name or "").strip()
+        }
+        xy_targets = {
+            str(name or "").strip()
+            for name in tuple(xy_key_names or ())
+            if str(name or "").strip()
+        }
+        ranges = {
+            "json_brace_token": [],
+            "json_bracket_token": [],
+            "json_bool_true": [],
+            "json_bool_false": [],
+            "json_property_key": [],
+            "json_value_green": [],
+            "json_locked_key": [],
+            "json_xy_key": [],
+        }
+        brace_ranges = ranges["json_brace_token"]
+        bracket_ranges = ranges["json_bracket_token"]
+        key_ranges = ranges["json_property_key"]
+        value_ranges = ranges["json_value_green"]
+        max_lines = int(line_limit or 0)
+        finditer = _JSON_HIGHLIGHT_TOKEN_RE.finditer
+        key_colon = _JSON_HIGHLIGHT_KEY_COLON_RE.match
+        line_no = max(1, int(first_line or 1)) - 1
+        for line_text in str(raw or "").splitlines():
+            line_no += 1
+            if max_lines and line_no > max_lines:
+                break
+            for hit in finditer(line_text):
+                start_col = hit.start()
+                end_col = hit.end()
+                token = hit.group()
+                first = token[0]
+                if first == '"':
+                    start = f"{line_no}.{start_col}"
+                    end = f"{line_no}.{end_col}"
+                    terminated = hit.group("close") is not None
+                    if not terminated or key_colon(line_text, end_col) is None:
+                        if terminated:
+                            value_ranges.append(start)
+                            value_ranges.append(end)
+                        continue
+                    key_ranges.append(start)
+                    key_ranges.append(end)
+                    key_name = token[1:-1]
+                    if not key_name or ":" in key_name or '"' in key_name:
+                        continue
+                    if locked_targets and key_name.casefold() in locked_targets:
+                        ranges["json_locked_key"].extend((start, end))
+                    if key_name in xy_targets:
+                        ranges["json_xy_key"].extend((start, end))
+                elif first in "{}":
+                    brace_ranges.append(f"{line_no}.{start_col}")
+                    brace_ranges.append(f"{line_no}.{end_col}")
+                elif first in "[]":
+                    bracket_ranges.append(f"{line_no}.{start_col}")
+                    bracket_ranges.append(f"{line_no}.{end_col}")
+                else:
+                    tag_name = "json_bool_true" if token == "true" else "json_bool_false"
+                    ranges[tag_name].extend((f"{line_no}.{start_col}", f"{line_no}.{end_col}"))
+        return ranges
+
+
+def _apply_json_highlight_ranges(owner: Any, ranges):
+        text = getattr(owner, "text", None)
+        if text is None:
+            return
+        step = _JSON_HIGHLIGHT_MAX_INDEXES_PER_CALL
+        for tag_name, indexes in ranges.items():
+            for pos in range(0, len(indexes), step):
+                try:
+                    text.tag_add(tag_name, *indexes[pos:pos + step])
+                except EXPECTED_ERRORS:
+                    break
+
+
+def _tag_json_highlight_tokens(owner: Any, path, line_limit=None, line_range=None):
+        """Single-pass replacement for the brace/bool/key/locked/xy/dimension/value tag passes.
+
+        line_range=(first, last) lexes only those lines, sliced via the snapshot line-offset table.
+        """
+        text = getattr(owner, "text", None)
+        if text is None:
+            return
+        snapshot = json_view_render_service.json_view_text_snapshot(owner, text)
+        if snapshot is None:
+            return
+        raw = str(snapshot.get("text", ""))
+        use_path = list(path or [])
+        xy_keys = ("x", "y") if len(use_path) == 1 else ()
+        dimension_keys = ("width", "height")
+        locked_path = bool(highlight_label_service.is_locked_field_path(use_path))
+        locked_fields = tuple(highlight_label_service.locked_highlight_fields_for_path(use_path))
+        lex_locked = ()
+        lex_xy = dimension_keys
+        if not locked_path:
+            if owner._should_batch_tag_locked_keys(locked_fields, raw=raw):
+                lex_locked = locked_fields
+                lex_xy = xy_keys + dimension_keys
+            else:
+                # Small or error-overlaid views keep the lenient per-key search for half-typed quotes.
+                for coord_key in xy_keys:
+                    owner._tag_json_xy_key_occurrences(coord_key, line_range=line_range)
+                for field_name in locked_fields:
+                    owner._tag_json_locked_key_occurrences(field_name, line_range=line_range)
+        first_line = 1
+        if line_range:
+            line_starts = json_view_render_service.json_view_snapshot_line_starts(snapshot)
+            first_line = max(1, min(int(line_range[0]), len(line_starts)))
+            last_line = max(first_line, int(line_range[1]))
+            end_offset = line_starts[last_line] if last_line < len(line_starts) else len(raw)
+            raw = raw[line_starts[first_line - 1]:end_offset]
+            line_limit = None
+        ranges = _lex_json_highlight_ranges(
+            raw,
+            line_limit=line_limit,
+            first_line=first_line,
+            locked_key_names=lex_locked,
+            xy_key_names=lex_xy,
+        )
+        _apply_json_highlight_ranges(owner, ranges)
+
+
 def _json_literal_offsets_after_key(owner: Any, key_end_index, literal_token, lookahead_chars=120, ignore_case=False):
         text = getattr(owner, "text", None)
         token = str(literal_token or "")
@@ -3380,13 +3413,13 @@ def _json_literal_offsets_after_key(owner: Any, key_end_index, literal_token, lo
         return i, end
 
 
-def _tag_json_locked_value_occurrences(owner: Any, field_name, literal_value, ignore_case=False):
+def _tag_json_locked_value_occurrences(owner: Any, field_name, literal_value, ignore_case=False, line_range=None):
         key_token = json.dumps(str(field_name), ensure_ascii=False)
         value_token = json.dumps(literal_value, ensure_ascii=False)
-        index = "1.0"
+        index, stop_index = _json_line_range_indexes(line_range)
         while True:
             try:
-                hit = owner.text.search(key_token, index, stopindex="end", nocase=True)
+                hit = owner.text.search(key_token, index, stopindex=stop_index, nocase=True)
             except EXPECTED_ERRORS:
                 hit = ""
             if not hit:
@@ -3410,8 +3443,7 @@ def _tag_json_locked_value_occurrences(owner: Any, field_name, literal_value, ig
 def _apply_json_view_lock_state(owner: Any, path):
         owner._clear_json_lock_highlight()
         owner._set_json_text_editable(True)
-        owner._apply_json_view_key_highlights(path)
-        owner._apply_json_view_value_highlights(path)
+        json_view_render_service.start_json_view_highlights(owner, path)
 
 
 def _describe(owner: Any, value):
@@ -3500,7 +3532,7 @@ def _example_for_error(owner: Any, exc):
         line_text = ""
         if lineno:
             try:
-                line_text = owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend").strip()
+                line_text = _diagnostic_buffer(owner).line(lineno).strip()
             except EXPECTED_ERRORS:
                 line_text = ""
 
@@ -3587,28 +3619,7 @@ def _is_json_value_token_start(owner: Any, value_text):
 
 
 def _find_nearby_property_key_invalid_escape_line(owner: Any, lineno, lookback=2):
-        if not lineno:
-            return None, None
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                break
-            if txt.strip():
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_has_property_key_invalid_escape(txt):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "property_key_invalid_escape", lineno, lookback)
 
 
 def _line_needs_value_quotes(owner: Any, line_text):
@@ -3619,37 +3630,11 @@ def _line_needs_value_quotes(owner: Any, line_text):
 
 
 def _find_nearby_unquoted_value_line(owner: Any, lineno, lookback=3):
-        if not lineno:
-            return None, None
-        # Check current line first, then a few previous non-empty lines.
-        candidates = []
-        try:
-            candidates.append((lineno, owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend").strip()))
-        except EXPECTED_ERRORS:
-            pass
-        line = max(lineno - 1, 1)
-        scanned = 0
-        while line >= 1 and scanned < lookback:
-            try:
-                txt = owner.text.get(f"{line}.0", f"{line}.0 lineend").strip()
-            except EXPECTED_ERRORS:
-                break
-            if txt:
-                candidates.append((line, txt))
-                scanned += 1
-            line -= 1
-        for ln, txt in candidates:
-            if owner._line_needs_value_quotes(txt):
-                return ln, txt
-        return None, None
+        return nearby_line_rule_match(owner, "unquoted_value", lineno, lookback)
 
 
 def _find_nearby_boolean_literal_typo_line(owner: Any, lineno, lookback=3):
-        return json_diag_core.find_nearby_boolean_literal_typo_line(
-            owner._line_text,
-            lineno,
-            lookback=lookback,
-        )
+        return nearby_line_rule_match(owner, "boolean_literal_typo", lineno, lookback)
 
 
 def _is_wrong_list_open_for_object(owner: Any, prev_text, next_text):
@@ -3703,25 +3688,16 @@ def _find_wrong_object_open_line(owner: Any, lineno, lookback=3):
 
 
 def _expected_closer_before_position(owner: Any, target_line, target_col):
-        return json_diag_core.expected_closer_before_position(
-            owner._line_text,
-            target_line,
-            target_col,
-        )
-
-
-def _next_non_empty_line_number(owner: Any, start_line):
         try:
-            last_line = int(owner.text.index("end-1c").split(".")[0])
+            target_line = max(int(target_line), 1)
+            target_col = max(int(target_col), 0)
         except EXPECTED_ERRORS:
             return None
-        line = max(start_line + 1, 1)
-        while line <= last_line:
-            text = owner._line_text(line)
-            if text.strip():
-                return line
-            line += 1
-        return None
+        return _diagnostic_buffer(owner).expected_closer(target_line, target_col)
+
+
+def _next_non_empty_line_number(owner: Any, start_line):
+        return _diagnostic_buffer(owner).next_non_empty(max(start_line + 1, 1))
 
 
 def _format_suggestion(owner: Any, header, before, after, header_only=False):
@@ -3758,42 +3734,13 @@ def _suggestion_from_example(owner: Any, example, add_after=None, add_colon=Fals
 
 def _line_text(owner: Any, lineno):
         try:
-            return owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend")
+            return _diagnostic_buffer(owner).line(lineno)
         except EXPECTED_ERRORS:
             return ""
 
 
 def _unmatched_open_bracket_lines(owner: Any, open_bracket, close_bracket):
-        text = owner.text.get("1.0", "end-1c")
-        stack = []
-        line = 1
-        in_string = False
-        escape = False
-        for ch in text:
-            if ch == "\n":
-                line += 1
-                if in_string and not escape:
-                    # Keep string state; multiline strings are invalid JSON but
-                    # this preserves safer structural scanning behavior.
-                    pass
-                escape = False
-                continue
-            if in_string:
-                if escape:
-                    escape = False
-                elif ch == "\\":
-                    escape = True
-                elif ch == "\"":
-                    in_string = False
-                continue
-            if ch == "\"":
-                in_string = True
-                continue
-            if ch == open_bracket:
-                stack.append(line)
-            elif ch == close_bracket and stack:
-                stack.pop()
-        return stack
+        return _diagnostic_buffer(owner).unmatched_open_lines(open_bracket, close_bracket)
 
 
 def _last_unmatched_bracket_line(owner: Any, open_bracket, close_bracket):
@@ -3804,53 +3751,26 @@ def _last_unmatched_bracket_line(owner: Any, open_bracket, close_bracket):
 
 
 def _find_blank_line_before(owner: Any, start_line):
+        buffer = _diagnostic_buffer(owner)
         line = max(start_line - 1, 1)
         while line >= 1:
-            try:
-                text = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                return None
-            if text.strip() == "":
+            if buffer.line(line).strip() == "":
                 return line
             line -= 1
         return None
 
 
 def _closest_non_empty_line_before(owner: Any, start_line):
-        line = max(start_line - 1, 1)
-        while line >= 1:
-            try:
-                text = owner.text.get(f"{line}.0", f"{line}.0 lineend").strip()
-            except EXPECTED_ERRORS:
-                return None
-            if text:
-                return line
-            line -= 1
-        return None
+        return _diagnostic_buffer(owner).prev_non_empty(max(start_line - 1, 1))
 
 
 def _last_non_empty_line_number(owner: Any):
-        try:
-            line = int(owner.text.index("end-1c").split(".")[0])
-        except EXPECTED_ERRORS:
-            return None
-        while line >= 1:
-            try:
-                text = owner.text.get(f"{line}.0", f"{line}.0 lineend").strip()
-            except EXPECTED_ERRORS:
-                return None
-            if text:
-                return line
-            line -= 1
-        return None
+        buffer = _diagnostic_buffer(owner)
+        return buffer.prev_non_empty(buffer.line_count)
 
 
 def _first_non_ws_char(owner: Any):
-        try:
-            text = owner.text.get("1.0", "end-1c")
-        except EXPECTED_ERRORS:
-            return ""
-        for ch in text:
+        for ch in _diagnostic_buffer(owner).text:
             if ch == "\ufeff":
                 continue
             if ch.isspace():
@@ -3860,30 +3780,15 @@ def _first_non_ws_char(owner: Any):
 
 
 def _previous_non_empty_line(owner: Any, lineno):
-        line = max(lineno - 1, 1)
-        while line >= 1:
-            try:
-                text = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                return ""
-            if text.strip():
-                return text
-            line -= 1
-        return ""
+        buffer = _diagnostic_buffer(owner)
+        line = buffer.prev_non_empty(max(lineno - 1, 1))
+        return buffer.line(line) if line is not None else ""
 
 
 def _next_non_empty_line(owner: Any, lineno):
-        line = max(lineno, 1)
-        last_line = int(owner.text.index("end-1c").split(".")[0])
-        while line <= last_line:
-            try:
-                text = owner.text.get(f"{line}.0", f"{line}.0 lineend")
-            except EXPECTED_ERRORS:
-                return ""
-            if text.strip():
-                return text
-            line += 1
-        return ""
+        buffer = _diagnostic_buffer(owner)
+        line = buffer.next_non_empty(max(lineno, 1))
+        return buffer.line(line) if line is not None else ""
 
 
 def _close_before_list(owner: Any, lineno):
@@ -3920,7 +3825,7 @@ def _highlight_custom_range(owner: Any, line, start_col, end_col):
 
 def _find_value_span_in_editor(owner: Any, value, preferred_key=None):
         try:
-            text = owner.text.get("1.0", "end-1c")
+            text = _diagnostic_buffer(owner).text
         except EXPECTED_ERRORS:
             return None
         if not text or not value:
@@ -4123,7 +4028,7 @@ def _apply_json_error_highlight(owner: Any, exc, line, start_index, end_index, n
 
 
 def _highlight_json_error(owner: Any, exc):
-        return json_error_highlight_core.highlight_json_error(
+        return memoized_highlight_json_error(
             owner,
             exc,
             apply_highlight_fn=json_error_highlight_render_service.apply_json_error_highlight,
@@ -4303,4 +4208,1526 @@ def is_paste_allowed(owner: Any, *, expected_errors: tuple[type[BaseException],
             )
         )
 
+# --- Diagnostic buffer helpers ---
+"""Immutable line snapshot shared by every diagnostic helper while one parse error is formatted or highlighted."""
+
+import bisect
+import contextlib
+import itertools
+import re
+from typing import Any
+
+# Strings are skipped whole (a backslash escapes the next character on the same line); brackets are captured.
+_DIAGNOSTIC_BRACKET_RE = re.compile(r'"(?:[^"\\]+|\\.?)*"?|([{}\[\]])')
+# Same, but a trailing backslash escapes the first character of the next line (line breaks are never scanned).
+_EXPECTED_CLOSER_RE = re.compile(r'"(?:[^"\\]+|\\\n*.?)*"?|([{}\[\]])')
+_BRACKET_CLOSERS = {"{": "}", "[": "]"}
+
+
+class BracketIndex:
+    """One structural pass over the buffer: the expected closer after every bracket event, searchable by offset."""
+
+    __slots__ = ("offsets", "closers")
+
+    def __init__(self, text: str) -> None:
+        offsets = []
+        closers = []
+        stack = []
+        for match in _EXPECTED_CLOSER_RE.finditer(text):
+            bracket = match.group(1)
+            if bracket is None:
+                continue
+            if bracket in _BRACKET_CLOSERS:
+                stack.append(_BRACKET_CLOSERS[bracket])
+            elif stack and stack[-1] == bracket:
+                stack.pop()
+            else:
+                # A wrong or extra closer leaves the active container open.
+                continue
+            offsets.append(match.start())
+            closers.append(stack[-1] if stack else "")
+        self.offsets = offsets
+        self.closers = closers
+
+    def expected_closer(self, offset: int):
+        """Closer of the innermost open container before offset, or None at top level."""
+        index = bisect.bisect_left(self.offsets, offset) - 1
+        if index < 0:
+            return None
+        return self.closers[index] or None
+
+
+class DiagnosticBuffer:
+    """Editor text split once into lines, with line offsets, a non-empty-line index and bracket stacks."""
+
+    __slots__ = ("text", "lines", "line_starts", "non_empty", "nearby_sweeps", "_unmatched", "_brackets", "_closer_lines")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.lines = text.split("\n")
+        self.line_starts = list(itertools.accumulate((len(line) + 1 for line in self.lines[:-1]), initial=0))
+        self.non_empty = [lineno for lineno, line in enumerate(self.lines, 1) if line and not line.isspace()]
+        self.nearby_sweeps = {}
+        self._unmatched = None
+        self._brackets = None
+        self._closer_lines = None
+
+    @property
+    def line_count(self) -> int:
+        return len(self.lines)
+
+    def line(self, lineno) -> str:
+        """Text of a 1-based line; Tk clamps lines before the start to line 1 and past the end to ''."""
+        lineno = int(lineno)
+        if lineno > len(self.lines):
+            return ""
+        return self.lines[max(lineno, 1) - 1]
+
+    def line_of(self, offset: int) -> int:
+        return bisect.bisect_right(self.line_starts, offset)
+
+    def next_non_empty(self, lineno, last_line=None):
+        """First non-blank line >= lineno (and <= last_line), or None."""
+        index = bisect.bisect_left(self.non_empty, int(lineno))
+        if index >= len(self.non_empty):
+            return None
+        found = self.non_empty[index]
+        if last_line is not None and found > last_line:
+            return None
+        return found
+
+    def prev_non_empty(self, lineno):
+        """Last non-blank line <= lineno, or None."""
+        index = bisect.bisect_right(self.non_empty, int(lineno)) - 1
+        return self.non_empty[index] if index >= 0 else None
+
+    @property
+    def brackets(self) -> BracketIndex:
+        if self._brackets is None:
+            self._brackets = BracketIndex(self.text)
+        return self._brackets
+
+    def expected_closer(self, lineno: int, col: int):
+        """Expected closer before (lineno, col); columns past the line end cover the whole line."""
+        if lineno > len(self.lines):
+            return self.brackets.expected_closer(len(self.text))
+        line = self.lines[max(lineno, 1) - 1]
+        return self.brackets.expected_closer(self.line_starts[max(lineno, 1) - 1] + min(max(col, 0), len(line)))
+
+    def closer_lines_after(self, lineno: int):
+        """Lines after lineno whose first non-blank character is } or ]."""
+        if self._closer_lines is None:
+            self._closer_lines = [ln for ln in self.non_empty if self.lines[ln - 1].lstrip()[:1] in ("}", "]")]
+        lines = self._closer_lines
+        for index in range(bisect.bisect_right(lines, lineno), len(lines)):
+            yield lines[index]
+
+    def unmatched_open_lines(self, open_bracket: str, close_bracket: str) -> list:
+        """Lines of unmatched open brackets for one pair, outside strings; both pairs come from one scan."""
+        if self._unmatched is None:
+            stacks = {"{": [], "[": []}
+            closers = {"}": "{", "]": "["}
+            line_of = self.line_of
+            for match in _DIAGNOSTIC_BRACKET_RE.finditer(self.text):
+                bracket = match.group(1)
+                if bracket is None:
+                    continue
+                if bracket in stacks:
+                    stacks[bracket].append(line_of(match.start()))
+                elif stacks[closers[bracket]]:
+                    stacks[closers[bracket]].pop()
+            self._unmatched = stacks
+        stack = self._unmatched.get(open_bracket)
+        if stack is None or {"{": "}", "[": "]"}.get(open_bracket) != close_bracket:
+            return []
+        return list(stack)
+
+
+def _diagnostic_buffer(owner: Any):
+        """Buffer for the current parse failure: the pinned one inside a scope, else cached per snapshot text."""
+        active = getattr(owner, "_diagnostic_buffer_active", None)
+        if active is not None:
+            return active
+        try:
+            text = _json_view_raw_text(owner)
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+            return DiagnosticBuffer("")
+        cached = getattr(owner, "_diagnostic_buffer_cache", None)
+        if isinstance(cached, DiagnosticBuffer) and cached.text is text:
+            return cached
+        buffer = DiagnosticBuffer(str(text))
+        owner._diagnostic_buffer_cache = buffer
+        return buffer
+
+
+@contextlib.contextmanager
+def diagnostic_buffer_scope(owner: Any):
+        """Pin one buffer so nested helpers skip even the snapshot staleness check; nested scopes reuse it."""
+        if getattr(owner, "_diagnostic_buffer_active", None) is not None:
+            yield owner._diagnostic_buffer_active
+            return
+        buffer = _diagnostic_buffer(owner)
+        owner._diagnostic_buffer_active = buffer
+        try:
+            yield buffer
+        finally:
+            owner._diagnostic_buffer_active = None
+
+
+# --- Diagnostic memo helpers ---
+"""Small LRU of parse-error diagnostics keyed by buffer hash and error position, so repeated applies skip the rule cascade."""
+
+from collections import OrderedDict
+from typing import Any
+from core import json_error_diagnostics_core
+from core import json_error_highlight_core
+from core.domain_impl.json import json_view_core as json_error_highlight_render_service
+
+JSON_DIAGNOSTIC_MEMO_SIZE = 16
+
+
+class DiagnosticMemo:
+    """LRU of {"text", "message", "msg", "diag", "highlight"} payloads; each entry keeps the buffer it describes."""
+
+    def __init__(self, max_entries: int = JSON_DIAGNOSTIC_MEMO_SIZE) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.entries: "OrderedDict[tuple[Any, ...], dict[str, Any]]" = OrderedDict()
+
+    def get(self, key: tuple[Any, ...]) -> dict[str, Any] | None:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def update(self, key: tuple[Any, ...], **fields: Any) -> None:
+        entry = self.entries.setdefault(key, {})
+        entry.update(fields)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+def diagnostic_memo(owner: Any) -> DiagnosticMemo:
+        memo = getattr(owner, "_json_diagnostic_memo", None)
+        if not isinstance(memo, DiagnosticMemo):
+            memo = DiagnosticMemo()
+            owner._json_diagnostic_memo = memo
+        return memo
+
+
+def _diagnostic_memo_key(owner: Any, exc: Any):
+        """((buffer hash, length, error type, msg, pos), buffer); (None, None) when the buffer cannot be read."""
+        try:
+            text = _json_view_raw_text(owner)
+        except EXPECTED_ERRORS as read_exc:
+            _LOG.debug('expected_error', exc_info=read_exc)
+            return None, None
+        msg = getattr(exc, "msg", None)
+        if msg is None:
+            msg = str(exc)
+        # The snapshot string is reused until the next edit, so its hash is computed once per buffer.
+        return (hash(text), len(text), type(exc).__name__, msg, getattr(exc, "pos", None)), text
+
+
+def _diagnostic_memo_entry(owner: Any, key: Any, text: Any) -> dict[str, Any] | None:
+        """The memo entry for key, only when it was recorded for this exact buffer (hash and length can collide)."""
+        entry = diagnostic_memo(owner).get(key) if key is not None else None
+        if entry is None:
+            return None
+        stored = entry.get("text")
+        if stored is text or stored == text:
+            return entry
+        # A colliding buffer owns the key now; drop the old fields so update() cannot mix the two.
+        diagnostic_memo(owner).entries.pop(key, None)
+        return None
+
+
+def memoized_format_json_error(owner: Any, exc: Any):
+        key, text = _diagnostic_memo_key(owner, exc)
+        entry = _diagnostic_memo_entry(owner, key, text)
+        if entry is not None and "message" in entry:
+            owner._last_json_error_msg = entry["msg"]
+            owner._last_json_error_diag = entry["diag"]
+            return entry["message"]
+        with diagnostic_buffer_scope(owner):
+            message = json_error_diagnostics_core.format_json_error(owner, exc)
+        if key is not None:
+            diagnostic_memo(owner).update(
+                key,
+                text=text,
+                message=message,
+                msg=getattr(owner, "_last_json_error_msg", None),
+                diag=getattr(owner, "_last_json_error_diag", None),
+            )
+        return message
+
+
+def memoized_highlight_json_error(owner: Any, exc: Any, apply_highlight_fn: Any, log_error_fn: Any):
+        """Run the highlight decision once per key; later hits replay its recorded log/highlight calls for exc."""
+        key, text = _diagnostic_memo_key(owner, exc)
+        entry = _diagnostic_memo_entry(owner, key, text)
+        if entry is not None and "highlight" in entry:
+            owner._last_json_error_msg = getattr(exc, "msg", None)
+            for kind, args, kwargs in entry["highlight"]:
+                replay_fn = apply_highlight_fn if kind == "apply" else log_error_fn
+                replay_fn(owner, exc, *args, **kwargs)
+            return None
+        calls = []
+
+        def recording_apply(target, target_exc, *args, **kwargs):
+            calls.append(("apply", args, kwargs))
+            return apply_highlight_fn(target, target_exc, *args, **kwargs)
+
+        def recording_log(target, target_exc, *args, **kwargs):
+            calls.append(("log", args, kwargs))
+            return log_error_fn(target, target_exc, *args, **kwargs)
+
+        with diagnostic_buffer_scope(owner):
+            result = json_error_highlight_core.highlight_json_error(
+                owner,
+                exc,
+                apply_highlight_fn=recording_apply,
+                log_error_fn=recording_log,
+            )
+        if key is not None:
+            diagnostic_memo(owner).update(key, text=text, highlight=calls)
+        return result
+
+
+# --- Incremental parse helpers ---
+"""Container-level parse tree of the editor buffer; an edit re-parses only its smallest enclosing container."""
+
+import bisect
+import json
+import re
+import threading
+from typing import Any
+
+# Each match skips plain text and complete strings, then captures the next bracket, a stray quote or nothing at the end.
+_JSON_STRUCTURE_RE = re.compile(r'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*([{}\[\]"]?)')
+_JSON_CONTAINER_CLOSERS = {"{": "}", "[": "]"}
+_JSON_PLACEHOLDERS = {"{": "{}", "[": "[]"}
+_JSON_DIFF_CHUNK = 65536
+
+
+class _JsonSpanNode:
+    """One object/array span; rel is relative to the parent's start, error is (msg, rel pos) for its own text."""
+
+    __slots__ = ("parent", "rel", "length", "kind", "children", "starts", "error")
+
+    def __init__(self, kind: Any, rel: int, length: int = 0) -> None:
+        self.parent: Any = None
+        self.rel = rel
+        self.length = length
+        self.kind = kind
+        self.children: list[Any] = []
+        self.starts: list[int] = []
+        self.error: Any = None
+
+    def absolute_start(self) -> int:
+        start = 0
+        node = self
+        while node is not None:
+            start += node.rel
+            node = node.parent
+        return start
+
+    def set_children(self, children: list[Any]) -> None:
+        self.children = children
+        self.starts = [child.rel for child in children]
+        for child in children:
+            child.parent = self
+
+
+def _scan_json_containers(text: str, start: int, end: int) -> Any:
+    """Balanced container spans inside text[start:end] as top-level nodes (rel = absolute start), or None."""
+    roots: list[Any] = []
+    stack: list[Any] = []
+    match = _JSON_STRUCTURE_RE.match
+    pos = start
+    while True:
+        hit = match(text, pos, end)
+        token = hit.group(1)
+        if not token:
+            break
+        pos = hit.end()
+        if token == '"':
+            return None
+        if token in _JSON_CONTAINER_CLOSERS:
+            stack.append(_JsonSpanNode(token, pos - 1))
+            continue
+        if not stack or _JSON_CONTAINER_CLOSERS[stack[-1].kind] != token:
+            return None
+        node = stack.pop()
+        node.length = pos - node.rel
+        if stack:
+            stack[-1].children.append(node)
+        else:
+            roots.append(node)
+    if stack:
+        return None
+    # Children were collected with absolute starts; rebase each level onto its parent.
+    pending = [(node, node.rel) for node in roots]
+    while pending:
+        node, node_start = pending.pop()
+        if node.children:
+            for child in node.children:
+                pending.append((child, child.rel))
+                child.rel -= node_start
+            node.set_children(node.children)
+    return roots
+
+
+def _common_prefix_length(old: str, new: str) -> int:
+    limit = min(len(old), len(new))
+    pos = 0
+    while pos < limit:
+        step = min(_JSON_DIFF_CHUNK, limit - pos)
+        if old[pos:pos + step] == new[pos:pos + step]:
+            pos += step
+            continue
+        lo, hi = pos, pos + step
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if old[lo:mid] == new[lo:mid]:
+                lo = mid
+            else:
+                hi = mid
+        return lo if old[lo] != new[lo] else hi
+    return limit
+
+
+def _common_suffix_length(old: str, new: str, limit: int) -> int:
+    old_len, new_len = len(old), len(new)
+    size = 0
+    while size < limit:
+        step = min(_JSON_DIFF_CHUNK, limit - size)
+        if old[old_len - size - step:old_len - size] == new[new_len - size - step:new_len - size]:
+            size += step
+            continue
+        lo, hi = size, size + step
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if old[old_len - mid:old_len - lo] == new[new_len - mid:new_len - lo]:
+                lo = mid
+            else:
+                hi = mid
+        return lo if old[old_len - lo - 1] != new[new_len - lo - 1] else hi
+    return limit
+
+
+class IncrementalJsonParse:
+    """Keeps object/array spans of the last buffer and re-validates only the container an edit lands in.
+
+    update() returns the json.JSONDecodeError json.loads would raise for the text (same msg and
+    position), or None when the text parses.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.text: Any = None
+        self.root = _JsonSpanNode(None, 0)
+        self._error_nodes: set[Any] = set()
+        self.full_parses = 0
+        self.partial_parses = 0
+
+    def update(self, text: str) -> Any:
+        with self._lock:
+            old = self.text
+            if old is None or not self.root.children:
+                self._rebuild(text)
+                return self._document_error()
+            if old == text:
+                return self._document_error()
+            prefix = _common_prefix_length(old, text)
+            suffix = _common_suffix_length(old, text, min(len(old), len(text)) - prefix)
+            self.text = text
+            self._apply_edit(prefix, len(old) - suffix, len(text) - suffix)
+            return self._document_error()
+
+    def peek(self, text: str) -> tuple[bool, Any]:
+        """(True, error) when text is exactly the last buffer parsed; never re-parses."""
+        with self._lock:
+            if self.text is None or self.text != text:
+                return False, None
+            return True, self._document_error()
+
+    def _rebuild(self, text: str) -> None:
+        self.text = text
+        self.full_parses += 1
+        self._error_nodes.clear()
+        root = self.root = _JsonSpanNode(None, 0, len(text))
+        try:
+            json.loads(text)
+        except json.JSONDecodeError as exc:
+            # No span tree while invalid; the next edit re-parses the whole buffer again.
+            root.error = (exc.msg, exc.pos)
+            self._error_nodes.add(root)
+            return
+        roots = _scan_json_containers(text, 0, len(text))
+        if roots:
+            root.set_children(roots)
+
+    def _locate(self, start: int, end: int) -> tuple[Any, int]:
+        """Smallest container whose interior holds [start, end) without touching its brackets."""
+        node, base = self.root, 0
+        while node.children:
+            index = bisect.bisect_right(node.starts, start - base) - 1
+            if index < 0:
+                break
+            child = node.children[index]
+            child_start = base + child.rel
+            if not (child_start < start and end <= child_start + child.length - 1):
+                break
+            node, base = child, child_start
+        return node, base
+
+    def _apply_edit(self, start: int, old_end: int, new_end: int) -> None:
+        delta = new_end - old_end
+        node, base = self._locate(start, old_end)
+        self.partial_parses += 1
+        # Children touching the edited range are rescanned; the ones after it move with the text.
+        children = node.children
+        first = bisect.bisect_left([base + child.rel + child.length for child in children], start)
+        last = bisect.bisect_right(node.starts, old_end - base, lo=first)
+        for later in range(last, len(children)):
+            children[later].rel += delta
+            node.starts[later] += delta
+        # Shift every later sibling and ancestor end; node-relative errors after the edit move with the text.
+        current = node
+        while current is not None:
+            current.length += delta
+            if current.error is not None and current is not node and current.error[1] >= old_end - current.absolute_start():
+                current.error = (current.error[0], current.error[1] + delta)
+            parent = current.parent
+            if parent is not None:
+                index = bisect.bisect_left(parent.starts, current.rel)
+                for later in range(index + 1, len(parent.children)):
+                    parent.children[later].rel += delta
+                    parent.starts[later] += delta
+            current = parent
+        self._reparse(node, base, first, last)
+
+    def _reparse(self, node: Any, base: int, first: int, last: int) -> None:
+        """Rescan node's own text between the kept children around [first, last); escalate when unbalanced."""
+        text = self.text
+        children = node.children
+        lo = base + children[first - 1].rel + children[first - 1].length if first else base + (1 if node.kind else 0)
+        hi = base + children[last].rel if last < len(children) else base + node.length - (1 if node.kind else 0)
+        fresh = _scan_json_containers(text, lo, hi)
+        if fresh is None:
+            if node.parent is None:
+                self._rebuild(text)
+                return
+            parent = node.parent
+            index = bisect.bisect_left(parent.starts, node.rel)
+            self._reparse(parent, base - node.rel, index, index + 1)
+            return
+        for dropped in children[first:last]:
+            dropped.parent = None
+        for child in fresh:
+            child.rel -= base
+            self._validate_subtree(child, base + child.rel)
+        node.set_children(children[:first] + fresh + children[last:])
+        self._validate_own_text(node, base)
+
+    def _validate_subtree(self, node: Any, base: int) -> None:
+        try:
+            json.loads(self.text[base:base + node.length])
+            return
+        except json.JSONDecodeError:
+            pass
+        self._validate_own_text(node, base)
+        for child in node.children:
+            self._validate_subtree(child, base + child.rel)
+
+    def _validate_own_text(self, node: Any, base: int) -> None:
+        """Parse node with each child swapped for an empty container of the same kind."""
+        text = self.text
+        pieces = []
+        offsets = []
+        pos = base
+        shrink = 0
+        for child in node.children:
+            child_start = base + child.rel
+            pieces.append(text[pos:child_start])
+            placeholder = _JSON_PLACEHOLDERS[child.kind]
+            offsets.append((child_start - base - shrink, shrink))
+            pieces.append(placeholder)
+            shrink += child.length - len(placeholder)
+            pos = child_start + child.length
+        pieces.append(text[pos:base + node.length])
+        node.error = None
+        self._error_nodes.discard(node)
+        try:
+            json.loads("".join(pieces))
+            return
+        except json.JSONDecodeError as exc:
+            message, reduced_pos = exc.msg, exc.pos
+        index = bisect.bisect_right(offsets, (reduced_pos, float("inf"))) - 1
+        if index >= 0:
+            reduced_start, before = offsets[index]
+            placeholder_len = len(_JSON_PLACEHOLDERS[node.children[index].kind])
+            if reduced_pos >= reduced_start + placeholder_len:
+                reduced_pos += before + node.children[index].length - placeholder_len
+            else:
+                reduced_pos += before
+        node.error = (message, reduced_pos)
+        self._error_nodes.add(node)
+
+    def _document_error(self) -> Any:
+        best = None
+        for node in list(self._error_nodes):
+            anchor = node
+            while anchor.parent is not None:
+                anchor = anchor.parent
+            if anchor is not self.root or node.error is None:
+                self._error_nodes.discard(node)
+                continue
+            pos = node.absolute_start() + node.error[1]
+            if best is None or pos < best[1]:
+                best = (node.error[0], pos)
+        if best is None:
+            return None
+        return json.JSONDecodeError(best[0], self.text, best[1])
+
+
+def incremental_json_parse_error(owner: Any, raw):
+        """json.loads-equivalent error for raw (None when valid), reusing the previous buffer's span tree."""
+        parser = getattr(owner, "_json_incremental_parse", None)
+        if not isinstance(parser, IncrementalJsonParse):
+            parser = IncrementalJsonParse()
+            owner._json_incremental_parse = parser
+        return parser.update(str(raw or ""))
+
+
+def known_incremental_json_parse_error(owner: Any, raw):
+        """(True, error) when the live parser already holds exactly raw, so callers can skip json.loads on failure."""
+        parser = getattr(owner, "_json_incremental_parse", None)
+        if not isinstance(parser, IncrementalJsonParse):
+            return False, None
+        return parser.peek(str(raw or ""))
+
+
+# --- Contact value validation helpers ---
+"""Email/phone verdicts cached per value, known-domain lookup by one regex, and batch APIs for node and save validators."""
+
+import re
+import threading
+from collections import OrderedDict
+
+CONTACT_VALUE_CACHE_SIZE = 8192
+_CONTACT_CACHE_MISS = object()
+_NO_KNOWN_EMAIL_NAMES: frozenset[str] = frozenset()
+_EMAIL_LOCAL_RE = re.compile(r"^[A-Za-z0-9._%+\-]+$")
+_EMAIL_LABEL_RE = re.compile(r"^[A-Za-z0-9-]+$")
+# Line-safe field patterns keyed by the owner's pattern object.
+_LINE_SAFE_FIELD_PATTERNS: dict[Any, Any] = {}
+
+
+class ContactValueValidator:
+    """Per-value email/phone verdict LRUs for one known-domain set, shared by the node-level and whole-save validators."""
+
+    def __init__(self, known_domains=(), known_roots=(), maxsize=CONTACT_VALUE_CACHE_SIZE):
+        self.source = (id(known_domains), len(known_domains or ()), id(known_roots), len(known_roots or ()))
+        self.known_roots = known_roots
+        # Sorted once from the owner's own sets so equal-length ties keep the old iteration order.
+        self.domains_by_length = tuple(sorted(known_domains or (), key=len, reverse=True))
+        self.roots_by_length = tuple(sorted(known_roots or (), key=len, reverse=True))
+        self._domain_rank = {domain: rank for rank, domain in enumerate(self.domains_by_length)}
+        # Lookahead alternation reports every known domain occurring in a value in a single pass.
+        self._domain_re = (
+            re.compile("(?=(" + "|".join(re.escape(domain) for domain in self.domains_by_length) + "))")
+            if self.domains_by_length
+            else None
+        )
+        self.maxsize = max(1, int(maxsize))
+        self._caches: dict[str, OrderedDict] = {}
+        # Lint and auto-apply workers share these LRUs with the Tk thread.
+        self._lock = threading.Lock()
+
+    def matches(self, known_domains, known_roots):
+        return self.source == (id(known_domains), len(known_domains or ()), id(known_roots), len(known_roots or ()))
+
+    def cached(self, kind, key, compute):
+        with self._lock:
+            cache = self._caches.get(kind)
+            if cache is None:
+                cache = self._caches[kind] = OrderedDict()
+            value = cache.get(key, _CONTACT_CACHE_MISS)
+            if value is not _CONTACT_CACHE_MISS:
+                cache.move_to_end(key)
+                return value
+        value = compute()
+        with self._lock:
+            cache[key] = value
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+        return value
+
+    def longest_known_domain(self, value):
+        """The longest known domain found anywhere in value (the old sorted substring loop), or None."""
+        if self._domain_re is None:
+            return None
+        found = {match.group(1) for match in self._domain_re.finditer(value)}
+        if not found:
+            return None
+        return min(found, key=self._domain_rank.__getitem__)
+
+    def clear(self):
+        with self._lock:
+            self._caches.clear()
+
+
+def contact_value_validator(owner: Any) -> ContactValueValidator:
+        # Keep the owner's own set objects (even when empty): matches() compares them by identity and size.
+        domains = getattr(owner, "KNOWN_EMAIL_DOMAINS", None)
+        domains = _NO_KNOWN_EMAIL_NAMES if domains is None else domains
+        roots = getattr(owner, "KNOWN_EMAIL_DOMAIN_ROOTS", None)
+        roots = _NO_KNOWN_EMAIL_NAMES if roots is None else roots
+        validator = getattr(owner, "_contact_value_validator", None)
+        if not isinstance(validator, ContactValueValidator) or not validator.matches(domains, roots):
+            validator = ContactValueValidator(domains, roots)
+            owner._contact_value_validator = validator
+        return validator
+
+
+def validate_email_values(owner: Any, values) -> dict[str, Any]:
+        """{value: issue dict or None} for a batch of email values; each distinct value is validated once and cached."""
+        validator = contact_value_validator(owner)
+        verdicts = {}
+        for value in values:
+            if isinstance(value, str) and value not in verdicts:
+                issue = validator.cached("email", value, lambda value=value: _email_address_issue(owner, value))
+                verdicts[value] = dict(issue) if issue else issue
+        return verdicts
+
+
+def format_phone_values(owner: Any, values) -> dict[str, Any]:
+        """{value: formatted phone or None} for a batch of phone values."""
+        validator = contact_value_validator(owner)
+        formatted = {}
+        for value in values:
+            if isinstance(value, str) and value not in formatted:
+                formatted[value] = validator.cached("phone", value, lambda value=value: owner._format_phone(value))
+        return formatted
+
+
+def _line_safe_field_pattern(pattern):
+        # The same field regex unable to cross a newline, so one finditer over the buffer equals a search per line.
+        compiled = _LINE_SAFE_FIELD_PATTERNS.get(pattern)
+        if compiled is None:
+            source = pattern.pattern.replace(r"\s", r"[^\S\n]").replace('[^"]', '[^"\\n]')
+            compiled = re.compile(source, pattern.flags)
+            _LINE_SAFE_FIELD_PATTERNS[pattern] = compiled
+        return compiled
+
+
+def _first_field_match_per_line(text, pattern):
+        """(lineno, line_start, match) for the first match on each line, from one regex pass over text."""
+        lineno = 1
+        scanned = 0
+        last_lineno = 0
+        for match in _line_safe_field_pattern(pattern).finditer(text):
+            start = match.start()
+            lineno += text.count("\n", scanned, start)
+            scanned = start
+            if lineno == last_lineno:
+                continue
+            last_lineno = lineno
+            yield lineno, text.rfind("\n", 0, start) + 1, match
+
+
+def _has_missing_at_candidate(text, pattern):
+        """False when no line's first field match holds a non-empty value without "@" (the clean-buffer fast path)."""
+        line_safe = _line_safe_field_pattern(pattern)
+        candidates = _LINE_SAFE_FIELD_PATTERNS.get((pattern, "missing_at"))
+        if candidates is None:
+            source = line_safe.pattern
+            value_group = '"([^"\\n]*)"'
+            # Only the stock field shape can be narrowed; anything else takes the full per-line scan.
+            narrowed = source.replace(value_group, '"([^"@\\n]+)"') if source.endswith(value_group) else source
+            candidates = _LINE_SAFE_FIELD_PATTERNS[(pattern, "missing_at")] = re.compile(narrowed, line_safe.flags)
+        for match in candidates.finditer(text):
+            first = line_safe.search(text, text.rfind("\n", 0, match.start()) + 1)
+            if first is not None and first.start() == match.start():
+                return True
+        return False
+
+
+def _line_text_at(text, line_start):
+        line_end = text.find("\n", line_start)
+        return text[line_start : len(text) if line_end < 0 else line_end]
+
+
+# --- Whole-save validation helpers ---
+"""Validate save: email, phone and lock checks over all of owner.data in worker processes, streamed to a results panel."""
+
+import copy
+import functools
+import os
+import pickle
+import queue
+import types
+from core.domain_impl.json import json_io_core as document_io_service
+import core.domain_impl.support.highlight_label_service as save_lock_policy_service
+
+SAVE_VALIDATION_POLL_MS = 40
+SAVE_VALIDATION_CHUNK_ITEMS = 2000
+SAVE_VALIDATION_MAX_FINDINGS_PER_JOB = 2000
+SAVE_VALIDATION_EMAIL_PLACEHOLDER = "<name>@<domain.tld>"
+_SAVE_VALIDATION_MISSING = object()
+# Worker-process cache of the on-disk save, so lock checks re-read it once per process, not once per category.
+_SAVED_DOCUMENT_CACHE: dict[str, Any] = {}
+_SAVE_VALIDATION_OWNERS: dict[Any, Any] = {}
+
+
+class SaveValidationOwner:
+    """Tk-free editor stand-in for worker processes: `owner._name(...)` resolves to this module's `_name(owner, ...)`."""
+
+    def __init__(self, known_email_domains=(), known_email_domain_roots=()):
+        self.KNOWN_EMAIL_DOMAINS = set(known_email_domains or ())
+        self.KNOWN_EMAIL_DOMAIN_ROOTS = set(known_email_domain_roots or ())
+
+    def __getattr__(self, name):
+        fn = globals().get(name) if name.startswith("_") and not name.startswith("__") else None
+        if not isinstance(fn, types.FunctionType):
+            raise AttributeError(name)
+        bound = functools.partial(fn, self)
+        self.__dict__[name] = bound
+        return bound
+
+
+def _save_validation_finding(path, rule, value, suggested, message):
+        fixable = suggested is not None and suggested != value and suggested != SAVE_VALIDATION_EMAIL_PLACEHOLDER
+        return {
+            "path": list(path),
+            "rule": str(rule),
+            "value": value,
+            "suggested": suggested,
+            "message": str(message),
+            "fixable": bool(fixable),
+        }
+
+
+def scan_save_values(owner: Any, node, base_path, max_findings=SAVE_VALIDATION_MAX_FINDINGS_PER_JOB):
+        """Email and phone findings for every string leaf under node."""
+        return _scan_save_value_roots(owner, [(list(base_path), node)], max_findings)
+
+
+def _scan_save_value_roots(owner: Any, roots, max_findings):
+        """Findings for several (path, node) roots in order: one walk, then one batch verdict per value kind."""
+        candidates = []
+        stack = list(reversed(roots))
+        while stack:
+            path, value = stack.pop()
+            if isinstance(value, dict):
+                for key, child in reversed(list(value.items())):
+                    stack.append((path + [key], child))
+                continue
+            if isinstance(value, list):
+                for idx in range(len(value) - 1, -1, -1):
+                    stack.append((path + [idx], value[idx]))
+                continue
+            if not isinstance(value, str) or not path:
+                continue
+            is_phone = path[-1] == "phone" and bool(value)
+            is_email = owner._path_targets_email(path) and owner._should_validate_email_path_value(path, value)
+            if is_phone or is_email:
+                candidates.append((path, value, is_phone, is_email))
+        phones = format_phone_values(owner, [value for _path, value, is_phone, _is_email in candidates if is_phone])
+        emails = validate_email_values(owner, [value for _path, value, _is_phone, is_email in candidates if is_email])
+        findings = []
+        limit = max(1, int(max_findings))
+        for path, value, is_phone, is_email in candidates:
+            if len(findings) >= limit:
+                break
+            formatted = phones.get(value) if is_phone else None
+            if formatted and formatted != value:
+                findings.append(
+                    _save_validation_finding(path, "phone_format", value, formatted, "Phone number should be formatted as 123-456-7890.")
+                )
+            issue = emails.get(value) if is_email else None
+            if issue:
+                findings.append(
+                    _save_validation_finding(path, issue["note"], value, issue["suggested"], issue["message"])
+                )
+        return findings[:limit]
+
+
+def _saved_document(save_path):
+        try:
+            stamp = os.stat(save_path).st_mtime_ns
+        except OSError:
+            return None
+        cached = _SAVED_DOCUMENT_CACHE.get(save_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        try:
+            data = document_io_service.load_document(save_path)
+        except (OSError, UnicodeDecodeError, ValueError, TypeError):
+            return None
+        _SAVED_DOCUMENT_CACHE.clear()
+        _SAVED_DOCUMENT_CACHE[save_path] = (stamp, data)
+        return data
+
+
+def scan_locked_category(root_key, value, save_path):
+        """Locked fields of a root category that no longer match the save on disk.
+
+        Report-only: locks only label fields (edits to them are allowed), so a batch fix must never revert them."""
+        if not save_path or save_lock_policy_service.lock_policy_for_path([root_key]) is None:
+            return []
+        saved = _saved_document(str(save_path))
+        if not isinstance(saved, dict):
+            return []
+        findings = []
+        for drift in save_lock_policy_service.find_locked_category_drift(root_key, saved.get(root_key), value):
+            current = drift["value"] if drift["found"] else _SAVE_VALIDATION_MISSING
+            if drift["saved_found"]:
+                finding = _save_validation_finding(
+                    drift["path"], "locked_field", current, drift["saved_value"], f"`{drift['field']}` is locked and differs from the saved file."
+                )
+            else:
+                finding = _save_validation_finding(
+                    drift["path"], "locked_field", current, None, f"`{drift['field']}` is locked and was not in the saved file."
+                )
+            if current is _SAVE_VALIDATION_MISSING:
+                finding["value"] = None
+                finding["missing"] = True
+            finding["fixable"] = False
+            findings.append(finding)
+        return findings
+
+
+def scan_save_validation_job(job, constants, save_path=None):
+        """Worker entry point: validate one root category (or one slice of a large root list) without touching Tk."""
+        if isinstance(job, bytes):
+            job = pickle.loads(job)
+        root_key, offset, value = job
+        # One owner per worker process and domain set, so verdict caches carry across categories.
+        owner = _SAVE_VALIDATION_OWNERS.get(constants)
+        if owner is None:
+            owner = _SAVE_VALIDATION_OWNERS[constants] = SaveValidationOwner(*constants)
+        if offset is None:
+            findings = scan_locked_category(root_key, value, save_path) if isinstance(value, dict) else []
+            findings.extend(scan_save_values(owner, value, [root_key]))
+        else:
+            roots = [([root_key, idx], item) for idx, item in enumerate(value, start=offset)]
+            findings = _scan_save_value_roots(owner, roots, SAVE_VALIDATION_MAX_FINDINGS_PER_JOB)
+        return {"root": str(root_key), "findings": findings, "error": ""}
+
+
+def split_save_validation_jobs(data, chunk_items=SAVE_VALIDATION_CHUNK_ITEMS):
+        """(root_key, offset, value) jobs: one per root category, with long root lists sliced so the pool stays balanced."""
+        if not isinstance(data, dict):
+            return [("", None, data)]
+        jobs = []
+        size = max(1, int(chunk_items))
+        for root_key, value in data.items():
+            if isinstance(value, list) and len(value) > size:
+                for start in range(0, len(value), size):
+                    jobs.append((root_key, start, value[start:start + size]))
+                continue
+            jobs.append((root_key, None, value))
+        return jobs
+
+
+def serialize_save_validation_job(job):
+        """Pickle a job on the calling thread, so the worker sees owner.data exactly as it was at submit time."""
+        return pickle.dumps(job, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def start_save_validation(owner: Any, *, executor_factory: Any, cpu_count: int | None = None) -> int:
+        """Submit the whole save to a process pool and schedule UI-thread polling; returns request id."""
+        cancel_save_validation(owner)
+        jobs = split_save_validation_jobs(getattr(owner, "data", None))
+        request_id = int(getattr(owner, "_save_validation_request_seq", 0) or 0) + 1
+        owner._save_validation_request_seq = request_id
+        result_queue: queue.SimpleQueue = queue.SimpleQueue()
+        state: dict[str, Any] = {
+            "request_id": request_id,
+            "total": len(jobs),
+            "finished": 0,
+            "findings": 0,
+            "cancelled": False,
+            "executor": None,
+            "futures": [],
+            "queue": result_queue,
+        }
+        owner._save_validation_state = state
+        if not jobs:
+            return request_id
+        constants = (
+            tuple(getattr(owner, "KNOWN_EMAIL_DOMAINS", ()) or ()),
+            tuple(getattr(owner, "KNOWN_EMAIL_DOMAIN_ROOTS", ()) or ()),
+        )
+        save_path = str(getattr(owner, "path", "") or "") or None
+        workers = max(1, min(len(jobs), int(cpu_count or os.cpu_count() or 1)))
+        executor = executor_factory(max_workers=workers)
+        state["executor"] = executor
+
+        def _forward(future: Any, root_key: Any) -> None:
+            if future.cancelled():
+                return
+            try:
+                packet = dict(future.result())
+            except Exception as exc:  # noqa: BLE001 - worker failures become per-category error rows
+                packet = {"root": str(root_key), "findings": [], "error": str(exc)}
+            packet["request_id"] = request_id
+            result_queue.put(packet)
+
+        for job in jobs:
+            # The pool pickles arguments later on its feeder thread, racing UI edits to owner.data;
+            # serializing here pins each job to the data as of this call.
+            payload = serialize_save_validation_job(job)
+            future = executor.submit(scan_save_validation_job, payload, constants, save_path)
+            future.add_done_callback(lambda fut, root_key=job[0]: _forward(fut, root_key))
+            state["futures"].append(future)
+        schedule_save_validation_poll(owner, request_id)
+        return request_id
+
+
+def schedule_save_validation_poll(owner: Any, request_id: int) -> None:
+        root = getattr(owner, "root", None)
+        if root is None:
+            return
+        try:
+            owner._save_validation_after_id = root.after(
+                SAVE_VALIDATION_POLL_MS,
+                lambda rid=request_id: poll_save_validation(owner, rid),
+            )
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+            owner._save_validation_after_id = None
+
+
+def poll_save_validation(owner: Any, request_id: int) -> None:
+        """Drain finished category packets on the UI thread and hand each batch to the results panel."""
+        owner._save_validation_after_id = None
+        state = getattr(owner, "_save_validation_state", None)
+        if not isinstance(state, dict) or int(state.get("request_id", 0) or 0) != int(request_id):
+            return
+        if bool(state.get("cancelled", False)):
+            return
+        result_queue = state.get("queue")
+        while isinstance(result_queue, queue.SimpleQueue):
+            try:
+                packet = result_queue.get_nowait()
+            except queue.Empty:
+                break
+            if not isinstance(packet, dict) or int(packet.get("request_id", 0) or 0) != int(request_id):
+                continue
+            state["finished"] = int(state.get("finished", 0)) + 1
+            findings = list(packet.get("findings") or [])
+            state["findings"] = int(state.get("findings", 0)) + len(findings)
+            on_rows = getattr(owner, "_on_save_validation_rows", None)
+            if callable(on_rows) and (findings or packet.get("error")):
+                on_rows(findings, error_root=str(packet.get("root", "") or "") if packet.get("error") else "", error_text=str(packet.get("error") or ""))
+        done = int(state.get("finished", 0)) >= int(state.get("total", 0))
+        on_progress = getattr(owner, "_on_save_validation_progress", None)
+        if callable(on_progress):
+            on_progress(int(state.get("finished", 0)), int(state.get("total", 0)), int(state.get("findings", 0)), done)
+        if done:
+            _shutdown_save_validation_executor(state)
+            return
+        schedule_save_validation_poll(owner, request_id)
+
+
+def _shutdown_save_validation_executor(state: dict[str, Any]) -> None:
+        executor = state.get("executor")
+        state["executor"] = None
+        if executor is None:
+            return
+        try:
+            executor.shutdown(wait=False, cancel_futures=True)
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+
+
+def cancel_save_validation(owner: Any) -> bool:
+        """Cancel a running validation; categories already in a worker finish but their findings are dropped."""
+        state = getattr(owner, "_save_validation_state", None)
+        after_id = getattr(owner, "_save_validation_after_id", None)
+        owner._save_validation_after_id = None
+        root = getattr(owner, "root", None)
+        if after_id is not None and root is not None:
+            try:
+                root.after_cancel(after_id)
+            except EXPECTED_ERRORS as exc:
+                _LOG.debug('expected_error', exc_info=exc)
+        if not isinstance(state, dict):
+            return False
+        was_running = int(state.get("finished", 0)) < int(state.get("total", 0)) and not bool(state.get("cancelled", False))
+        state["cancelled"] = True
+        for future in list(state.get("futures") or []):
+            try:
+                future.cancel()
+            except EXPECTED_ERRORS as exc:
+                _LOG.debug('expected_error', exc_info=exc)
+        _shutdown_save_validation_executor(state)
+        return was_running
+
+
+def apply_save_validation_fixes(owner: Any, findings, applied_paths: list | None = None) -> tuple[int, int]:
+        """Write each fixable finding's suggestion back into owner.data; returns (applied, stale) counts.
+
+        A finding is stale when its value changed after the scan; stale rows are skipped, never overwritten.
+        Paths that were written are appended to applied_paths when given."""
+        applied = 0
+        stale = 0
+        for finding in findings:
+            if not isinstance(finding, dict) or not finding.get("fixable"):
+                continue
+            path = list(finding.get("path") or [])
+            try:
+                current = owner._get_value(path)
+            except (KeyError, IndexError, TypeError):
+                current = _SAVE_VALIDATION_MISSING
+            expected = _SAVE_VALIDATION_MISSING if finding.get("missing") else finding.get("value")
+            if current is not expected and current != expected:
+                stale += 1
+                continue
+            try:
+                owner._set_value(path, copy.deepcopy(finding.get("suggested")))
+            except (KeyError, IndexError, TypeError) as exc:
+                _LOG.debug('expected_error', exc_info=exc)
+                stale += 1
+                continue
+            applied += 1
+            if applied_paths is not None:
+                applied_paths.append(path)
+        return applied, stale
+
+
+def refresh_save_validation_tree(owner: Any, paths, *, expected_errors: Any) -> None:
+        """Repopulate the loaded parent and grandparent items of fixed paths, so value-built row labels update."""
+        tree_widget = getattr(owner, "tree", None)
+        if tree_widget is None or not paths:
+            return
+        loaded = {}
+        for item_id, item_path in list(owner.item_to_path.items()):
+            if isinstance(item_path, list):
+                loaded[tuple(item_path)] = item_id
+        targets = set()
+        for path in paths:
+            # Row labels (names, emails) are built when the list holding the row is populated.
+            for depth in (2, 1):
+                ancestor = tuple(path[:-depth]) if len(path) > depth else None
+                if ancestor and ancestor in loaded:
+                    targets.add(ancestor)
+                    break
+        # An ancestor repopulated here rebuilds its descendants too, so skip targets nested inside another.
+        targets = [target for target in targets if not any(target[:len(other)] == other and target != other for other in targets)]
+        if not targets:
+            return
+        try:
+            focus_path = owner.item_to_path.get(tree_widget.focus())
+        except expected_errors:
+            focus_path = None
+        for target in sorted(targets, key=len):
+            item_id = loaded[target]
+            try:
+                if tree_widget.exists(item_id):
+                    owner._populate_children(item_id)
+            except expected_errors:
+                continue
+        if not isinstance(focus_path, list):
+            return
+        try:
+            item_id = owner._ensure_tree_item_for_path(list(focus_path))
+            if item_id is not None and tree_widget.focus() != item_id:
+                owner._open_to_item(item_id)
+                tree_widget.focus(item_id)
+                tree_widget.selection_set(item_id)
+        except expected_errors:
+            pass
+
+
+def _save_validation_cell(value):
+        if value is None:
+            return ""
+        text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+        text = " ".join(text.split())
+        return text if len(text) <= 80 else text[:77] + "..."
+
+
+def validate_save(owner: Any, *, executor_factory: Any, expected_errors: Any) -> None:
+        """Open the results panel and validate every root category of the loaded save in worker processes."""
+        if getattr(owner, "data", None) is None:
+            owner.set_status("Validate save: open a save first")
+            return
+        owner._build_save_validation_window()
+        results = getattr(owner, "_save_validation_results", None)
+        if results is not None:
+            try:
+                results.delete(*results.get_children(""))
+            except expected_errors:
+                pass
+        owner._save_validation_findings = {}
+        start_save_validation(owner, executor_factory=executor_factory)
+        state = getattr(owner, "_save_validation_state", None) or {}
+        update_save_validation_progress(owner, 0, int(state.get("total", 0) or 0), 0, not state.get("total"))
+
+
+def append_save_validation_rows(owner: Any, findings, *, error_root: str = "", error_text: str = "") -> None:
+        results = getattr(owner, "_save_validation_results", None)
+        if results is None:
+            return
+        rows = getattr(owner, "_save_validation_findings", None)
+        if not isinstance(rows, dict):
+            rows = {}
+            owner._save_validation_findings = rows
+        try:
+            if error_root:
+                results.insert("", "end", values=(error_root, "(scan failed)", error_text, ""))
+            for finding in findings:
+                item_id = results.insert(
+                    "",
+                    "end",
+                    values=(
+                        owner._format_path_for_display(finding["path"]),
+                        finding["rule"],
+                        _save_validation_cell(finding.get("value")),
+                        # Locked rows are report-only but still show the saved value for comparison.
+                        _save_validation_cell(finding.get("suggested"))
+                        if finding.get("fixable") or finding.get("rule") == "locked_field"
+                        else "",
+                    ),
+                )
+                rows[item_id] = finding
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+
+
+def update_save_validation_progress(owner: Any, finished: int, total: int, finding_count: int, done: bool) -> None:
+        label = getattr(owner, "_save_validation_status_label", None)
+        if label is None:
+            return
+        state = getattr(owner, "_save_validation_state", None) or {}
+        if bool(state.get("cancelled", False)):
+            text = f"Cancelled - {finding_count} findings in {finished}/{total} categories"
+        elif done:
+            text = f"Done - {finding_count} findings in {total} categories"
+        else:
+            text = f"Validating {finished}/{total} categories - {finding_count} findings"
+        try:
+            label.configure(text=text)
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+
+
+def cancel_save_validation_from_ui(owner: Any) -> None:
+        if not cancel_save_validation(owner):
+            return
+        state = getattr(owner, "_save_validation_state", None) or {}
+        update_save_validation_progress(
+            owner,
+            int(state.get("finished", 0) or 0),
+            int(state.get("total", 0) or 0),
+            int(state.get("findings", 0) or 0),
+            True,
+        )
+
+
+def fix_save_validation_rows(owner: Any, *, selected_only: bool, expected_errors: Any) -> int:
+        """One-click batch fix for the selected (or all) fixable findings, then re-render the current node."""
+        results = getattr(owner, "_save_validation_results", None)
+        rows = getattr(owner, "_save_validation_findings", None)
+        if results is None or not isinstance(rows, dict):
+            return 0
+        try:
+            item_ids = list(results.selection()) if selected_only else list(results.get_children(""))
+        except expected_errors:
+            return 0
+        targets = [(item_id, rows[item_id]) for item_id in item_ids if item_id in rows and rows[item_id].get("fixable")]
+        if not targets:
+            owner.set_status("Validate save: nothing to fix")
+            return 0
+        applied_paths = []
+        applied, stale = apply_save_validation_fixes(owner, [finding for _item_id, finding in targets], applied_paths)
+        for item_id, finding in targets:
+            if finding.get("fixable"):
+                # Applied and stale rows alike leave the list: stale ones need a fresh validation run.
+                rows.pop(item_id, None)
+                try:
+                    results.delete(item_id)
+                except expected_errors:
+                    pass
+        if applied:
+            refresh_save_validation_tree(owner, applied_paths, expected_errors=expected_errors)
+            owner.on_select(None)
+        owner.set_status(f"Validate save: fixed {applied}" + (f", skipped {stale} changed since the scan" if stale else ""))
+        return applied
+
+
+def open_selected_save_validation_finding(owner: Any, *, expected_errors: Any) -> bool:
+        results = getattr(owner, "_save_validation_results", None)
+        rows = getattr(owner, "_save_validation_findings", None)
+        if results is None or not isinstance(rows, dict):
+            return False
+        try:
+            selection = results.selection()
+        except expected_errors:
+            return False
+        if not selection or selection[0] not in rows:
+            return False
+        path = list(rows[selection[0]]["path"])
+        # Findings point at leaves; reveal the closest node the tree actually shows.
+        while path:
+            item_id = owner._ensure_tree_item_for_path(list(path))
+            if item_id is not None:
+                break
+            path.pop()
+        else:
+            owner.set_status("Validate save: finding is no longer reachable")
+            return False
+        owner._open_to_item(item_id)
+        tree_widget = getattr(owner, "tree", None)
+        if tree_widget is not None:
+            try:
+                tree_widget.focus(item_id)
+                tree_widget.selection_set(item_id)
+                tree_widget.see(item_id)
+            except expected_errors:
+                pass
+        owner.on_select(None)
+        return True
+
+# --- Background lint helpers ---
+"""Spacing/phone/missing-@ lint on a worker over the render snapshot; Tk tags mark only the visible window."""
+
+import bisect
+import queue
+import re
+import threading
+from core.domain_impl.json import json_view_core as json_lint_view_service
+
+JSON_LINT_DELAY_MS = 250
+JSON_LINT_POLL_MS = 16
+JSON_LINT_WINDOW_REFRESH_MS = 30
+JSON_LINT_MARGIN_LINES = 60
+JSON_LINT_MAX_MARKS = 400
+JSON_LINT_TAG = "json_lint"
+# Same shape as _find_json_spacing_issue_in_text's per-line rule, anchored per line over the whole buffer.
+_JSON_LINT_SPACING_RE = re.compile(r'^[^\S\n]*"[^"\n]+"[^\S\n]*:(?=\S)', re.MULTILINE)
+
+
+def collect_json_lint_issues(owner: Any, text: str) -> list[tuple[str, int, int, int, str]]:
+        """(rule, line, start_col, end_col, replacement) for every spacing, phone and missing-@ issue, in text order."""
+        issues = []
+        line_no = 1
+        scanned = 0
+        for match in _JSON_LINT_SPACING_RE.finditer(text):
+            line_no += text.count("\n", scanned, match.start())
+            scanned = match.start()
+            col = match.end() - match.start()
+            # Insert the space; the value after the colon stays as typed.
+            issues.append(("spacing", line_no, col, col, " "))
+        for idx, line_start, match, formatted in _phone_format_issues(owner, text):
+            issues.append(("phone_format", idx, match.start(1) - line_start, match.end(1) - line_start, formatted))
+        for idx, line_start, match, fixed in _missing_at_issues(owner, text):
+            if fixed != match.group(2):
+                issues.append(("missing_email_at", idx, match.start(2) - line_start, match.end(2) - line_start, fixed))
+        issues.sort(key=lambda issue: (issue[1], issue[2]))
+        return issues
+
+
+def schedule_json_lint(owner: Any, delay_ms: int = JSON_LINT_DELAY_MS) -> None:
+        """Debounce a lint pass: each edit or render pushes the pending run back by delay_ms."""
+        after_id = getattr(owner, "_json_lint_after_id", None)
+        owner._json_lint_after_id = None
+        if after_id:
+            try:
+                owner.root.after_cancel(after_id)
+            except EXPECTED_ERRORS as exc:
+                _LOG.debug('expected_error', exc_info=exc)
+        try:
+            owner._json_lint_after_id = owner.root.after(int(delay_ms), lambda: request_json_lint(owner))
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+            owner._json_lint_after_id = None
+
+
+def request_json_lint(owner: Any) -> None:
+        """Hand the render snapshot to a worker under a new sequence number; only its span list comes back."""
+        owner._json_lint_after_id = None
+        seq = int(getattr(owner, "_json_lint_seq", 0) or 0) + 1
+        owner._json_lint_seq = seq
+        if str(getattr(owner, "_editor_mode", "JSON")).upper() == "INPUT":
+            return
+        snapshot = json_lint_view_service.json_view_text_snapshot(owner, owner.text)
+        if snapshot is None:
+            return
+        text = str(snapshot.get("text", ""))
+        owner._json_lint_pending = {
+            "seq": seq,
+            "render_seq": int(getattr(owner, "_json_render_seq", 0) or 0),
+            "text": text,
+        }
+        handoff: queue.SimpleQueue = queue.SimpleQueue()
+        owner._json_lint_queue = handoff
+
+        def _worker() -> None:
+            try:
+                issues = collect_json_lint_issues(owner, text)
+            except EXPECTED_ERRORS as exc:
+                _LOG.debug('expected_error', exc_info=exc)
+                issues = []
+            handoff.put(issues)
+
+        threading.Thread(target=_worker, daemon=True, name=f"json_lint_{seq}").start()
+        _schedule_json_lint_poll(owner, seq)
+
+
+def _schedule_json_lint_poll(owner: Any, seq: int) -> None:
+        try:
+            owner._json_lint_poll_after_id = owner.root.after(JSON_LINT_POLL_MS, lambda: poll_json_lint(owner, seq))
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+            owner._json_lint_poll_after_id = None
+
+
+def poll_json_lint(owner: Any, seq: int) -> None:
+        owner._json_lint_poll_after_id = None
+        if int(getattr(owner, "_json_lint_seq", 0) or 0) != int(seq):
+            return
+        handoff = getattr(owner, "_json_lint_queue", None)
+        if not isinstance(handoff, queue.SimpleQueue):
+            return
+        try:
+            issues = handoff.get_nowait()
+        except queue.Empty:
+            _schedule_json_lint_poll(owner, seq)
+            return
+        owner._json_lint_queue = None
+        pending = getattr(owner, "_json_lint_pending", None)
+        owner._json_lint_pending = None
+        if not isinstance(pending, dict) or int(pending.get("seq", -1)) != int(seq):
+            return
+        if int(pending.get("render_seq", -1)) != int(getattr(owner, "_json_render_seq", 0) or 0):
+            # Another node was rendered meanwhile; these spans describe a buffer that is gone.
+            return
+        owner._json_lint_state = {
+            "render_seq": pending["render_seq"],
+            "text": pending["text"],
+            "issues": issues,
+            "lines": [issue[1] for issue in issues],
+        }
+        refresh_json_lint_marks(owner)
+
+
+def refresh_json_lint_marks(owner: Any) -> None:
+        """Re-tag lint spans for the visible lines plus a margin; the rest of the buffer stays untagged."""
+        owner._json_lint_window_after_id = None
+        text_widget = getattr(owner, "text", None)
+        if text_widget is None:
+            return
+        try:
+            text_widget.tag_remove(JSON_LINT_TAG, "1.0", "end")
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+            return
+        state = getattr(owner, "_json_lint_state", None)
+        if not isinstance(state, dict) or not state.get("issues"):
+            return
+        if int(state.get("render_seq", -1)) != int(getattr(owner, "_json_render_seq", 0) or 0):
+            owner._json_lint_state = None
+            return
+        snapshot = json_lint_view_service.json_view_text_snapshot(owner, text_widget)
+        current = snapshot.get("text") if snapshot is not None else None
+        if current is not state["text"] and current != state["text"]:
+            # Edited since the pass ran: its line/column spans would tag the wrong characters.
+            owner._json_lint_state = None
+            return
+        top_line, bottom_line = json_lint_view_service.visible_json_view_lines(owner)
+        lines = state["lines"]
+        lo = bisect.bisect_left(lines, max(1, top_line - JSON_LINT_MARGIN_LINES))
+        hi = min(bisect.bisect_right(lines, bottom_line + JSON_LINT_MARGIN_LINES), lo + JSON_LINT_MAX_MARKS)
+        ranges = []
+        for _rule, line, start_col, end_col, _replacement in state["issues"][lo:hi]:
+            # Insertions (spacing) mark the character after the missing space.
+            ranges.append(f"{line}.{start_col}")
+            ranges.append(f"{line}.{max(end_col, start_col + 1)}")
+        if not ranges:
+            return
+        try:
+            text_widget.tag_add(JSON_LINT_TAG, *ranges)
+            text_widget.tag_config(JSON_LINT_TAG, underline=True)
+            # Syntax, lock and error tags keep their colors; the lint marker only adds the underline.
+            text_widget.tag_lower(JSON_LINT_TAG)
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+
+
+def schedule_json_lint_window_refresh(owner: Any) -> None:
+        """Throttle scroll re-tagging: one pending refresh at a time."""
+        if not isinstance(getattr(owner, "_json_lint_state", None), dict):
+            return
+        if getattr(owner, "_json_lint_window_after_id", None) is not None:
+            return
+        try:
+            owner._json_lint_window_after_id = owner.root.after(JSON_LINT_WINDOW_REFRESH_MS, lambda: refresh_json_lint_marks(owner))
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+            owner._json_lint_window_after_id = None
+
+
+def apply_json_lint_fixes(owner: Any, raw: str) -> str:
+        """raw with every marked lint fix applied when the last pass ran on exactly this buffer; otherwise raw."""
+        state = getattr(owner, "_json_lint_state", None)
+        if not isinstance(state, dict) or not state.get("issues"):
+            return raw
+        text = str(state.get("text", ""))
+        if text.strip() != raw:
+            return raw
+        line_starts = [0] + [match.end() for match in re.finditer("\n", text)]
+        parts = []
+        pos = 0
+        for _rule, line, start_col, end_col, replacement in state["issues"]:
+            start = line_starts[line - 1] + start_col
+            if start < pos:
+                # Two rules touching one span: the earlier fix wins.
+                continue
+            parts.append(text[pos:start])
+            parts.append(replacement)
+            pos = line_starts[line - 1] + end_col
+        parts.append(text[pos:])
+        fixed = "".join(parts).strip()
+        clear_json_lint(owner)
+        if fixed == raw:
+            return raw
+        try:
+            owner.text.delete("1.0", "end")
+            owner.text.insert("1.0", fixed)
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+        return fixed
+
+
+def clear_json_lint(owner: Any) -> None:
+        """Drop lint results and markers; a pass still in flight is ignored when it lands."""
+        owner._json_lint_seq = int(getattr(owner, "_json_lint_seq", 0) or 0) + 1
+        owner._json_lint_queue = None
+        owner._json_lint_pending = None
+        owner._json_lint_state = None
+        for attr in ("_json_lint_after_id", "_json_lint_poll_after_id", "_json_lint_window_after_id"):
+            after_id = getattr(owner, attr, None)
+            setattr(owner, attr, None)
+            if not after_id:
+                continue
+            try:
+                owner.root.after_cancel(after_id)
+            except EXPECTED_ERRORS as exc:
+                _LOG.debug('expected_error', exc_info=exc)
+        try:
+            owner.text.tag_remove(JSON_LINT_TAG, "1.0", "end")
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+
+
 __all__ = [name for name in globals() if not name.startswith("__")]  # pyright: ignore[reportUnsupportedDunderAll]
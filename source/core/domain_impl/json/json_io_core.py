@@ -121,6 +121,7 @@ import re
 from typing import Any
 from core.exceptions import EXPECTED_ERRORS
 from core import json_diagnostics as json_diag_core
+from core.domain_impl.json import json_view_core
 import logging
 _LOG = logging.getLogger(__name__)
 
@@ -135,21 +136,16 @@ def can_auto_apply_current_edit(owner: Any) -> Any:
         return False
     raw = owner.text.get("1.0", "end").strip()
     try:
-        new_value = json.loads(raw)
+        current_value = owner._get_value(path)
     except EXPECTED_ERRORS as exc:
         _LOG.debug('expected_error', exc_info=exc)
+        current_value = None
+    verdict = evaluate_auto_apply_payload(
+        owner, path, raw, current_value, _auto_apply_page_copy(owner), check_key_change=False
+    )
+    if not verdict.get("ok"):
         return False
-    if owner._find_invalid_email_in_value(path, new_value):
-        return False
-    if owner._find_phone_format_issue():
-        return False
-    if owner._find_json_spacing_issue():
-        return False
-    if not owner._is_json_edit_allowed(path, new_value, show_feedback=False):
-        return False
-    if not owner._is_edit_allowed(path, new_value):
-        return False
-    return True
+    return bool(owner._is_edit_allowed(path, verdict["expanded"]))
 
 
 def autocorrect_boolean_literal_payload(raw_text: Any, *, error_lineno: int | None = None) -> str:
@@ -201,34 +197,207 @@ def autocorrect_boolean_literal_payload(raw_text: Any, *, error_lineno: int | No
     return "\n".join(lines)
 
 
+# --- Background auto-apply validation helpers ---
+"""Auto-apply checks run on a worker against a text snapshot; only the newest sequence reaches the UI."""
+
+import queue
+import threading
+from core.domain_impl.support import highlight_label_service
+
+AUTO_APPLY_VALIDATE_POLL_MS = 16
+
+
+def _auto_apply_page_copy(owner: Any) -> Any:
+    page = getattr(owner, "_json_view_page", None)
+    return dict(page) if isinstance(page, dict) else None
+
+
+def evaluate_auto_apply_payload(owner: Any, path: Any, raw: str, current_value: Any, page: Any=None, check_key_change: bool=True) -> dict[str, Any]:
+    """Run every auto-apply check on plain values; never touches Tk, so it is worker-safe."""
+    is_valid_input, _reason = validate_editor_text_payload(raw)
+    if not is_valid_input:
+        return {"ok": False}
+    # The span tree answers invalid keystrokes by re-parsing one container; the value still needs a full parse.
+    parse_error = owner._incremental_json_parse_error(raw)
+    if parse_error is not None:
+        return {"ok": False, "error": parse_error}
+    try:
+        parsed = json.loads(raw)
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        return {"ok": False}
+    new_value = parsed
+    if page is not None:
+        # Splice against the captured page copy so the live window's pending_end is untouched.
+        paged_ok, new_value = json_view_core.expand_paged_json_edit(owner, path, parsed, page=page, current=current_value)
+        if not paged_ok:
+            return {"ok": False}
+    if owner._find_invalid_email_in_value(path, new_value):
+        return {"ok": False}
+    if owner._find_phone_format_issue_in_text(raw):
+        return {"ok": False}
+    if owner._find_json_spacing_issue_in_text(raw):
+        return {"ok": False}
+    if not owner._is_json_edit_allowed(path, new_value, show_feedback=False):
+        return {"ok": False}
+    if check_key_change and not bool(getattr(owner, "_allow_highlight_key_change_once", False)):
+        payload = highlight_label_service.edit_allowed_payload(
+            path=path,
+            current_value=current_value,
+            new_value=new_value,
+            find_first_dict_key_change=owner._find_first_dict_key_change,
+            format_path_for_display=owner._format_path_for_display,
+        )
+        if not payload.get("allowed", False):
+            return {"ok": False, "key_change": True, "expanded": new_value}
+    return {"ok": True, "raw": raw, "value": parsed, "expanded": new_value}
+
+
+def request_auto_apply_validation(owner: Any) -> None:
+    """Snapshot the editor text and validate it off the Tk thread under a new sequence number."""
+    seq = int(getattr(owner, "_auto_apply_validate_seq", 0) or 0) + 1
+    owner._auto_apply_validate_seq = seq
+    if getattr(owner, "_json_progressive_render", None) is not None:
+        # A partially rendered node must never be validated (or applied) as the whole value.
+        return
+    item_id = owner.tree.focus()
+    if not item_id:
+        return
+    path = owner.item_to_path.get(item_id, [])
+    if isinstance(path, tuple) and path and path[0] == "__group__":
+        owner._schedule_live_error_feedback()
+        return
+    snapshot = json_view_core.json_view_text_snapshot(owner, owner.text)
+    if snapshot is not None:
+        raw = str(snapshot.get("text", "")).strip()
+    else:
+        raw = owner.text.get("1.0", "end").strip()
+    try:
+        current_value = owner._get_value(path)
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        current_value = None
+    page = _auto_apply_page_copy(owner)
+    render_seq = int(getattr(owner, "_json_render_seq", 0) or 0)
+    handoff: queue.SimpleQueue = queue.SimpleQueue()
+    owner._auto_apply_validate_queue = handoff
+
+    def _worker() -> None:
+        try:
+            verdict = evaluate_auto_apply_payload(owner, path, raw, current_value, page)
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+            verdict = {"ok": False}
+        verdict.update(seq=seq, item_id=item_id, path=path, render_seq=render_seq)
+        handoff.put(verdict)
+
+    threading.Thread(target=_worker, daemon=True, name=f"auto_apply_validate_{seq}").start()
+    _schedule_auto_apply_validation_poll(owner, seq)
+
+
+def _schedule_auto_apply_validation_poll(owner: Any, seq: int) -> None:
+    try:
+        owner._auto_apply_validate_poll_after_id = owner.root.after(
+            AUTO_APPLY_VALIDATE_POLL_MS,
+            lambda: poll_auto_apply_validation(owner, seq),
+        )
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        owner._auto_apply_validate_poll_after_id = None
+
+
+def poll_auto_apply_validation(owner: Any, seq: int) -> None:
+    owner._auto_apply_validate_poll_after_id = None
+    if int(getattr(owner, "_auto_apply_validate_seq", 0) or 0) != int(seq):
+        return
+    handoff = getattr(owner, "_auto_apply_validate_queue", None)
+    if not isinstance(handoff, queue.SimpleQueue):
+        return
+    try:
+        verdict = handoff.get_nowait()
+    except queue.Empty:
+        _schedule_auto_apply_validation_poll(owner, seq)
+        return
+    owner._auto_apply_validate_queue = None
+    if int(verdict.get("seq", -1)) != int(getattr(owner, "_auto_apply_validate_seq", 0) or 0):
+        return
+    # A selection change or re-render since the request makes the verdict meaningless.
+    if verdict.get("item_id") != owner.tree.focus():
+        return
+    if int(verdict.get("render_seq", -1)) != int(getattr(owner, "_json_render_seq", 0) or 0):
+        return
+    if not owner._auto_apply_pending or owner._auto_apply_in_progress:
+        return
+    if verdict.get("ok"):
+        owner._auto_apply_verdict = verdict
+        owner._run_auto_apply()
+        return
+    if verdict.get("key_change"):
+        # The key-change guard owns its warning overlay, which only the Tk thread may build.
+        owner._is_edit_allowed(verdict.get("path"), verdict.get("expanded"))
+    owner._schedule_live_error_feedback()
+
+
+def cancel_auto_apply_validation(owner: Any) -> None:
+    owner._auto_apply_validate_seq = int(getattr(owner, "_auto_apply_validate_seq", 0) or 0) + 1
+    owner._auto_apply_validate_queue = None
+    owner._auto_apply_verdict = None
+    after_id = getattr(owner, "_auto_apply_validate_poll_after_id", None)
+    owner._auto_apply_validate_poll_after_id = None
+    if after_id is None:
+        return
+    try:
+        owner.root.after_cancel(after_id)
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+
+
+def take_auto_apply_verdict(owner: Any, raw: str) -> tuple[bool, Any]:
+    """Return (True, parsed value) when the worker validated exactly this text; otherwise parse inline."""
+    verdict = getattr(owner, "_auto_apply_verdict", None)
+    owner._auto_apply_verdict = None
+    if not isinstance(verdict, dict) or not verdict.get("ok"):
+        return False, None
+    if not owner._auto_apply_in_progress or verdict.get("raw") != raw:
+        return False, None
+    return True, verdict.get("value")
+
+
 # --- Merged from validation_service.py ---
 """Input validation helpers for clipboard paste and Apply Edit flows."""
 
 
+import re
 from typing import Any
 
 from core import constants as app_constants
 
-
-def _contains_disallowed_controls(text: str) -> bool:
-    allowed = set(app_constants.EDITOR_ALLOWED_CONTROL_CHARS)
-    for char in text:
-        if ord(char) < 32 and char not in allowed:
-            return True
-    return False
-
-
-def _contains_utf16_surrogate(text: str) -> bool:
-    for char in text:
-        code = ord(char)
-        if 0xD800 <= code <= 0xDFFF:
-            return True
-    return False
+# One character class covers disallowed controls, UTF-16 surrogates and hidden Unicode, so a
+# multi-megabyte payload is scanned once in C instead of three Python passes.
+_EDITOR_DISALLOWED_CHAR_RE = re.compile(
+    "["
+    + "".join(
+        re.escape(chr(code))
+        for code in range(32)
+        if chr(code) not in set(app_constants.EDITOR_ALLOWED_CONTROL_CHARS)
+    )
+    + "\ud800-\udfff"
+    + "".join(re.escape(char) for char in app_constants.EDITOR_HIDDEN_UNICODE_CHARS)
+    + "]"
+)
 
 
-def _contains_hidden_unicode(text: str) -> bool:
-    hidden = set(app_constants.EDITOR_HIDDEN_UNICODE_CHARS)
-    return any(char in hidden for char in text)
+def find_disallowed_editor_char(text: str) -> tuple[int, str]:
+    """Return (offset, reason) for the first character editor input rejects; (-1, "") when clean."""
+    hit = _EDITOR_DISALLOWED_CHAR_RE.search(text)
+    if hit is None:
+        return -1, ""
+    code = ord(hit.group())
+    if 0xD800 <= code <= 0xDFFF:
+        return hit.start(), "Input contains non-UTF text code points."
+    if code < 32:
+        return hit.start(), "Input contains unsupported binary control bytes."
+    return hit.start(), "Input contains hidden Unicode characters."
 
 
 def validate_editor_text_payload(payload: Any) -> tuple[bool, str]:
@@ -239,12 +408,9 @@ def validate_editor_text_payload(payload: Any) -> tuple[bool, str]:
     limit = int(app_constants.EDITOR_INPUT_MAX_CHARS)
     if len(text) >= limit:
         return False, f"Input exceeds safety limit ({limit:,} characters)."
-    if _contains_utf16_surrogate(text):
-        return False, "Input contains non-UTF text code points."
-    if _contains_disallowed_controls(text):
-        return False, "Input contains unsupported binary control bytes."
-    if _contains_hidden_unicode(text):
-        return False, "Input contains hidden Unicode characters."
+    offset, reason = find_disallowed_editor_char(text)
+    if offset >= 0:
+        return False, reason
     return True, ""
 
 __all__ = [name for name in globals() if not name.startswith("__")]
@@ -6,8 +6,132 @@ Contains merged logic from split JSON domain services.
 
 # --- Merged from json_find_service.py ---
 """JSON-mode find helpers for deterministic data-path matching."""
+from array import array
 from typing import Any
 
+FIND_NODE_NO_PARENT = 0xFFFFFFFF
+FIND_TOKEN_CACHE_MAX_ITEMS = 20000
+
+
+class FindNodeTable:
+    """Walk-order node table: parent id plus encoded key per node (node 0 is the document root).
+
+    Keys are packed into one signed array: list indexes are stored as-is and string keys as
+    -(interned string id + 1), so a match costs one uint32 instead of a path list.
+    """
+
+    def __init__(self) -> None:
+        self.parents = array("I", [FIND_NODE_NO_PARENT])
+        self.keys = array("q", [0])
+        self._strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+        self.token_cache: dict[int, str] = {}
+
+    @classmethod
+    def from_parts(cls, parents: array, keys: array, strings: list[str]) -> "FindNodeTable":
+        table = cls()
+        table.parents = parents
+        table.keys = keys
+        table._strings = list(strings)
+        table._string_ids = {text: pos for pos, text in enumerate(table._strings)}
+        return table
+
+    @property
+    def strings(self) -> list[str]:
+        return self._strings
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def add(self, parent_id: int, key: Any) -> int:
+        if isinstance(key, int) and not isinstance(key, bool) and key >= 0:
+            code = key
+        else:
+            text = str(key)
+            string_id = self._string_ids.get(text)
+            if string_id is None:
+                string_id = len(self._strings)
+                self._strings.append(text)
+                self._string_ids[text] = string_id
+            code = -(string_id + 1)
+        self.parents.append(parent_id)
+        self.keys.append(code)
+        return len(self.parents) - 1
+
+    def parent(self, node_id: int) -> int:
+        return self.parents[node_id]
+
+    def key(self, node_id: int) -> Any:
+        code = self.keys[node_id]
+        return code if code >= 0 else self._strings[-code - 1]
+
+    def path(self, node_id: int) -> list[Any]:
+        parts = []
+        while node_id and node_id != FIND_NODE_NO_PARENT:
+            parts.append(self.key(node_id))
+            node_id = self.parent(node_id)
+        parts.reverse()
+        return parts
+
+
+class FindMatchSet:
+    """Ordered match node ids over a node table; paths are materialized only when read."""
+
+    def __init__(self, table: Any, ids: array | None = None) -> None:
+        self.table = table
+        self.ids = ids if ids is not None else array("I")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __bool__(self) -> bool:
+        return len(self.ids) > 0
+
+    def __getitem__(self, pos: int) -> list[Any]:
+        return self.table.path(self.ids[pos])
+
+    def __iter__(self):
+        for node_id in self.ids:
+            yield self.table.path(node_id)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, FindMatchSet):
+            other = list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+
+class _FindMatchCollector:
+    """Deduplicating appender using a per-node byte flag instead of a set of path tuples."""
+
+    def __init__(self, table: Any, node_count: int = 0) -> None:
+        self.table = table
+        self.ids = array("I")
+        self._seen = bytearray(node_count)
+
+    def add(self, node_id: int) -> None:
+        if not node_id or node_id == FIND_NODE_NO_PARENT:
+            return
+        if node_id >= len(self._seen):
+            self._seen.extend(bytes(node_id + 1 - len(self._seen)))
+        if self._seen[node_id]:
+            return
+        self._seen[node_id] = 1
+        self.ids.append(node_id)
+
+    def result(self) -> FindMatchSet:
+        return FindMatchSet(self.table, self.ids)
+
+
+FIND_WALK_CANCEL_CHECK_NODES = 4096
+
+
+class FindWalkCancelled(Exception):
+    """Raised inside a worker walk once a newer query or edit has superseded it."""
+
 
 def build_json_find_matches(owner: Any, query_lower: Any) -> Any:
     """Build deterministic JSON-mode path matches for Find Next traversal."""
@@ -15,20 +139,28 @@ def build_json_find_matches(owner: Any, query_lower: Any) -> Any:
     if not needle:
         return []
 
-    matches = []
-    seen = set()
-    hidden_keys = owner._hidden_root_tree_keys_for_mode("JSON")
+    disk_index = adopt_json_find_disk_index(owner)
+    if disk_index is not None:
+        return disk_index.matches(needle)
+    recorder = json_find_index_builder_for(owner)
+    matches, table = walk_json_find_matches(owner, needle, recorder)
+    if recorder is not None:
+        adopt_built_json_find_index(owner, recorder, table)
+    return matches
 
-    def _add(path):
-        if not isinstance(path, list) or not path:
-            return
-        key = tuple(path)
-        if key in seen:
-            return
-        seen.add(key)
-        matches.append(path)
 
-    def _walk(value, path):
+def walk_json_find_matches(owner: Any, needle: str, recorder: Any = None, is_current: Any = None) -> tuple[Any, Any]:
+    """Walk owner.data for needle, recording into recorder; touches no owner state, so it is worker-safe."""
+    table = FindNodeTable()
+    visited = [0]
+    matches = _FindMatchCollector(table)
+    hidden_keys = owner._hidden_root_tree_keys_for_mode("JSON")
+
+    def _walk(value, path, node_id):
+        if is_current is not None:
+            visited[0] += 1
+            if visited[0] % FIND_WALK_CANCEL_CHECK_NODES == 0 and not is_current():
+                raise FindWalkCancelled()
         if isinstance(value, dict):
             keys = list(value.keys())
             if not path:
@@ -37,35 +169,43 @@ def build_json_find_matches(owner: Any, query_lower: Any) -> Any:
                 if not path and owner._normalize_root_tree_key(key) in hidden_keys:
                     continue
                 child_path = path + [key]
+                child_id = table.add(node_id, key)
                 key_text = f"{key} {owner._tree_display_label_for_key(key)}".casefold()
+                if recorder is not None:
+                    recorder.add(key_text, FIND_INDEX_KIND_PATH, child_id)
                 if needle in key_text:
-                    _add(child_path)
-                _walk(value.get(key), child_path)
+                    matches.add(child_id)
+                _walk(value.get(key), child_path, child_id)
             return
 
         if isinstance(value, list):
             labeler = owner._list_labelers.get(tuple(path))
             for idx, item in enumerate(value):
                 child_path = path + [idx]
+                child_id = table.add(node_id, idx)
                 if labeler:
                     label = str(labeler(idx, item))
                 elif owner._is_database_table_rows_path(path):
                     label = str(owner._database_table_row_label(idx, item))
                 else:
                     label = f"[{idx}]"
+                if recorder is not None:
+                    recorder.add(label.casefold(), FIND_INDEX_KIND_PATH, child_id)
                 if needle in label.casefold():
-                    _add(child_path)
-                _walk(item, child_path)
+                    matches.add(child_id)
+                _walk(item, child_path, child_id)
             return
 
         value_text = str(value).casefold() if value is not None else "none"
+        if recorder is not None:
+            recorder.add(value_text, FIND_INDEX_KIND_VALUE, node_id)
         if needle in value_text:
             if len(path) > 1:
-                _add(path[:-1])
-            _add(path)
+                matches.add(table.parent(node_id))
+            matches.add(node_id)
 
-    _walk(owner.data, [])
-    return matches
+    _walk(owner.data, [], 0)
+    return matches.result(), table
 
 
 def filter_json_find_matches(owner: Any, prior_matches: Any, query_lower: Any) -> Any:
@@ -73,7 +213,24 @@ def filter_json_find_matches(owner: Any, prior_matches: Any, query_lower: Any) -
     needle = str(query_lower or "").strip().casefold()
     if not needle:
         return []
-    if not isinstance(prior_matches, list) or not prior_matches:
+    if not prior_matches:
+        return []
+    if isinstance(prior_matches, FindMatchSet):
+        table = prior_matches.table
+        token_cache = table.token_cache
+        kept = array("I")
+        for node_id in prior_matches.ids:
+            token_text = token_cache.get(node_id)
+            if token_text is None:
+                token_text = _path_token_text(owner, table.path(node_id))
+                if len(token_cache) >= FIND_TOKEN_CACHE_MAX_ITEMS:
+                    # Insertion-ordered dict: drop the oldest entry to stay bounded.
+                    token_cache.pop(next(iter(token_cache)))
+                token_cache[node_id] = token_text
+            if needle in token_text:
+                kept.append(node_id)
+        return FindMatchSet(table, kept)
+    if not isinstance(prior_matches, list):
         return []
     cache = getattr(owner, "_json_find_path_token_cache", None)
     if not isinstance(cache, dict):
@@ -112,6 +269,8 @@ def _json_find_anchor_path(path: list[Any]) -> list[Any]:
 
 def normalize_json_find_navigation_matches(matches: Any) -> list[Any]:
     """Collapse deep JSON find matches into unique first-subcategory navigation anchors."""
+    if isinstance(matches, FindMatchSet):
+        return _normalize_find_match_set(matches)
     if not isinstance(matches, list):
         return []
 
@@ -136,8 +295,30 @@ def normalize_json_find_navigation_matches(matches: Any) -> list[Any]:
     return normalized
 
 
-def _ensure_list(value: Any) -> list[Any]:
-    if isinstance(value, list):
+def _normalize_find_match_set(matches: FindMatchSet) -> list[Any]:
+    """Anchor each match node by climbing to depth <= 2 without materializing deep paths."""
+    table = matches.table
+    normalized: list[Any] = []
+    seen: set[int] = set()
+    for node_id in matches.ids:
+        chain = []
+        cursor = node_id
+        while cursor and cursor != FIND_NODE_NO_PARENT:
+            chain.append(cursor)
+            cursor = table.parent(cursor)
+        if not chain:
+            continue
+        anchor = chain[-2] if len(chain) >= 2 else chain[-1]
+        if anchor in seen:
+            continue
+        seen.add(anchor)
+        normalized.append(table.path(anchor))
+    return normalized
+
+
+def _ensure_list(value: Any) -> Any:
+    """Coerce match results to a sequence; compact match sets pass through unchanged."""
+    if isinstance(value, (list, FindMatchSet)):
         return value
     return []
 
@@ -247,7 +428,9 @@ def collapse_previous_find_root_if_category_changed(owner: Any, next_item_id: An
 
 # --- Merged from json_text_find_service.py ---
 """JSON text-view find helpers for in-buffer next-match traversal."""
+from bisect import bisect_left, bisect_right
 from typing import Any
+from core.domain_impl.json import json_view_core as json_view_render_service
 from core.exceptions import EXPECTED_ERRORS
 import logging
 _LOG = logging.getLogger(__name__)
@@ -347,6 +530,55 @@ def _json_find_window_fg(owner: Any) -> str:
     return _json_find_palette(owner)[3]
 
 
+JSON_FIND_WINDOW_MARGIN_LINES = 60
+JSON_FIND_WINDOW_MAX_MATCHES = 400
+JSON_FIND_WINDOW_REFRESH_MS = 30
+
+
+def json_find_match_offsets(owner: Any, text_widget: Any, needle: str) -> tuple[list[int], list[int]] | None:
+    """Return (match offsets, line starts) from one pass over the rendered-string snapshot."""
+    snapshot = json_view_render_service.json_view_text_snapshot(owner, text_widget)
+    if snapshot is None:
+        return None
+    needle_key = str(needle).lower()
+    line_starts = json_view_render_service.json_view_snapshot_line_starts(snapshot)
+    cached = snapshot.get("find_offsets")
+    if isinstance(cached, tuple) and cached[0] == needle_key:
+        return cached[1], line_starts
+    text = str(snapshot.get("text", ""))
+    lowered = snapshot.get("lowered")
+    if not isinstance(lowered, str):
+        lowered = text.lower()
+        snapshot["lowered"] = lowered
+    # Length-changing case maps would skew offsets vs Tk indices; let the caller use Tk search.
+    if len(lowered) != len(text) or len(needle_key) != len(needle) or not needle_key:
+        return None
+    offsets = []
+    step = len(needle_key)
+    pos = lowered.find(needle_key)
+    while pos >= 0:
+        offsets.append(pos)
+        pos = lowered.find(needle_key, pos + step)
+    snapshot["find_offsets"] = (needle_key, offsets)
+    return offsets, line_starts
+
+
+def _offset_to_index(line_starts: list[int], offset: int) -> str:
+    line_pos = bisect_right(line_starts, offset) - 1
+    return f"{line_pos + 1}.{offset - line_starts[line_pos]}"
+
+
+def _index_to_offset(line_starts: list[int], index: Any) -> int:
+    try:
+        line_text, col_text = str(index).split(".", 1)
+        line_pos = int(line_text) - 1
+        if 0 <= line_pos < len(line_starts):
+            return line_starts[line_pos] + int(col_text)
+    except (ValueError, TypeError):
+        pass
+    return -1
+
+
 def _refresh_visible_json_find_matches(
     owner: Any,
     text_widget: Any,
@@ -356,8 +588,14 @@ def _refresh_visible_json_find_matches(
     active_end: str,
 ) -> None:
     if not needle:
+        owner._json_find_window_state = None
         _clear_json_find_tags(owner, text_widget, clear_active=False)
         return
+    owner._json_find_window_state = {
+        "widget": text_widget,
+        "needle": needle,
+        "render_seq": int(getattr(owner, "_json_render_seq", 0) or 0),
+    }
     try:
         visible_start = text_widget.index("@0,0")
         height = int(text_widget.winfo_height() or 0)
@@ -369,6 +607,51 @@ def _refresh_visible_json_find_matches(
         return
     _clear_window_find_tag(text_widget)
 
+    offsets_info = json_find_match_offsets(owner, text_widget, needle)
+    if offsets_info is None:
+        _tag_visible_json_find_matches_by_search(text_widget, needle, visible_start, visible_end, active_start, active_end)
+    else:
+        offsets, line_starts = offsets_info
+        try:
+            top_line = int(str(visible_start).split(".", 1)[0])
+            bottom_line = int(str(visible_end).split(".", 1)[0])
+        except ValueError:
+            return
+        first_line = max(1, top_line - JSON_FIND_WINDOW_MARGIN_LINES)
+        last_line = bottom_line + JSON_FIND_WINDOW_MARGIN_LINES
+        window_start = line_starts[min(first_line, len(line_starts)) - 1]
+        window_end = line_starts[last_line] if last_line < len(line_starts) else float("inf")
+        lo = bisect_left(offsets, window_start)
+        hi = min(bisect_left(offsets, window_end), lo + JSON_FIND_WINDOW_MAX_MATCHES)
+        active_offset = _index_to_offset(line_starts, active_start)
+        step = len(needle)
+        ranges: list[str] = []
+        for offset in offsets[lo:hi]:
+            if offset == active_offset:
+                continue
+            ranges.append(_offset_to_index(line_starts, offset))
+            ranges.append(_offset_to_index(line_starts, offset + step))
+        if ranges:
+            try:
+                text_widget.tag_add("find_next_window_match", *ranges)
+            except EXPECTED_ERRORS as exc:
+                _LOG.debug('expected_error', exc_info=exc)
+
+    _configure_json_find_window_tag(owner, text_widget)
+    try:
+        text_widget.tag_raise("find_next_match")
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+
+
+def _tag_visible_json_find_matches_by_search(
+    text_widget: Any,
+    needle: str,
+    visible_start: str,
+    visible_end: str,
+    active_start: str,
+    active_end: str,
+) -> None:
     match_count = 0
     cursor = str(visible_start)
     max_visible_matches = 120
@@ -383,11 +666,66 @@ def _refresh_visible_json_find_matches(
             match_count += 1
         cursor = hit_end
 
-    _configure_json_find_window_tag(owner, text_widget)
+
+def on_json_text_yscroll(owner: Any, first: Any, last: Any) -> None:
+    """Forward yscroll to the scrollbar and extend syntax/find tagging to the new window."""
+    scrollbar = getattr(owner, "_text_scroll", None)
+    if scrollbar is not None:
+        try:
+            scrollbar.set(first, last)
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+    json_view_render_service.schedule_json_view_viewport_highlight(owner)
+    schedule_json_find_window_refresh(owner)
+    owner._schedule_json_lint_window_refresh()
+
+
+def schedule_json_find_window_refresh(owner: Any, event: Any = None) -> None:
+    """Throttle viewport re-tagging: one pending refresh at a time."""
+    if not isinstance(getattr(owner, "_json_find_window_state", None), dict):
+        return
+    if getattr(owner, "_json_find_window_after_id", None) is not None:
+        return
+    root = getattr(owner, "root", None)
+    if root is None:
+        return
     try:
-        text_widget.tag_raise("find_next_match")
+        owner._json_find_window_after_id = root.after(
+            JSON_FIND_WINDOW_REFRESH_MS,
+            lambda: refresh_json_find_window(owner),
+        )
     except EXPECTED_ERRORS as exc:
         _LOG.debug('expected_error', exc_info=exc)
+        owner._json_find_window_after_id = None
+
+
+def refresh_json_find_window(owner: Any) -> None:
+    owner._json_find_window_after_id = None
+    state = getattr(owner, "_json_find_window_state", None)
+    if not isinstance(state, dict):
+        return
+    text_widget = state.get("widget")
+    if text_widget is None or text_widget is not getattr(owner, "text", None):
+        owner._json_find_window_state = None
+        return
+    if int(state.get("render_seq", -1)) != int(getattr(owner, "_json_render_seq", 0) or 0):
+        # A different node was rendered; its buffer never carried these matches.
+        owner._json_find_window_state = None
+        return
+    try:
+        ranges = list(text_widget.tag_ranges("find_next_match"))
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        return
+    active_start = str(ranges[0]) if len(ranges) >= 2 else ""
+    active_end = str(ranges[1]) if len(ranges) >= 2 else ""
+    _refresh_visible_json_find_matches(
+        owner,
+        text_widget,
+        str(state.get("needle", "")),
+        active_start=active_start,
+        active_end=active_end,
+    )
 
 
 def _configure_json_find_tags(owner: Any, text_widget: Any) -> None:
@@ -451,6 +789,7 @@ def _clear_json_find_tags(owner: Any, text_widget: Any, *, clear_active: bool =
     _clear_window_find_tag(text_widget)
     if clear_active:
         owner._json_find_last_query = ""
+        owner._json_find_window_state = None
 
 
 def clear_json_find_highlight_on_nav(owner: Any, event: Any) -> None:
@@ -516,16 +855,16 @@ def find_next(owner: Any, *, expected_errors: Any) -> None:
         build_matches_fn = getattr(owner, "_build_json_find_matches", None)
         filter_matches_fn = getattr(owner, "_filter_json_find_matches", None)
         prior_raw_matches = getattr(owner, "_json_find_raw_matches", None)
-        if not isinstance(prior_raw_matches, list) or not prior_raw_matches:
+        if not isinstance(prior_raw_matches, (list, FindMatchSet)) or not prior_raw_matches:
             fallback_matches = getattr(owner, "find_matches", None)
             prior_raw_matches = fallback_matches if isinstance(fallback_matches, list) else None
         can_narrow_prior = bool(
             owner.last_find_query
             and query_lower.startswith(str(owner.last_find_query))
-            and isinstance(prior_raw_matches, list)
+            and isinstance(prior_raw_matches, (list, FindMatchSet))
             and prior_raw_matches
         )
-        raw_matches: list[Any]
+        raw_matches: Any
         if can_narrow_prior:
             if callable(filter_matches_fn):
                 raw_matches = _ensure_list(filter_matches_fn(prior_raw_matches, query_lower))
@@ -553,6 +892,7 @@ def find_next(owner: Any, *, expected_errors: Any) -> None:
     owner.find_matches = matches
     if not matches:
         owner.set_status(f'Find: no matches for "{query}"')
+        update_find_match_counter(owner, "0 matches")
         return
 
     item_id = None
@@ -625,5 +965,974 @@ def find_next(owner: Any, *, expected_errors: Any) -> None:
         else:
             focus_match_fn(query)
     owner.set_status(f'Find: {owner.find_index}/{len(matches)}')
+    update_find_match_counter(owner, _find_counter_text(owner))
+
+# --- Cross-save folder search helpers ---
+"""Folder-wide .hhsav search: worker-process scan plus UI-thread result streaming."""
+
+import os
+import queue
+from typing import Any
+from core.domain_impl.json import json_io_core as document_io_service
+from core.exceptions import EXPECTED_ERRORS
+import logging
+_LOG = logging.getLogger(__name__)
+
+FOLDER_SEARCH_SAVE_SUFFIX = ".hhsav"
+FOLDER_SEARCH_MAX_HITS_PER_FILE = 200
+FOLDER_SEARCH_SNIPPET_CHARS = 96
+FOLDER_SEARCH_POLL_MS = 40
+
+
+def list_folder_save_paths(folder: Any) -> list[str]:
+    """Return sorted .hhsav file paths directly under folder (non-recursive)."""
+    use_folder = str(folder or "").strip()
+    if not use_folder:
+        return []
+    try:
+        names = os.listdir(use_folder)
+    except OSError:
+        return []
+    paths = []
+    for name in sorted(names, key=str.casefold):
+        if not name.lower().endswith(FOLDER_SEARCH_SAVE_SUFFIX):
+            continue
+        full_path = os.path.join(use_folder, name)
+        if os.path.isfile(full_path):
+            paths.append(full_path)
+    return paths
+
+
+def _folder_search_snippet(key: Any, value: Any) -> str:
+    if isinstance(value, dict):
+        value_text = f"{{{len(value)} keys}}"
+    elif isinstance(value, list):
+        value_text = f"[{len(value)} items]"
+    elif value is None:
+        value_text = "null"
+    else:
+        value_text = str(value)
+    snippet = f"{key}: {value_text}" if key is not None else value_text
+    snippet = " ".join(snippet.split())
+    if len(snippet) > FOLDER_SEARCH_SNIPPET_CHARS:
+        snippet = snippet[: FOLDER_SEARCH_SNIPPET_CHARS - 3] + "..."
+    return snippet
+
+
+def scan_document_for_query(data: Any, query: Any, *, max_hits: int = FOLDER_SEARCH_MAX_HITS_PER_FILE) -> list[tuple[list[Any], str]]:
+    """Return (path, snippet) rows whose key or scalar value contains query (casefolded)."""
+    needle = str(query or "").strip().casefold()
+    if not needle:
+        return []
+    rows: list[tuple[list[Any], str]] = []
+    limit = max(1, int(max_hits))
+    # Explicit stack keeps deep save trees safe from recursion limits in worker processes.
+    stack: list[tuple[list[Any], Any]] = [([], data)]
+    while stack and len(rows) < limit:
+        path, value = stack.pop()
+        if isinstance(value, dict):
+            children = list(value.items())
+            for key, child in reversed(children):
+                stack.append((path + [key], child))
+            continue
+        if isinstance(value, list):
+            for idx in range(len(value) - 1, -1, -1):
+                stack.append((path + [idx], value[idx]))
+            continue
+        key = path[-1] if path else None
+        key_hit = isinstance(key, str) and needle in key.casefold()
+        value_text = "null" if value is None else str(value)
+        if key_hit or needle in value_text.casefold():
+            rows.append((path, _folder_search_snippet(key, value)))
+    return rows
+
+
+def scan_save_file_for_query(path: str, query: str, max_hits: int = FOLDER_SEARCH_MAX_HITS_PER_FILE) -> dict[str, Any]:
+    """Worker entry point: gunzip, parse and scan one save without touching Tk."""
+    try:
+        data = document_io_service.load_document(path)
+    except (OSError, UnicodeDecodeError, ValueError, TypeError) as exc:
+        return {"file": str(path), "rows": [], "error": str(exc)}
+    return {"file": str(path), "rows": scan_document_for_query(data, query, max_hits=max_hits), "error": ""}
+
+
+def _same_save_path(left: Any, right: Any) -> bool:
+    if not left or not right:
+        return False
+    try:
+        return os.path.normcase(os.path.abspath(str(left))) == os.path.normcase(os.path.abspath(str(right)))
+    except (OSError, ValueError, TypeError):
+        return False
+
+
+def start_folder_search(
+    owner: Any,
+    folder: str,
+    query: str,
+    *,
+    executor_factory: Any,
+    threading_module: Any,
+    cpu_count: int | None = None,
+) -> int:
+    """Start a cancellable folder search and schedule UI-thread polling; returns request id."""
+    cancel_folder_search(owner)
+    paths = list_folder_save_paths(folder)
+    request_id = int(getattr(owner, "_folder_search_request_seq", 0) or 0) + 1
+    owner._folder_search_request_seq = request_id
+    result_queue: queue.SimpleQueue = queue.SimpleQueue()
+    state: dict[str, Any] = {
+        "request_id": request_id,
+        "folder": str(folder),
+        "query": str(query),
+        "total": len(paths),
+        "finished": 0,
+        "hits": 0,
+        "cancelled": False,
+        "executor": None,
+        "futures": [],
+        "queue": result_queue,
+    }
+    owner._folder_search_state = state
+    if not paths:
+        return request_id
+
+    open_path = getattr(owner, "path", None)
+    open_data = getattr(owner, "data", None)
+    pool_paths = []
+    for path in paths:
+        if open_data is not None and _same_save_path(path, open_path):
+            # The open save is already decoded in memory; scan it on a thread instead of re-reading it.
+            def _scan_open(target=path, snapshot=open_data):
+                try:
+                    packet = {"file": target, "rows": scan_document_for_query(snapshot, query), "error": ""}
+                except RuntimeError as exc:
+                    # An edit resized a container mid-walk; report it rather than losing the file.
+                    packet = {"file": target, "rows": [], "error": str(exc)}
+                packet["request_id"] = request_id
+                result_queue.put(packet)
+
+            threading_module.Thread(target=_scan_open, daemon=True, name=f"folder_search_open_{request_id}").start()
+            continue
+        pool_paths.append(path)
+
+    if pool_paths:
+        workers = max(1, min(len(pool_paths), int(cpu_count or os.cpu_count() or 1)))
+        executor = executor_factory(max_workers=workers)
+        state["executor"] = executor
+
+        def _forward(future: Any, target: str) -> None:
+            if future.cancelled():
+                return
+            try:
+                packet = dict(future.result())
+            except Exception as exc:  # noqa: BLE001 - worker failures become per-file error rows
+                packet = {"file": target, "rows": [], "error": str(exc)}
+            packet["request_id"] = request_id
+            result_queue.put(packet)
+
+        for path in pool_paths:
+            future = executor.submit(scan_save_file_for_query, path, query)
+            future.add_done_callback(lambda fut, target=path: _forward(fut, target))
+            state["futures"].append(future)
+    schedule_folder_search_poll(owner, request_id)
+    return request_id
+
+
+def schedule_folder_search_poll(owner: Any, request_id: int) -> None:
+    root = getattr(owner, "root", None)
+    if root is None:
+        return
+    try:
+        owner._folder_search_after_id = root.after(
+            FOLDER_SEARCH_POLL_MS,
+            lambda rid=request_id: poll_folder_search(owner, rid),
+        )
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        owner._folder_search_after_id = None
+
+
+def poll_folder_search(owner: Any, request_id: int) -> None:
+    """Drain finished file packets on the UI thread and hand rows to the results panel."""
+    owner._folder_search_after_id = None
+    state = getattr(owner, "_folder_search_state", None)
+    if not isinstance(state, dict) or int(state.get("request_id", 0) or 0) != int(request_id):
+        return
+    if bool(state.get("cancelled", False)):
+        return
+    result_queue = state.get("queue")
+    while isinstance(result_queue, queue.SimpleQueue):
+        try:
+            packet = result_queue.get_nowait()
+        except queue.Empty:
+            break
+        if not isinstance(packet, dict) or int(packet.get("request_id", 0) or 0) != int(request_id):
+            continue
+        state["finished"] = int(state.get("finished", 0)) + 1
+        file_path = str(packet.get("file", "") or "")
+        rows = [(file_path, list(path), str(snippet)) for path, snippet in list(packet.get("rows") or [])]
+        state["hits"] = int(state.get("hits", 0)) + len(rows)
+        on_rows = getattr(owner, "_on_folder_search_rows", None)
+        if callable(on_rows) and (rows or packet.get("error")):
+            on_rows(rows, error_file=file_path if packet.get("error") else "", error_text=str(packet.get("error") or ""))
+    done = int(state.get("finished", 0)) >= int(state.get("total", 0))
+    on_progress = getattr(owner, "_on_folder_search_progress", None)
+    if callable(on_progress):
+        on_progress(int(state.get("finished", 0)), int(state.get("total", 0)), int(state.get("hits", 0)), done)
+    if done:
+        _shutdown_folder_search_executor(state)
+        return
+    schedule_folder_search_poll(owner, request_id)
+
+
+def _shutdown_folder_search_executor(state: dict[str, Any]) -> None:
+    executor = state.get("executor")
+    state["executor"] = None
+    if executor is None:
+        return
+    try:
+        executor.shutdown(wait=False, cancel_futures=True)
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+
+
+def cancel_folder_search(owner: Any) -> bool:
+    """Cancel any running folder search; running worker files finish but their rows are dropped."""
+    state = getattr(owner, "_folder_search_state", None)
+    after_id = getattr(owner, "_folder_search_after_id", None)
+    owner._folder_search_after_id = None
+    root = getattr(owner, "root", None)
+    if after_id is not None and root is not None:
+        try:
+            root.after_cancel(after_id)
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+    if not isinstance(state, dict):
+        return False
+    was_running = int(state.get("finished", 0)) < int(state.get("total", 0)) and not bool(state.get("cancelled", False))
+    state["cancelled"] = True
+    for future in list(state.get("futures") or []):
+        try:
+            future.cancel()
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+    _shutdown_folder_search_executor(state)
+    return was_running
+
+def open_folder_search_hit(owner: Any, file_path: str, path: list[Any], *, expected_errors: Any) -> bool:
+    """Load the hit's save when needed, then reveal and select the matching tree node."""
+    if not _same_save_path(file_path, getattr(owner, "path", None)):
+        owner.load_file(file_path)
+        if not _same_save_path(file_path, getattr(owner, "path", None)):
+            return False
+    item_id = owner._ensure_tree_item_for_path(list(path))
+    if item_id is None:
+        owner.set_status("Folder search: match is no longer reachable")
+        return False
+    owner._open_to_item(item_id)
+    tree_widget = getattr(owner, "tree", None)
+    if tree_widget is not None:
+        try:
+            tree_widget.focus(item_id)
+            tree_widget.selection_set(item_id)
+            tree_widget.see(item_id)
+        except expected_errors:
+            pass
+    owner.on_select(None)
+    return True
+
+
+def search_in_folder(
+    owner: Any,
+    *,
+    filedialog_module: Any,
+    executor_factory: Any,
+    threading_module: Any,
+    expected_errors: Any,
+) -> None:
+    """Prompt for a save folder and stream matches for the current Find text into the results window."""
+    entry = getattr(owner, "find_entry", None)
+    query = ""
+    if entry is not None:
+        try:
+            query = str(entry.get() or "").strip()
+        except expected_errors:
+            query = ""
+    if not query:
+        owner.set_status("Folder search: enter text in Find first")
+        return
+    initial_dir = os.path.dirname(str(getattr(owner, "path", "") or "")) or None
+    folder = filedialog_module.askdirectory(parent=owner.root, initialdir=initial_dir, title="Search saves in folder")
+    if not folder:
+        return
+    owner._build_folder_search_window()
+    results = getattr(owner, "_folder_search_results", None)
+    if results is not None:
+        try:
+            results.delete(*results.get_children(""))
+        except expected_errors:
+            pass
+    owner._folder_search_hits = {}
+    start_folder_search(
+        owner,
+        folder,
+        query,
+        executor_factory=executor_factory,
+        threading_module=threading_module,
+    )
+    state = getattr(owner, "_folder_search_state", None) or {}
+    update_folder_search_progress(owner, 0, int(state.get("total", 0) or 0), 0, not state.get("total"))
+
+
+def append_folder_search_rows(owner: Any, rows: list[Any], *, error_file: str = "", error_text: str = "") -> None:
+    results = getattr(owner, "_folder_search_results", None)
+    if results is None:
+        return
+    hits = getattr(owner, "_folder_search_hits", None)
+    if not isinstance(hits, dict):
+        hits = {}
+        owner._folder_search_hits = hits
+    try:
+        if error_file:
+            results.insert("", "end", values=(os.path.basename(error_file), "(unreadable)", error_text))
+        for file_path, path, snippet in rows:
+            item_id = results.insert(
+                "",
+                "end",
+                values=(os.path.basename(file_path), owner._format_path_for_display(path), snippet),
+            )
+            hits[item_id] = (file_path, path)
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+
+
+def update_folder_search_progress(owner: Any, finished: int, total: int, hit_count: int, done: bool) -> None:
+    label = getattr(owner, "_folder_search_status_label", None)
+    if label is None:
+        return
+    state = getattr(owner, "_folder_search_state", None) or {}
+    if bool(state.get("cancelled", False)):
+        text = f"Cancelled - {hit_count} matches in {finished}/{total} saves"
+    elif done:
+        text = f"Done - {hit_count} matches in {total} saves"
+    else:
+        text = f"Searching {finished}/{total} saves - {hit_count} matches"
+    try:
+        label.configure(text=text)
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+
+
+def cancel_folder_search_from_ui(owner: Any) -> None:
+    if not cancel_folder_search(owner):
+        return
+    state = getattr(owner, "_folder_search_state", None) or {}
+    update_folder_search_progress(
+        owner,
+        int(state.get("finished", 0) or 0),
+        int(state.get("total", 0) or 0),
+        int(state.get("hits", 0) or 0),
+        True,
+    )
+
+
+def open_selected_folder_search_hit(owner: Any, *, expected_errors: Any) -> bool:
+    results = getattr(owner, "_folder_search_results", None)
+    hits = getattr(owner, "_folder_search_hits", None)
+    if results is None or not isinstance(hits, dict):
+        return False
+    try:
+        selection = results.selection()
+    except expected_errors:
+        return False
+    if not selection or selection[0] not in hits:
+        return False
+    file_path, path = hits[selection[0]]
+    return open_folder_search_hit(owner, file_path, path, expected_errors=expected_errors)
+
+
+# --- Persisted find index helpers ---
+"""On-disk JSON-mode find index keyed by save SHA-256 and memory-mapped on reopen."""
+
+import hashlib
+import json
+import mmap
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from bisect import bisect_right
+from typing import Any
+from core import constants as app_constants
+
+FIND_INDEX_DIR_NAME = "find_index"
+FIND_INDEX_FILE_SUFFIX = ".hhfidx"
+FIND_INDEX_MAGIC = b"HHFIDX01"
+FIND_INDEX_FORMAT_VERSION = 2
+FIND_INDEX_DISK_BUDGET_BYTES = 256 * 1024 * 1024
+# Walk events replayed by matches(): key/label hits add the path, scalar hits add parent then path.
+FIND_INDEX_KIND_PATH = 0
+FIND_INDEX_KIND_VALUE = 1
+
+
+class FindIndex:
+    """Record table over one casefolded text blob; backed by bytes (fresh build) or mmap (reopen)."""
+
+    def __init__(
+        self,
+        *,
+        buffer: Any,
+        text_start: int,
+        record_offsets: array,
+        record_kinds: array,
+        record_nodes: array,
+        table: FindNodeTable,
+        profile: str,
+        shape: str,
+        handle: Any = None,
+    ) -> None:
+        self.buffer = buffer
+        self.text_start = int(text_start)
+        self.record_offsets = record_offsets
+        self.record_kinds = record_kinds
+        self.record_nodes = record_nodes
+        self.table = table
+        self.profile = str(profile)
+        self.shape = str(shape)
+        self._handle = handle
+
+    def matches(self, needle: str) -> FindMatchSet:
+        """Return the same ordered matches build_json_find_matches would for needle."""
+        # Records hold casefolded text, so fold here too ("straße" must hit "strasse" like the walk does).
+        token = str(needle or "").strip().casefold().replace("\x00", " ").encode("utf-8")
+        collector = _FindMatchCollector(self.table, len(self.table))
+        if not token or len(self.record_offsets) < 2:
+            return collector.result()
+        text_end = self.text_start + self.record_offsets[-1]
+        pos = self.buffer.find(token, self.text_start, text_end)
+        while pos >= 0:
+            record_id = bisect_right(self.record_offsets, pos - self.text_start) - 1
+            node_id = self.record_nodes[record_id]
+            if node_id and self.record_kinds[record_id] == FIND_INDEX_KIND_VALUE:
+                parent_id = self.table.parent(node_id)
+                if self.table.parent(parent_id) != FIND_NODE_NO_PARENT:
+                    collector.add(parent_id)
+            collector.add(node_id)
+            # Skip to the next record: one hit per record is enough for path collection.
+            pos = self.buffer.find(token, self.text_start + self.record_offsets[record_id + 1], text_end)
+        return collector.result()
+
+    def close(self) -> None:
+        buffer = self.buffer
+        handle = self._handle
+        self.buffer = b""
+        self._handle = None
+        if isinstance(buffer, mmap.mmap):
+            try:
+                buffer.close()
+            except (BufferError, OSError, ValueError):
+                pass
+        if handle is not None:
+            try:
+                handle.close()
+            except OSError:
+                pass
+
+
+class FindIndexBuilder:
+    """Collects walk records in traversal order while build_json_find_matches scans the tree."""
+
+    def __init__(self) -> None:
+        self._texts: list[bytes] = []
+        self.record_offsets = array("I", [0])
+        self.record_kinds = array("B")
+        self.record_nodes = array("I")
+        self._text_size = 0
+
+    def add(self, text: str, kind: int, node_id: int) -> None:
+        # NUL separators keep a hit from spanning two records.
+        encoded = str(text).replace("\x00", " ").encode("utf-8") + b"\x00"
+        self._texts.append(encoded)
+        self._text_size += len(encoded)
+        self.record_offsets.append(self._text_size)
+        self.record_kinds.append(int(kind))
+        self.record_nodes.append(int(node_id))
+
+    def build(self, table: FindNodeTable, *, profile: str, shape: str) -> FindIndex:
+        return FindIndex(
+            buffer=b"".join(self._texts),
+            text_start=0,
+            record_offsets=self.record_offsets,
+            record_kinds=self.record_kinds,
+            record_nodes=self.record_nodes,
+            table=table,
+            profile=profile,
+            shape=shape,
+        )
+
+
+def document_shape_signature(data: Any) -> str:
+    """Cheap two-level structural fingerprint used to reject an index for a different document."""
+    parts: list[Any] = []
+    if isinstance(data, dict):
+        for key, value in data.items():
+            entry: list[Any] = [str(key), type(value).__name__]
+            if isinstance(value, (dict, list)):
+                entry.append(len(value))
+                children = value.values() if isinstance(value, dict) else value
+                entry.append([len(child) if isinstance(child, (dict, list)) else -1 for child in children])
+            parts.append(entry)
+    elif isinstance(data, list):
+        parts.append(["[]", len(data)])
+    else:
+        parts.append([type(data).__name__])
+    raw = json.dumps(parts, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def find_index_profile(owner: Any) -> str:
+    """Label/visibility inputs that change the indexed text independently of the save bytes."""
+    hidden_getter = getattr(owner, "_hidden_root_tree_keys_for_mode", None)
+    hidden = sorted(str(key) for key in (hidden_getter("JSON") if callable(hidden_getter) else ()))
+    return f"{app_constants.APP_VERSION}|{FIND_INDEX_FORMAT_VERSION}|{','.join(hidden)}"
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_index_dir(owner: Any, *, create: bool = False) -> str:
+    base = owner._runtime_data_dir(create=create)
+    target = os.path.join(str(base), FIND_INDEX_DIR_NAME)
+    if create:
+        os.makedirs(target, exist_ok=True)
+    return target
+
+
+def write_find_index(index_dir: str, sha256: str, index: FindIndex) -> str:
+    """Serialize index atomically to <sha256>.hhfidx and return the final path."""
+    table = index.table
+    arrays = (index.record_offsets, index.record_kinds, index.record_nodes, table.parents, table.keys)
+    text_blob = bytes(index.buffer[index.text_start : index.text_start + index.record_offsets[-1]])
+    strings_blob = json.dumps(table.strings, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    header = json.dumps(
+        {
+            "version": FIND_INDEX_FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "profile": index.profile,
+            "shape": index.shape,
+            "records": len(index.record_kinds),
+            "nodes": len(table),
+            "text_bytes": len(text_blob),
+            "strings_bytes": len(strings_blob),
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    target = os.path.join(index_dir, f"{sha256}{FIND_INDEX_FILE_SUFFIX}")
+    fd, tmp_path = tempfile.mkstemp(prefix=".find_index_", dir=index_dir)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(FIND_INDEX_MAGIC)
+            handle.write(struct.pack("<I", len(header)))
+            handle.write(header)
+            for values in arrays:
+                values.tofile(handle)
+            handle.write(text_blob)
+            handle.write(strings_blob)
+        os.replace(tmp_path, target)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return target
+
+
+def open_find_index(path: str) -> FindIndex | None:
+    """Memory-map a persisted index; return None when missing, foreign-endian or malformed."""
+    try:
+        handle = open(path, "rb")
+    except OSError:
+        return None
+    try:
+        buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        handle.close()
+        return None
+    try:
+        magic_size = len(FIND_INDEX_MAGIC)
+        if buffer[:magic_size] != FIND_INDEX_MAGIC:
+            raise ValueError("bad magic")
+        (header_size,) = struct.unpack("<I", buffer[magic_size : magic_size + 4])
+        cursor = magic_size + 4
+        header = json.loads(buffer[cursor : cursor + header_size].decode("utf-8"))
+        cursor += header_size
+        if header.get("version") != FIND_INDEX_FORMAT_VERSION or header.get("byteorder") != sys.byteorder:
+            raise ValueError("incompatible index")
+        records = int(header["records"])
+        nodes = int(header["nodes"])
+        loaded: list[array] = []
+        for typecode, count in (("I", records + 1), ("B", records), ("I", records), ("I", nodes), ("q", nodes)):
+            values = array(typecode)
+            size = values.itemsize * count
+            values.frombytes(buffer[cursor : cursor + size])
+            cursor += size
+            loaded.append(values)
+        text_start = cursor
+        strings_start = text_start + int(header["text_bytes"])
+        strings_end = strings_start + int(header["strings_bytes"])
+        if strings_end != len(buffer):
+            raise ValueError("truncated index")
+        strings = json.loads(buffer[strings_start:strings_end].decode("utf-8"))
+        if not isinstance(strings, list):
+            raise ValueError("bad string table")
+    except (ValueError, KeyError, TypeError, struct.error):
+        buffer.close()
+        handle.close()
+        return None
+    return FindIndex(
+        buffer=buffer,
+        text_start=text_start,
+        record_offsets=loaded[0],
+        record_kinds=loaded[1],
+        record_nodes=loaded[2],
+        table=FindNodeTable.from_parts(loaded[3], loaded[4], strings),
+        profile=str(header.get("profile", "")),
+        shape=str(header.get("shape", "")),
+        handle=handle,
+    )
+
+
+def evict_find_indexes(index_dir: str, *, budget_bytes: int = FIND_INDEX_DISK_BUDGET_BYTES, keep: str = "") -> None:
+    """Delete least-recently-used index files until the directory fits budget_bytes."""
+    try:
+        names = os.listdir(index_dir)
+    except OSError:
+        return
+    entries = []
+    for name in names:
+        if not name.endswith(FIND_INDEX_FILE_SUFFIX):
+            continue
+        full_path = os.path.join(index_dir, name)
+        try:
+            stat = os.stat(full_path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, full_path))
+    total = sum(size for _mtime, size, _path in entries)
+    for _mtime, size, full_path in sorted(entries):
+        if total <= budget_bytes:
+            break
+        if keep and os.path.normcase(full_path) == os.path.normcase(keep):
+            continue
+        try:
+            os.remove(full_path)
+        except OSError:
+            # Windows keeps mapped files locked; retry on a later eviction pass.
+            continue
+        total -= size
+
+
+def prepare_json_find_disk_index(owner: Any, path: Any) -> None:
+    """Hash the opened save off the UI thread and map its persisted index if one exists."""
+    invalidate_json_find_disk_index(owner)
+    use_path = str(path or "")
+    if not use_path:
+        return
+    request_id = int(getattr(owner, "_json_find_disk_index_seq", 0) or 0)
+    handoff: queue.SimpleQueue = queue.SimpleQueue()
+    owner._json_find_disk_index_queue = handoff
+    try:
+        index_dir = find_index_dir(owner)
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        return
+
+    def _worker() -> None:
+        sha256 = ""
+        index = None
+        try:
+            sha256 = file_sha256(use_path)
+            index_path = os.path.join(index_dir, f"{sha256}{FIND_INDEX_FILE_SUFFIX}")
+            if os.path.isfile(index_path):
+                index = open_find_index(index_path)
+                if index is not None:
+                    os.utime(index_path)
+        except OSError as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+        handoff.put({"request_id": request_id, "sha256": sha256, "index": index})
+
+    threading.Thread(target=_worker, daemon=True, name="json_find_disk_index").start()
+
+
+def adopt_json_find_disk_index(owner: Any) -> FindIndex | None:
+    """Return a validated index for owner.data, draining any finished background open first."""
+    handoff = getattr(owner, "_json_find_disk_index_queue", None)
+    request_id = int(getattr(owner, "_json_find_disk_index_seq", 0) or 0)
+    while isinstance(handoff, queue.SimpleQueue):
+        try:
+            packet = handoff.get_nowait()
+        except queue.Empty:
+            break
+        index = packet.get("index")
+        if int(packet.get("request_id", -1)) != request_id:
+            if index is not None:
+                index.close()
+            continue
+        owner._json_find_disk_index_queue = None
+        owner._json_find_disk_sha256 = str(packet.get("sha256") or "")
+        if index is None:
+            continue
+        if index.profile != find_index_profile(owner) or index.shape != document_shape_signature(owner.data):
+            index.close()
+            continue
+        owner._json_find_disk_index = index
+    index = getattr(owner, "_json_find_disk_index", None)
+    return index if isinstance(index, FindIndex) else None
+
+
+def json_find_index_builder_for(owner: Any) -> FindIndexBuilder | None:
+    """Record the next full walk only when the open save hash is known and unindexed."""
+    if getattr(owner, "_json_find_disk_index", None) is not None:
+        return None
+    if not str(getattr(owner, "_json_find_disk_sha256", "") or ""):
+        return None
+    return FindIndexBuilder()
+
+
+def json_find_index_identity(owner: Any) -> tuple[str, str, str]:
+    """Save hash, index profile and document shape for owner.data as they stand right now."""
+    sha256 = str(getattr(owner, "_json_find_disk_sha256", "") or "")
+    if not sha256:
+        return "", "", ""
+    return sha256, find_index_profile(owner), document_shape_signature(owner.data)
+
+
+def adopt_built_json_find_index(
+    owner: Any, builder: FindIndexBuilder, table: FindNodeTable, identity: tuple[str, str, str] | None = None
+) -> None:
+    """Serve later queries from the freshly built index and persist it off the UI thread.
+
+    identity is the (sha256, profile, shape) captured before the walk started; the index is
+    dropped when the open save's hash has changed since, so it is never written under another save.
+    """
+    current_sha256 = str(getattr(owner, "_json_find_disk_sha256", "") or "")
+    if identity is None:
+        identity = json_find_index_identity(owner)
+    sha256, profile, shape = identity
+    if not sha256 or sha256 != current_sha256 or getattr(owner, "_json_find_disk_index", None) is not None:
+        return
+    index = builder.build(table, profile=profile, shape=shape)
+    owner._json_find_disk_index = index
+    try:
+        index_dir = find_index_dir(owner, create=True)
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        return
+
+    def _persist() -> None:
+        try:
+            target = write_find_index(index_dir, sha256, index)
+            evict_find_indexes(index_dir, keep=target)
+        except OSError as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+
+    threading.Thread(target=_persist, daemon=True, name="json_find_disk_index_write").start()
+
+
+def invalidate_json_find_disk_index(owner: Any) -> None:
+    """Drop the index for the current document (edits make the save hash stale)."""
+    owner._json_find_disk_index_seq = int(getattr(owner, "_json_find_disk_index_seq", 0) or 0) + 1
+    owner._json_find_disk_index_queue = None
+    owner._json_find_disk_sha256 = ""
+    index = getattr(owner, "_json_find_disk_index", None)
+    owner._json_find_disk_index = None
+    if isinstance(index, FindIndex) and isinstance(index.buffer, mmap.mmap):
+        index.close()
+
+
+# --- Typeahead find helpers ---
+"""Debounced search-as-you-type: worker-thread evaluation, UI-thread commit by sequence number."""
+
+import queue
+import threading
+from typing import Any
+from core.exceptions import EXPECTED_ERRORS
+import logging
+_LOG = logging.getLogger(__name__)
+
+FIND_TYPEAHEAD_DEBOUNCE_MS = 120
+FIND_TYPEAHEAD_POLL_MS = 16
+
+
+def schedule_typeahead_find(owner: Any, event: Any = None) -> None:
+    """Restart the debounce timer after a find-entry keystroke; never evaluates inline."""
+    if str(getattr(owner, "_editor_mode", "JSON")).upper() != "JSON":
+        return
+    root = getattr(owner, "root", None)
+    if root is None:
+        return
+    after_id = getattr(owner, "_find_typeahead_after_id", None)
+    owner._find_typeahead_after_id = None
+    if after_id is not None:
+        try:
+            root.after_cancel(after_id)
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+    try:
+        owner._find_typeahead_after_id = root.after(FIND_TYPEAHEAD_DEBOUNCE_MS, lambda: start_typeahead_find(owner))
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+
+
+def _typeahead_query(owner: Any) -> str:
+    entry = getattr(owner, "find_entry", None)
+    if entry is None:
+        return ""
+    try:
+        return str(entry.get() or "").strip()
+    except EXPECTED_ERRORS:
+        return ""
+
+
+def start_typeahead_find(owner: Any) -> None:
+    """Hand the current query to a worker; extensions narrow the previous result set."""
+    owner._find_typeahead_after_id = None
+    query_lower = _typeahead_query(owner).lower()
+    seq = int(getattr(owner, "_find_typeahead_seq", 0) or 0) + 1
+    owner._find_typeahead_seq = seq
+    if not query_lower or getattr(owner, "data", None) is None:
+        owner._find_typeahead_result = None
+        update_find_match_counter(owner, "")
+        return
+    if query_lower == str(getattr(owner, "last_find_query", "") or ""):
+        update_find_match_counter(owner, _find_counter_text(owner))
+        return
+    prior = getattr(owner, "_find_typeahead_result", None)
+    prior_query, prior_matches = prior if isinstance(prior, tuple) else ("", None)
+    narrow_from = prior_matches if prior_query and query_lower.startswith(prior_query) else None
+    # Everything that reads or writes owner's find-index state happens here on the Tk thread; the
+    # worker only walks owner.data into the builder it is handed, and poll_typeahead_find adopts it.
+    disk_index = None
+    recorder = None
+    identity = ("", "", "")
+    if narrow_from is None:
+        disk_index = adopt_json_find_disk_index(owner)
+        if disk_index is None:
+            recorder = json_find_index_builder_for(owner)
+            identity = json_find_index_identity(owner) if recorder is not None else identity
+    handoff: queue.SimpleQueue = queue.SimpleQueue()
+    owner._find_typeahead_queue = handoff
+
+    def _is_current() -> bool:
+        return int(getattr(owner, "_find_typeahead_seq", 0) or 0) == seq
+
+    def _worker() -> None:
+        table = None
+        try:
+            if narrow_from is not None:
+                raw_matches = filter_json_find_matches(owner, narrow_from, query_lower)
+            elif disk_index is not None:
+                raw_matches = disk_index.matches(query_lower.casefold())
+            else:
+                raw_matches, table = walk_json_find_matches(owner, query_lower.casefold(), recorder, _is_current)
+        except FindWalkCancelled:
+            handoff.put((seq, query_lower, None, None))
+            return
+        except EXPECTED_ERRORS as exc:
+            # The document changed under the walk; a newer keystroke or edit supersedes this run.
+            _LOG.debug('expected_error', exc_info=exc)
+            handoff.put((seq, query_lower, None, None))
+            return
+        built = (recorder, table, identity) if recorder is not None and table is not None else None
+        handoff.put((seq, query_lower, _ensure_list(raw_matches), built))
+
+    threading.Thread(target=_worker, daemon=True, name=f"find_typeahead_{seq}").start()
+    _schedule_typeahead_poll(owner, seq)
+
+
+def _schedule_typeahead_poll(owner: Any, seq: int) -> None:
+    try:
+        owner._find_typeahead_poll_after_id = owner.root.after(
+            FIND_TYPEAHEAD_POLL_MS,
+            lambda: poll_typeahead_find(owner, seq),
+        )
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        owner._find_typeahead_poll_after_id = None
+
+
+def poll_typeahead_find(owner: Any, seq: int) -> None:
+    owner._find_typeahead_poll_after_id = None
+    if int(getattr(owner, "_find_typeahead_seq", 0) or 0) != int(seq):
+        return
+    handoff = getattr(owner, "_find_typeahead_queue", None)
+    if not isinstance(handoff, queue.SimpleQueue):
+        return
+    try:
+        packet_seq, query_lower, raw_matches, built = handoff.get_nowait()
+    except queue.Empty:
+        _schedule_typeahead_poll(owner, seq)
+        return
+    if int(packet_seq) != int(getattr(owner, "_find_typeahead_seq", 0) or 0):
+        return
+    owner._find_typeahead_queue = None
+    if raw_matches is None:
+        # The worker gave up without a result; leave Find Next to rebuild on Enter.
+        return
+    if built is not None:
+        recorder, table, identity = built
+        adopt_built_json_find_index(owner, recorder, table, identity)
+    owner._find_typeahead_result = (query_lower, raw_matches)
+    # Prime Find Next so Enter jumps straight to the first match without re-scanning.
+    owner._json_find_raw_matches = raw_matches
+    owner.find_matches = normalize_json_find_navigation_matches(raw_matches)
+    owner.find_index = 0
+    owner.last_find_query = query_lower
+    update_find_match_counter(owner, _find_counter_text(owner))
+
+
+def _find_counter_text(owner: Any) -> str:
+    matches = getattr(owner, "find_matches", None)
+    total = len(matches) if isinstance(matches, list) else 0
+    if total <= 0:
+        return "0 matches"
+    index = int(getattr(owner, "find_index", 0) or 0)
+    if index <= 0:
+        return f"{total} match" if total == 1 else f"{total} matches"
+    return f"{index}/{total}"
+
+
+def update_find_match_counter(owner: Any, text: str) -> None:
+    label = getattr(owner, "_find_match_count_label", None)
+    if label is None:
+        return
+    try:
+        if label.winfo_exists():
+            label.configure(text=str(text or ""))
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+
+
+def cancel_typeahead_find(owner: Any) -> None:
+    """Drop pending debounce/poll callbacks and any in-flight worker result."""
+    owner._find_typeahead_seq = int(getattr(owner, "_find_typeahead_seq", 0) or 0) + 1
+    owner._find_typeahead_queue = None
+    owner._find_typeahead_result = None
+    root = getattr(owner, "root", None)
+    for attr in ("_find_typeahead_after_id", "_find_typeahead_poll_after_id"):
+        after_id = getattr(owner, attr, None)
+        setattr(owner, attr, None)
+        if after_id is not None and root is not None:
+            try:
+                root.after_cancel(after_id)
+            except EXPECTED_ERRORS as exc:
+                _LOG.debug('expected_error', exc_info=exc)
 
 __all__ = [name for name in globals() if not name.startswith("__")]
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import bisect
 import json
 import re
+from array import array
 from typing import Any
 
+from core.domain_impl.json import json_view_core as json_view_render_service
+
 
 GLOBAL_LOCKED_VALUE_KEYS: frozenset[str] = frozenset({"width", "height"})
 
@@ -114,8 +118,12 @@ def _merge_spans(spans: list[tuple[int, int]]) -> list[tuple[int, int]]:
     return merged
 
 
-def build_editable_spans(raw: str, protected_value_keys: frozenset[str] | None = None) -> list[tuple[int, int]]:
-    """Return editable raw-text spans for JSON mode.
+_SPAN_STRING = 0
+_SPAN_LITERAL = 1
+
+
+def _scan_editable_spans(raw: str, protected_value_keys: frozenset[str] | None = None) -> list[tuple[int, int, int]]:
+    """Return unmerged (start, end, kind) editable spans; kind is _SPAN_STRING or _SPAN_LITERAL.
 
     Editable spans:
     - String value content only (quote delimiters are excluded)
@@ -135,7 +143,7 @@ def build_editable_spans(raw: str, protected_value_keys: frozenset[str] | None =
         for name in (protected_value_keys or GLOBAL_LOCKED_VALUE_KEYS)
         if str(name or "").strip()
     }
-    spans: list[tuple[int, int]] = []
+    spans: list[tuple[int, int, int]] = []
     idx = 0
     pending_key: str | None = None
     while idx < len(text):
@@ -164,19 +172,19 @@ def build_editable_spans(raw: str, protected_value_keys: frozenset[str] | None =
                 pending_key = _decode_string_token(token).casefold()
             else:
                 if pending_key not in protected and end > (idx + 1):
-                    spans.append((idx + 1, end))
+                    spans.append((idx + 1, end, _SPAN_STRING))
                 pending_key = None
             idx = end + 1
             continue
         if text.startswith("true", idx) and _is_word_boundary(text, idx - 1) and _is_word_boundary(text, idx + 4):
             if pending_key not in protected:
-                spans.append((idx, idx + 4))
+                spans.append((idx, idx + 4, _SPAN_LITERAL))
             pending_key = None
             idx += 4
             continue
         if text.startswith("false", idx) and _is_word_boundary(text, idx - 1) and _is_word_boundary(text, idx + 5):
             if pending_key not in protected:
-                spans.append((idx, idx + 5))
+                spans.append((idx, idx + 5, _SPAN_LITERAL))
             pending_key = None
             idx += 5
             continue
@@ -184,30 +192,121 @@ def build_editable_spans(raw: str, protected_value_keys: frozenset[str] | None =
         if number_match is not None:
             end = int(number_match.end())
             if pending_key not in protected:
-                spans.append((idx, end))
+                spans.append((idx, end, _SPAN_LITERAL))
             pending_key = None
             idx = end
             continue
         if ch in (",", "}", "]"):
             pending_key = None
         idx += 1
-    return _merge_spans(spans)
+    return spans
+
+
+def build_editable_spans(raw: str, protected_value_keys: frozenset[str] | None = None) -> list[tuple[int, int]]:
+    """Return merged editable raw-text spans for JSON mode (see _scan_editable_spans)."""
+    return _merge_spans([(start, end) for start, end, _kind in _scan_editable_spans(raw, protected_value_keys)])
+
+
+def _span_at(spans: list[tuple[int, int]], pos: int) -> tuple[int, int] | None:
+    """Last span starting at or before pos (spans are merged and sorted)."""
+    idx = bisect.bisect_right(spans, (int(pos), float("inf"))) - 1
+    return spans[idx] if idx >= 0 else None
 
 
 def _is_range_editable(spans: list[tuple[int, int]], start: int, end: int) -> bool:
     if start >= end:
         return True
-    for span_start, span_end in spans:
-        if int(span_start) <= int(start) and int(end) <= int(span_end):
-            return True
-    return False
+    span = _span_at(spans, start)
+    return span is not None and int(end) <= int(span[1])
 
 
 def _is_insert_position_editable(spans: list[tuple[int, int]], pos: int) -> bool:
-    for span_start, span_end in spans:
-        if int(span_start) <= int(pos) <= int(span_end):
+    span = _span_at(spans, pos)
+    return span is not None and int(pos) <= int(span[1])
+
+
+class EditableSpanIndex:
+    """Editable spans in sorted arrays with a Fenwick tree of per-span length deltas.
+
+    Span i currently covers [starts[i] + delta(0..i-1), ends[i] + delta(0..i)], so an edit inside
+    one span shifts every later span in O(log n) and lookups bisect in O(log^2 n).
+    """
+
+    def __init__(self, spans: list[tuple[int, int, int]]) -> None:
+        self.starts = array("q")
+        self.ends = array("q")
+        self.kinds = bytearray()
+        for start, end, kind in spans:
+            # Touching tokens merge exactly like build_editable_spans.
+            if self.ends and start <= self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], end)
+                if self.kinds[-1] != kind:
+                    self.kinds[-1] = _SPAN_LITERAL
+                continue
+            self.starts.append(start)
+            self.ends.append(end)
+            self.kinds.append(kind)
+        self.tree = array("q", bytes(8 * (len(self.starts) + 1)))
+        self.applied = 0
+        self.valid = True
+
+    def _delta_before(self, idx: int) -> int:
+        total = 0
+        while idx > 0:
+            total += self.tree[idx]
+            idx -= idx & -idx
+        return total
+
+    def _add_delta(self, idx: int, delta: int) -> None:
+        idx += 1
+        while idx < len(self.tree):
+            self.tree[idx] += delta
+            idx += idx & -idx
+
+    def span(self, idx: int) -> tuple[int, int]:
+        return self.starts[idx] + self._delta_before(idx), self.ends[idx] + self._delta_before(idx + 1)
+
+    def locate(self, pos: int) -> int:
+        """Index of the last span whose current start is <= pos, or -1."""
+        lo, hi = 0, len(self.starts)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.starts[mid] + self._delta_before(mid) <= pos:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo - 1
+
+    def insert_editable(self, pos: int) -> bool:
+        idx = self.locate(int(pos))
+        return idx >= 0 and int(pos) <= self.span(idx)[1]
+
+    def range_editable(self, start: int, end: int) -> bool:
+        if start >= end:
             return True
-    return False
+        idx = self.locate(int(start))
+        return idx >= 0 and int(end) <= self.span(idx)[1]
+
+    def apply_edit(self, text: str, start: int, end: int, inserted: str, removed: str) -> bool:
+        """Shift spans for one replace of [start, end); False when the token must be re-scanned."""
+        idx = self.locate(int(start))
+        if idx < 0:
+            return False
+        span_start, span_end = self.span(idx)
+        if not (span_start <= start and end <= span_end):
+            return False
+        delta = len(inserted) - (end - start)
+        new_end = span_end + delta
+        if self.kinds[idx] == _SPAN_STRING:
+            # Quotes, escapes and newlines change string token boundaries.
+            if any(ch in "\"\\\n" for ch in inserted + removed):
+                return False
+        else:
+            token = text[span_start:new_end]
+            if token not in ("true", "false") and _NUMBER_TOKEN.fullmatch(token) is None:
+                return False
+        self._add_delta(idx, delta)
+        return True
 
 
 def _decode_key_name(token: str) -> str:
@@ -497,11 +596,52 @@ def _insert_offset(owner: Any, raw: str, expected_errors: tuple[type[BaseExcepti
 
 def _read_raw(owner: Any, expected_errors: tuple[type[BaseException], ...]) -> str:
     try:
+        snapshot = json_view_render_service.json_view_text_snapshot(owner, owner.text)
+        if snapshot is not None:
+            return str(snapshot.get("text", "") or "")
         return str(owner.text.get("1.0", "end-1c") or "")
     except expected_errors:
         return ""
 
 
+def _snapshot_span_index(owner: Any, raw: str) -> EditableSpanIndex:
+    """Span index built once per render and caught up from the snapshot's edit deltas."""
+    snapshot = getattr(owner, "_json_view_text_snapshot", None)
+    if not isinstance(snapshot, dict) or snapshot.get("text") is not raw:
+        return EditableSpanIndex(_scan_editable_spans(raw))
+    index = snapshot.get("editable_span_index")
+    deltas = snapshot.get("edit_deltas") or []
+    pending = deltas[index.applied:] if isinstance(index, EditableSpanIndex) else ()
+    if isinstance(index, EditableSpanIndex) and index.valid and pending:
+        # apply_edit checks literal tokens against the text right after each edit, so
+        # walk the deltas back from raw to recover those intermediate texts.
+        texts = [raw]
+        for start, _end, inserted, removed in reversed(pending[1:]):
+            after = texts[-1]
+            texts.append(after[:start] + removed + after[start + len(inserted):])
+        for (start, end, inserted, removed), after in zip(pending, reversed(texts)):
+            if not index.apply_edit(after, start, end, inserted, removed):
+                index.valid = False
+                break
+        index.applied = len(deltas)
+    if not isinstance(index, EditableSpanIndex) or not index.valid or index.applied != len(deltas):
+        index = EditableSpanIndex(_scan_editable_spans(raw))
+        index.applied = len(deltas)
+        snapshot["editable_span_index"] = index
+    return index
+
+
+def _record_pending_edit(owner: Any, raw: str, start: int, end: int, inserted: str | None) -> None:
+    """Predict the replace Tk is about to apply so the snapshot can follow it without a re-read."""
+    snapshot = getattr(owner, "_json_view_text_snapshot", None)
+    if not isinstance(snapshot, dict):
+        return
+    if inserted is None or snapshot.get("text") is not raw:
+        snapshot.pop("pending_edit", None)
+        return
+    snapshot["pending_edit"] = (max(0, int(start)), min(len(raw), int(end)), str(inserted))
+
+
 def is_keypress_edit_allowed(
     owner: Any,
     event: Any,
@@ -538,27 +678,41 @@ def is_keypress_edit_allowed(
     raw = _read_raw(owner, expected_errors)
     selection = _selection_offsets(owner, raw, expected_errors)
     caret = _insert_offset(owner, raw, expected_errors)
+    typed_text = "\n" if is_enter else (char if is_typed else "")
 
     # Fast path: single-cursor key edits should not require full-buffer span builds.
     if selection is None:
         if is_backspace:
             if caret <= 0:
                 return True
-            return _position_editable_direct(raw, caret - 1, insert_mode=False)
+            allowed = _position_editable_direct(raw, caret - 1, insert_mode=False)
+            _record_pending_edit(owner, raw, caret - 1, caret, "" if allowed else None)
+            return allowed
         if is_delete:
             if caret >= len(raw):
                 return True
-            return _position_editable_direct(raw, caret, insert_mode=False)
+            allowed = _position_editable_direct(raw, caret, insert_mode=False)
+            _record_pending_edit(owner, raw, caret, caret + 1, "" if allowed else None)
+            return allowed
         if is_typed or is_enter:
-            return _position_editable_direct(raw, caret, insert_mode=True)
+            allowed = _position_editable_direct(raw, caret, insert_mode=True)
+            _record_pending_edit(owner, raw, caret, caret, typed_text if allowed else None)
+            return allowed
 
-    spans = build_editable_spans(raw)
+    index = _snapshot_span_index(owner, raw)
     if selection is not None:
-        if not _is_range_editable(spans, selection[0], selection[1]):
+        if not index.range_editable(selection[0], selection[1]):
+            _record_pending_edit(owner, raw, 0, 0, None)
             return False
 
     # Insert/replace and cut operations require editable insertion location.
-    return _is_insert_position_editable(spans, caret)
+    allowed = index.insert_editable(caret)
+    if allowed and selection is not None and not is_paste:
+        _record_pending_edit(owner, raw, selection[0], selection[1], typed_text)
+    else:
+        # Paste content is unknown here; the next read re-syncs from Tk.
+        _record_pending_edit(owner, raw, 0, 0, None)
+    return allowed
 
 
 def is_paste_allowed(
@@ -568,9 +722,10 @@ def is_paste_allowed(
 ) -> bool:
     """Return whether a context-menu paste operation is allowed in JSON mode."""
     raw = _read_raw(owner, expected_errors)
-    spans = build_editable_spans(raw)
+    index = _snapshot_span_index(owner, raw)
+    _record_pending_edit(owner, raw, 0, 0, None)
     selection = _selection_offsets(owner, raw, expected_errors)
-    if selection is not None and not _is_range_editable(spans, selection[0], selection[1]):
+    if selection is not None and not index.range_editable(selection[0], selection[1]):
         return False
     caret = _insert_offset(owner, raw, expected_errors)
-    return _is_insert_position_editable(spans, caret)
+    return index.insert_editable(caret)
@@ -21,6 +21,7 @@ def log_json_error(owner: Any, exc: Any, target_line: Any, note: Any="") -> Any:
 # --- Merged from json_view_render_service.py ---
 """JSON view rendering helpers for editor text widget flows."""
 
+import bisect
 import json
 from typing import Any
 from core.exceptions import EXPECTED_ERRORS
@@ -30,6 +31,9 @@ _LOG = logging.getLogger(__name__)
 
 def show_value(owner: Any, value: Any, path: Any=None) -> Any:
     """Render selected JSON value and schedule deferred highlight passes."""
+    remember_json_view_render(owner)
+    cancel_progressive_json_render(owner)
+    cancel_bulk_json_paste(owner)
     owner._json_render_seq = int(getattr(owner, "_json_render_seq", 0) or 0) + 1
     render_seq = int(owner._json_render_seq)
     try:
@@ -38,23 +42,50 @@ def show_value(owner: Any, value: Any, path: Any=None) -> Any:
         _LOG.debug('expected_error', exc_info=exc)
         pass
     owner.text.delete("1.0", "end")
+    render_value, page = paged_json_view_value(owner, value, path)
+    owner._json_view_page = page
+    cached = json_render_cache(owner).get(path, value) if page is None else None
+    if cached is not None:
+        rendered = cached.text
+    else:
+        try:
+            rendered = json.dumps(render_value, indent=2, ensure_ascii=False)
+        except TypeError:
+            rendered = str(render_value)
+    snapshot = {
+        "widget": owner.text,
+        "render_seq": render_seq,
+        "text": rendered,
+        "line_starts": cached.line_starts if cached is not None else None,
+        "path": list(path or []),
+    }
+    if page is None:
+        # Only whole-value renders are replayable from the render cache.
+        snapshot["value"] = value
+    head_end = progressive_json_render_head_end(owner, snapshot)
+    owner.text.insert("1.0", rendered if head_end is None else rendered[:head_end])
     try:
-        rendered = json.dumps(value, indent=2, ensure_ascii=False)
-    except TypeError:
-        rendered = str(value)
-    owner.text.insert("1.0", rendered)
-    # Keep visible key highlights instant; defer heavier value-rule pass.
-    owner._clear_json_lock_highlight()
-    owner._set_json_text_editable(True)
-    owner._apply_json_view_key_highlights(path, line_limit=initial_highlight_line_limit(owner))
-    schedule_json_view_lock_state(owner, path, render_seq=render_seq)
-    try:
-        # Keep undo/redo scoped to the current node content.
+        # Keep undo/redo scoped to the current node content; a clean flag keeps the snapshot valid.
         owner.text.edit_reset()
         owner.text.edit_modified(False)
     except EXPECTED_ERRORS as exc:
         _LOG.debug('expected_error', exc_info=exc)
         pass
+    owner._json_view_text_snapshot = snapshot
+    owner._schedule_json_lint()
+    # Keep visible highlights instant; later slices extend them as the view scrolls.
+    owner._clear_json_lock_highlight()
+    if head_end is not None:
+        # Editing waits for the remaining chunks so edits never interleave with appends.
+        owner._set_json_text_editable(False)
+        start_progressive_json_render(owner, snapshot, head_end, cached)
+        start_json_view_highlights(owner, path, render_seq=render_seq)
+        return
+    owner._set_json_text_editable(True)
+    if cached is not None:
+        replay_json_view_render(owner, path, cached, render_seq=render_seq)
+    else:
+        start_json_view_highlights(owner, path, render_seq=render_seq)
 
 
 def initial_highlight_line_limit(owner: Any) -> Any:
@@ -85,26 +116,846 @@ def cancel_pending_json_view_lock_state(owner: Any) -> Any:
 
 
 def schedule_json_view_lock_state(owner: Any, path: Any, render_seq: Any=None) -> Any:
-    """Defer full lock/value highlight pass until idle to keep first paint responsive."""
+    """Reset viewport highlight coverage and tag the visible window in idle slices."""
+    reset_json_view_highlight_state(owner, path, render_seq=render_seq)
+    schedule_json_view_viewport_highlight(owner)
+
+
+def json_view_text_snapshot(owner: Any, text_widget: Any) -> dict[str, Any] | None:
+    """Return the rendered-string snapshot for text_widget, re-reading Tk only after edits."""
+    snapshot = getattr(owner, "_json_view_text_snapshot", None)
+    render_seq = int(getattr(owner, "_json_render_seq", 0) or 0)
+    stale = (
+        not isinstance(snapshot, dict)
+        or snapshot.get("widget") is not text_widget
+        or bool(snapshot.get("dirty"))
+        or int(snapshot.get("render_seq", -1)) != render_seq
+    )
+    if not stale:
+        # <<Modified>> is delivered from the event queue; cover edits made since the last delivery.
+        try:
+            stale = bool(text_widget.edit_modified())
+            if stale and apply_pending_json_text_edit(snapshot, text_widget):
+                text_widget.edit_modified(False)
+                stale = False
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+            return None
+    if stale:
+        try:
+            text = str(text_widget.get("1.0", "end-1c"))
+            # Re-arm the modified flag so the next edit invalidates this snapshot.
+            text_widget.edit_modified(False)
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+            return None
+        snapshot = {
+            "widget": text_widget,
+            "render_seq": render_seq,
+            "text": text,
+            "line_starts": None,
+        }
+        owner._json_view_text_snapshot = snapshot
+    return snapshot
+
+
+def on_json_text_modified(owner: Any, event: Any=None) -> Any:
+    """Mark the rendered-string snapshot dirty after a Text edit and re-arm <<Modified>>."""
+    text_widget = getattr(event, "widget", None) or getattr(owner, "text", None)
+    if text_widget is None:
+        return None
+    try:
+        if not bool(text_widget.edit_modified()):
+            # Fired by our own edit_modified(False) reset.
+            return None
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        return None
+    snapshot = getattr(owner, "_json_view_text_snapshot", None)
+    if isinstance(snapshot, dict) and snapshot.get("widget") is text_widget:
+        if not apply_pending_json_text_edit(snapshot, text_widget):
+            snapshot["dirty"] = True
+    try:
+        text_widget.edit_modified(False)
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+    owner._schedule_json_lint()
+    return None
+
+
+def apply_pending_json_text_edit(snapshot: dict[str, Any], text_widget: Any) -> bool:
+    """Follow a guard-predicted keystroke edit in the snapshot; False means re-read from Tk."""
+    pending = snapshot.pop("pending_edit", None)
+    if not pending or snapshot.get("dirty"):
+        return False
+    start, end, inserted = pending[:3]
+    # Keystrokes check the insert cursor; bulk pastes name their own right-gravity mark.
+    caret_mark = pending[3] if len(pending) > 3 else "insert"
+    text = str(snapshot.get("text", ""))
+    if not (0 <= start <= end <= len(text)):
+        return False
+    new_text = text[:start] + inserted + text[end:]
+    caret = start + len(inserted)
+    line_begin = new_text.rfind("\n", 0, caret) + 1
+    line_end = new_text.find("\n", caret)
+    if line_end < 0:
+        line_end = len(new_text)
+    try:
+        # Confirm the prediction against the caret line Tk actually holds.
+        tk_line = str(text_widget.get(f"{caret_mark} linestart", f"{caret_mark} lineend"))
+        tk_col = int(str(text_widget.index(caret_mark)).split(".", 1)[1])
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        return False
+    if tk_col != caret - line_begin or tk_line != new_text[line_begin:line_end]:
+        return False
+    snapshot["text"] = new_text
+    _shift_json_view_snapshot_line_starts(snapshot, start, end, inserted, text[start:end])
+    for key in ("lowered", "find_offsets", "value", "path"):
+        # Derived caches and the render-cache identity no longer describe the edited text.
+        snapshot.pop(key, None)
+    snapshot.setdefault("edit_deltas", []).append((start, end, inserted, text[start:end]))
+    return True
+
+
+def _shift_json_view_snapshot_line_starts(snapshot: dict[str, Any], start: int, end: int, inserted: str, removed: str) -> None:
+    """Patch cached line starts for one replace of [start, end) instead of rescanning the text."""
+    line_starts = snapshot.get("line_starts")
+    if not isinstance(line_starts, list):
+        return
+    # Line starts at or before start are untouched; those inside the replaced range go away.
+    first = bisect.bisect_right(line_starts, start)
+    last = bisect.bisect_right(line_starts, end, first)
+    delta = len(inserted) - len(removed)
+    added = []
+    pos = inserted.find("\n")
+    while pos >= 0:
+        added.append(start + pos + 1)
+        pos = inserted.find("\n", pos + 1)
+    # A fresh list: the render cache may share the old one with a cached entry.
+    snapshot["line_starts"] = line_starts[:first] + added + [offset + delta for offset in line_starts[last:]]
+
+
+def json_view_snapshot_line_starts(snapshot: dict[str, Any]) -> list[int]:
+    """Character offset of each line start (index 0 is line 1), built once per snapshot."""
+    line_starts = snapshot.get("line_starts")
+    if isinstance(line_starts, list):
+        return line_starts
+    text = str(snapshot.get("text", ""))
+    line_starts = [0]
+    pos = text.find("\n")
+    while pos >= 0:
+        line_starts.append(pos + 1)
+        pos = text.find("\n", pos + 1)
+    snapshot["line_starts"] = line_starts
+    return line_starts
+
+
+# --- Viewport highlight helpers ---
+"""Incremental JSON view highlighting: visible lines plus a margin, extended on scroll in timed slices."""
+
+import bisect
+import time
+
+JSON_VIEW_HIGHLIGHT_MARGIN_LINES = 120
+JSON_VIEW_HIGHLIGHT_CHUNK_LINES = 60
+JSON_VIEW_HIGHLIGHT_SLICE_MS = 8
+
+
+class LineIntervalSet:
+    """Sorted, merged inclusive line ranges that have already been tagged."""
+
+    def __init__(self) -> None:
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+
+    def add(self, first: int, last: int) -> None:
+        if last < first:
+            return
+        # Absorb every range that overlaps or touches [first, last].
+        lo = bisect.bisect_left(self.ends, first - 1)
+        hi = bisect.bisect_right(self.starts, last + 1)
+        if lo < hi:
+            first = min(first, self.starts[lo])
+            last = max(last, self.ends[hi - 1])
+        self.starts[lo:hi] = [first]
+        self.ends[lo:hi] = [last]
+
+    def missing(self, first: int, last: int) -> list[tuple[int, int]]:
+        """Return the sub-ranges of [first, last] not yet covered."""
+        gaps = []
+        pos = first
+        idx = bisect.bisect_left(self.ends, first)
+        while pos <= last and idx < len(self.starts):
+            start = self.starts[idx]
+            if start > last:
+                break
+            if start > pos:
+                gaps.append((pos, start - 1))
+            pos = max(pos, self.ends[idx] + 1)
+            idx += 1
+        if pos <= last:
+            gaps.append((pos, last))
+        return gaps
+
+    def covers(self, first: int, last: int) -> bool:
+        return not self.missing(first, last)
+
+    def insert_lines(self, line: int, count: int) -> None:
+        """Follow count new lines inserted at line; that line and the new ones become untagged."""
+        shifted_starts: list[int] = []
+        shifted_ends: list[int] = []
+        for start, end in zip(self.starts, self.ends):
+            if end < line:
+                shifted_starts.append(start)
+                shifted_ends.append(end)
+                continue
+            if start < line:
+                shifted_starts.append(start)
+                shifted_ends.append(line - 1)
+            if end > line:
+                shifted_starts.append(max(start, line + 1) + count)
+                shifted_ends.append(end + count)
+        self.starts = shifted_starts
+        self.ends = shifted_ends
+
+
+def reset_json_view_highlight_state(owner: Any, path: Any, render_seq: Any=None) -> None:
+    """Forget tagged coverage for a fresh render or a full lock-state re-apply."""
     cancel_pending_json_view_lock_state(owner)
-    snapshot_path = list(path or [])
     expected_seq = int(render_seq if render_seq is not None else getattr(owner, "_json_render_seq", 0) or 0)
+    owner._json_view_highlight_state = {
+        "render_seq": expected_seq,
+        "path": list(path or []),
+        "done": LineIntervalSet(),
+    }
 
-    def _apply_pending():
+
+def start_json_view_highlights(owner: Any, path: Any, render_seq: Any=None) -> None:
+    """Tag the visible window now and leave the margin to follow-up slices."""
+    reset_json_view_highlight_state(owner, path, render_seq=render_seq)
+    run_json_view_highlight_slice(owner)
+
+
+def visible_json_view_lines(owner: Any) -> tuple[int, int]:
+    """Return (first, last) visible Text lines, estimating the window before the widget maps."""
+    try:
+        top_line = int(str(owner.text.index("@0,0")).split(".", 1)[0])
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        top_line = 1
+    return top_line, top_line + int(initial_highlight_line_limit(owner))
+
+
+def pending_json_view_highlight_ranges(owner: Any, state: dict[str, Any]) -> list[tuple[int, int]]:
+    """Untagged line ranges around the viewport: visible lines first, then below, then above."""
+    snapshot = json_view_text_snapshot(owner, owner.text)
+    if snapshot is None:
+        return []
+    line_starts = snapshot.get("line_starts")
+    if isinstance(line_starts, list):
+        total_lines = len(line_starts)
+    else:
+        # After keystroke edits only the count is needed; the offset table rebuilds on demand.
+        total_lines = str(snapshot.get("text", "")).count("\n") + 1
+    loaded_lines = snapshot.get("loaded_lines")
+    if loaded_lines:
+        total_lines = min(total_lines, int(loaded_lines))
+    top_line, bottom_line = visible_json_view_lines(owner)
+    top_line = max(1, min(top_line, total_lines))
+    bottom_line = max(top_line, min(bottom_line, total_lines))
+    margin = JSON_VIEW_HIGHLIGHT_MARGIN_LINES
+    done = state["done"]
+    return (
+        done.missing(top_line, bottom_line)
+        + done.missing(bottom_line + 1, min(total_lines, bottom_line + margin))
+        + done.missing(max(1, top_line - margin), top_line - 1)
+    )
+
+
+def run_json_view_highlight_slice(owner: Any) -> None:
+    """Tag pending viewport chunks until the slice budget runs out, then yield to Tk."""
+    owner._json_lock_apply_after_id = None
+    state = getattr(owner, "_json_view_highlight_state", None)
+    if not isinstance(state, dict):
+        return
+    if int(getattr(owner, "_json_render_seq", 0) or 0) != int(state.get("render_seq", -1)):
+        return
+    if isinstance(getattr(owner, "_json_bulk_paste", None), dict):
+        # Line numbers move under an in-flight paste; its finish re-schedules this pass.
+        return
+    path = state["path"]
+    done = state["done"]
+    deadline = time.perf_counter() + JSON_VIEW_HIGHLIGHT_SLICE_MS / 1000.0
+    for first_line, last_line in pending_json_view_highlight_ranges(owner, state):
+        pos = first_line
+        while pos <= last_line:
+            chunk_last = min(last_line, pos + JSON_VIEW_HIGHLIGHT_CHUNK_LINES - 1)
+            line_range = (pos, chunk_last)
+            owner._apply_json_view_key_highlights(path, line_range=line_range)
+            owner._apply_json_view_value_highlights(path, line_range=line_range)
+            done.add(pos, chunk_last)
+            pos = chunk_last + 1
+            if time.perf_counter() >= deadline:
+                schedule_json_view_viewport_highlight(owner)
+                return
+
+
+def schedule_json_view_viewport_highlight(owner: Any, event: Any=None) -> None:
+    """Queue the next highlight slice; scroll and resize reuse the pending tick."""
+    if not isinstance(getattr(owner, "_json_view_highlight_state", None), dict):
+        return
+    if getattr(owner, "_json_lock_apply_after_id", None):
+        return
+    try:
+        owner._json_lock_apply_after_id = owner.root.after(1, lambda: run_json_view_highlight_slice(owner))
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
         owner._json_lock_apply_after_id = None
-        if int(getattr(owner, "_json_render_seq", 0) or 0) != expected_seq:
+
+# --- Paged array view helpers ---
+"""Giant arrays render one window of elements between placeholder strings; edits splice back by offset."""
+
+JSON_PAGED_ARRAY_MIN_ITEMS = 2000
+JSON_PAGED_ARRAY_PAGE_ITEMS = 500
+
+
+def json_page_placeholder(hidden: int, before: bool) -> str:
+    side = "earlier" if before else "later"
+    return f"... {int(hidden)} {side} items hidden (double-click to show more) ..."
+
+
+def paged_json_view_value(owner: Any, value: Any, path: Any) -> tuple[Any, dict[str, Any] | None]:
+    """Return (value to render, page state); page state is None for whole-value renders."""
+    if not isinstance(value, list) or len(value) < JSON_PAGED_ARRAY_MIN_ITEMS:
+        return value, None
+    use_path = list(path or [])
+    try:
+        # Group selections render a derived list; only the node value itself can map edits back.
+        if owner._get_value(use_path) is not value:
+            return value, None
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        return value, None
+    total = len(value)
+    start, count = 0, JSON_PAGED_ARRAY_PAGE_ITEMS
+    window = getattr(owner, "_json_view_page_window", None)
+    if isinstance(window, dict) and window.get("path") == use_path:
+        start = int(window.get("start", 0))
+        count = int(window.get("count", count))
+    start = max(0, min(start, total))
+    end = max(start, min(total, start + max(1, count)))
+    page = {"path": use_path, "start": start, "end": end, "total": total}
+    render_value = list(value[start:end])
+    if start > 0:
+        render_value.insert(0, json_page_placeholder(start, before=True))
+    if end < total:
+        render_value.append(json_page_placeholder(total - end, before=False))
+    return render_value, page
+
+
+def expand_paged_json_edit(owner: Any, path: Any, new_value: Any, page: Any=None, current: Any=None) -> tuple[bool, Any]:
+    """Map a parsed page edit onto the full array; returns (ok, full value or status message)."""
+    if page is None:
+        page = getattr(owner, "_json_view_page", None)
+    if not isinstance(page, dict) or page.get("path") != list(path or []):
+        return True, new_value
+    start, end, total = int(page["start"]), int(page["end"]), int(page["total"])
+    if not isinstance(new_value, list):
+        return False, "Paged array view: the edit must stay a JSON array."
+    middle = list(new_value)
+    if start > 0:
+        if not middle or middle[0] != json_page_placeholder(start, before=True):
+            return False, "Paged array view: keep the hidden-items placeholder lines unchanged."
+        middle = middle[1:]
+    if end < total:
+        if not middle or middle[-1] != json_page_placeholder(total - end, before=False):
+            return False, "Paged array view: keep the hidden-items placeholder lines unchanged."
+        middle = middle[:-1]
+    if current is None:
+        try:
+            current = owner._get_value(list(path or []))
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+            return False, "Paged array view: the array changed; reselect the node."
+    if not isinstance(current, list) or len(current) != total:
+        return False, "Paged array view: the array changed; reselect the node."
+    page["pending_end"] = start + len(middle)
+    return True, current[:start] + middle + current[end:]
+
+
+def commit_paged_json_edit(owner: Any, path: Any) -> None:
+    """After a successful commit the visible window covers the edited element count."""
+    page = getattr(owner, "_json_view_page", None)
+    if not isinstance(page, dict) or page.get("path") != list(path or []) or "pending_end" not in page:
+        return
+    pending_end = int(page.pop("pending_end"))
+    page["total"] += pending_end - int(page["end"])
+    page["end"] = pending_end
+    owner._json_view_page_window = {
+        "path": list(page["path"]),
+        "start": page["start"],
+        "count": max(1, pending_end - int(page["start"])),
+    }
+
+
+def on_json_page_placeholder_double_click(owner: Any, event: Any=None) -> Any:
+    """Double-clicking a placeholder line widens the window by one page in that direction."""
+    page = getattr(owner, "_json_view_page", None)
+    if not isinstance(page, dict) or event is None:
+        return None
+    snapshot = json_view_text_snapshot(owner, owner.text)
+    if snapshot is None:
+        return None
+    try:
+        line_no = int(str(owner.text.index(f"@{event.x},{event.y}")).split(".", 1)[0])
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        return None
+    line_starts = json_view_snapshot_line_starts(snapshot)
+    if line_no < 1 or line_no > len(line_starts):
+        return None
+    text = str(snapshot.get("text", ""))
+    line_end = line_starts[line_no] - 1 if line_no < len(line_starts) else len(text)
+    line_text = text[line_starts[line_no - 1]:line_end].strip().rstrip(",")
+    start, end, total = int(page["start"]), int(page["end"]), int(page["total"])
+    if start > 0 and line_text == json.dumps(json_page_placeholder(start, before=True), ensure_ascii=False):
+        new_start = max(0, start - JSON_PAGED_ARRAY_PAGE_ITEMS)
+        new_count = end - new_start
+    elif end < total and line_text == json.dumps(json_page_placeholder(total - end, before=False), ensure_ascii=False):
+        new_start = start
+        new_count = min(total, end + JSON_PAGED_ARRAY_PAGE_ITEMS) - start
+    else:
+        return None
+    if "path" not in snapshot:
+        # A re-read snapshot means the page text was edited since it rendered.
+        owner.set_status("Apply Edit before showing more items.")
+        return "break"
+    owner._json_view_page_window = {"path": list(page["path"]), "start": new_start, "count": new_count}
+    try:
+        value = owner._get_value(list(page["path"]))
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        return "break"
+    owner._show_value(value, path=list(page["path"]))
+    owner.set_status(f"Showing items {new_start}-{new_start + new_count - 1} of {total}")
+    return "break"
+
+# --- Progressive render helpers ---
+"""Large nodes insert one screenful synchronously and append the rest in timed after() chunks."""
+
+JSON_PROGRESSIVE_RENDER_MIN_CHARS = 256 * 1024
+JSON_PROGRESSIVE_RENDER_CHUNK_LINES = 2000
+JSON_PROGRESSIVE_RENDER_SLICE_MS = 12
+
+
+def progressive_json_render_head_end(owner: Any, snapshot: dict[str, Any]) -> int | None:
+    """Offset ending the synchronous first screenful, or None when the node is small enough to insert whole."""
+    text = str(snapshot.get("text", ""))
+    if len(text) < JSON_PROGRESSIVE_RENDER_MIN_CHARS:
+        return None
+    line_starts = json_view_snapshot_line_starts(snapshot)
+    head_lines = int(initial_highlight_line_limit(owner)) + JSON_VIEW_HIGHLIGHT_MARGIN_LINES
+    if head_lines >= len(line_starts):
+        return None
+    snapshot["loaded_lines"] = head_lines
+    return line_starts[head_lines]
+
+
+def start_progressive_json_render(owner: Any, snapshot: dict[str, Any], head_end: int, cached: Any=None) -> None:
+    owner._json_progressive_render = {
+        "render_seq": int(snapshot.get("render_seq", 0)),
+        "snapshot": snapshot,
+        "offset": int(head_end),
+        "cached": cached,
+    }
+    schedule_progressive_json_render(owner)
+
+
+def schedule_progressive_json_render(owner: Any) -> None:
+    try:
+        owner._json_progressive_render_after_id = owner.root.after(1, lambda: run_progressive_json_render_slice(owner))
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        owner._json_progressive_render_after_id = None
+
+
+def cancel_progressive_json_render(owner: Any) -> None:
+    """Drop an in-flight progressive render; a newer selection owns the widget now."""
+    owner._json_progressive_render = None
+    after_id = getattr(owner, "_json_progressive_render_after_id", None)
+    owner._json_progressive_render_after_id = None
+    if not after_id:
+        return
+    try:
+        owner.root.after_cancel(after_id)
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+
+
+def run_progressive_json_render_slice(owner: Any) -> None:
+    """Append line-aligned chunks until the slice budget runs out."""
+    owner._json_progressive_render_after_id = None
+    state = getattr(owner, "_json_progressive_render", None)
+    if not isinstance(state, dict):
+        return
+    snapshot = state["snapshot"]
+    if int(getattr(owner, "_json_render_seq", 0) or 0) != state["render_seq"]:
+        owner._json_progressive_render = None
+        return
+    text = str(snapshot.get("text", ""))
+    line_starts = json_view_snapshot_line_starts(snapshot)
+    text_widget = owner.text
+    deadline = time.perf_counter() + JSON_PROGRESSIVE_RENDER_SLICE_MS / 1000.0
+    try:
+        text_widget.configure(state="normal")
+        while state["offset"] < len(text):
+            loaded_lines = int(snapshot.get("loaded_lines") or len(line_starts))
+            next_lines = loaded_lines + JSON_PROGRESSIVE_RENDER_CHUNK_LINES
+            end = line_starts[next_lines] if next_lines < len(line_starts) else len(text)
+            text_widget.insert("end-1c", text[state["offset"]:end])
+            state["offset"] = end
+            snapshot["loaded_lines"] = min(next_lines, len(line_starts))
+            if time.perf_counter() >= deadline:
+                break
+        # Appends are part of the render, not user edits: keep undo empty and the snapshot clean.
+        text_widget.edit_reset()
+        text_widget.edit_modified(False)
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        owner._json_progressive_render = None
+        return
+    finally:
+        if state["offset"] < len(text):
+            owner._set_json_text_editable(False)
+    if state["offset"] < len(text):
+        schedule_progressive_json_render(owner)
+        schedule_json_view_viewport_highlight(owner)
+        return
+    finish_progressive_json_render(owner, state)
+
+
+def finish_progressive_json_render(owner: Any, state: dict[str, Any]) -> None:
+    owner._json_progressive_render = None
+    snapshot = state["snapshot"]
+    snapshot["loaded_lines"] = None
+    owner._set_json_text_editable(True)
+    cached = state.get("cached")
+    if cached is not None:
+        replay_json_view_render(owner, snapshot.get("path") or [], cached, render_seq=state["render_seq"])
+    else:
+        schedule_json_view_viewport_highlight(owner)
+
+# --- Bulk paste helpers ---
+"""Large pastes go into the JSON view in timed chunks at a private mark, then re-highlight only the pasted lines."""
+
+JSON_BULK_PASTE_MIN_CHARS = 64 * 1024
+JSON_BULK_PASTE_CHUNK_CHARS = 16 * 1024
+JSON_BULK_PASTE_SLICE_MS = 12
+JSON_BULK_PASTE_MARK = "json_bulk_paste"
+
+
+def start_bulk_json_paste(owner: Any, payload: str) -> bool:
+    """Begin a chunked paste at the caret; False means the payload is small enough to insert directly."""
+    if len(payload) < JSON_BULK_PASTE_MIN_CHARS:
+        return False
+    cancel_bulk_json_paste(owner)
+    text_widget = owner.text
+    snapshot = json_view_text_snapshot(owner, text_widget)
+    try:
+        start_index = str(text_widget.index("insert"))
+        text_widget.mark_set(JSON_BULK_PASTE_MARK, "insert")
+        text_widget.mark_gravity(JSON_BULK_PASTE_MARK, "right")
+        # One undo step for the whole paste, however many slices it takes.
+        text_widget.edit_separator()
+        text_widget.configure(autoseparators=False)
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        return False
+    offset = None
+    if snapshot is not None:
+        line_no, col = (int(part) for part in start_index.split(".", 1))
+        line_starts = json_view_snapshot_line_starts(snapshot)
+        if line_no <= len(line_starts):
+            offset = line_starts[line_no - 1] + col
+    owner._json_bulk_paste = {
+        "render_seq": int(getattr(owner, "_json_render_seq", 0) or 0),
+        "payload": payload,
+        "pos": 0,
+        "start_index": start_index,
+        "snapshot": snapshot,
+        "offset": offset,
+    }
+    run_bulk_json_paste_slice(owner)
+    return True
+
+
+def schedule_bulk_json_paste(owner: Any) -> None:
+    try:
+        owner._json_bulk_paste_after_id = owner.root.after(1, lambda: run_bulk_json_paste_slice(owner))
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        owner._json_bulk_paste_after_id = None
+
+
+def cancel_bulk_json_paste(owner: Any) -> None:
+    """Stop an in-flight paste (already inserted chunks stay) and restore undo separators."""
+    state = getattr(owner, "_json_bulk_paste", None)
+    owner._json_bulk_paste = None
+    after_id = getattr(owner, "_json_bulk_paste_after_id", None)
+    owner._json_bulk_paste_after_id = None
+    if after_id:
+        try:
+            owner.root.after_cancel(after_id)
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+    if isinstance(state, dict):
+        try:
+            owner.text.configure(autoseparators=True)
+            owner.text.mark_unset(JSON_BULK_PASTE_MARK)
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+
+
+def run_bulk_json_paste_slice(owner: Any) -> None:
+    """Insert chunks at the paste mark until the slice budget runs out, keeping the snapshot in step."""
+    owner._json_bulk_paste_after_id = None
+    state = getattr(owner, "_json_bulk_paste", None)
+    if not isinstance(state, dict):
+        return
+    if int(getattr(owner, "_json_render_seq", 0) or 0) != state["render_seq"]:
+        cancel_bulk_json_paste(owner)
+        return
+    payload = state["payload"]
+    slice_start = state["pos"]
+    text_widget = owner.text
+    deadline = time.perf_counter() + JSON_BULK_PASTE_SLICE_MS / 1000.0
+    try:
+        text_widget.configure(state="normal")
+        while state["pos"] < len(payload):
+            end = min(len(payload), state["pos"] + JSON_BULK_PASTE_CHUNK_CHARS)
+            if end < len(payload):
+                # Line-aligned chunks keep Tk's line index work per insert small.
+                newline = payload.rfind("\n", state["pos"], end)
+                if newline > state["pos"]:
+                    end = newline + 1
+            text_widget.insert(JSON_BULK_PASTE_MARK, payload[state["pos"]:end])
+            state["pos"] = end
+            if time.perf_counter() >= deadline:
+                break
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        cancel_bulk_json_paste(owner)
+        return
+    finally:
+        if isinstance(getattr(owner, "_json_bulk_paste", None), dict) and state["pos"] < len(payload):
+            owner._set_json_text_editable(False)
+    _follow_bulk_json_paste_slice(owner, state, payload[slice_start:state["pos"]])
+    if state["pos"] < len(payload):
+        schedule_bulk_json_paste(owner)
+        return
+    finish_bulk_json_paste(owner, state)
+
+
+def _follow_bulk_json_paste_slice(owner: Any, state: dict[str, Any], inserted: str) -> None:
+    snapshot = state["snapshot"]
+    text_widget = owner.text
+    if snapshot is not None and state["offset"] is not None and getattr(owner, "_json_view_text_snapshot", None) is snapshot:
+        offset = state["offset"]
+        snapshot["pending_edit"] = (offset, offset, inserted, JSON_BULK_PASTE_MARK)
+        if apply_pending_json_text_edit(snapshot, text_widget):
+            state["offset"] = offset + len(inserted)
+        else:
+            snapshot["dirty"] = True
+            state["offset"] = None
+    try:
+        # The snapshot already follows this slice; the queued <<Modified>> must not mark it dirty.
+        text_widget.edit_modified(False)
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+
+
+def finish_bulk_json_paste(owner: Any, state: dict[str, Any]) -> None:
+    owner._json_bulk_paste = None
+    text_widget = owner.text
+    owner._set_json_text_editable(True)
+    try:
+        end_index = str(text_widget.index(JSON_BULK_PASTE_MARK))
+        text_widget.mark_set("insert", JSON_BULK_PASTE_MARK)
+        text_widget.mark_unset(JSON_BULK_PASTE_MARK)
+        text_widget.edit_separator()
+        text_widget.configure(autoseparators=True)
+        # Inserted text inherits tags shared by both neighbours; drop them before re-highlighting.
+        for tag_name in JSON_VIEW_HIGHLIGHT_TAGS:
+            text_widget.tag_remove(tag_name, state["start_index"], end_index)
+        text_widget.see("insert")
+    except EXPECTED_ERRORS as exc:
+        _LOG.debug('expected_error', exc_info=exc)
+        return
+    owner._auto_apply_pending = True
+    highlight_state = getattr(owner, "_json_view_highlight_state", None)
+    if not isinstance(highlight_state, dict):
+        return
+    first_line = int(state["start_index"].split(".", 1)[0])
+    added_lines = int(end_index.split(".", 1)[0]) - first_line
+    # Only the pasted lines lose coverage; the viewport slices re-tag them as they come into view.
+    highlight_state["done"].insert_lines(first_line, added_lines)
+    schedule_json_view_viewport_highlight(owner)
+
+# --- JSON render cache helpers ---
+"""Byte-budgeted LRU of rendered node text plus tag ranges, replayed on re-selection without lexing."""
+
+import sys
+from collections import OrderedDict
+
+JSON_RENDER_CACHE_BUDGET_BYTES = 32 * 1024 * 1024
+# Rough retained size of one Tk index string ("1234.56") kept in a tag-range list.
+JSON_RENDER_CACHE_INDEX_BYTES = 64
+JSON_VIEW_HIGHLIGHT_TAGS = (
+    "json_brace_token",
+    "json_bracket_token",
+    "json_bool_true",
+    "json_bool_false",
+    "json_value_green",
+    "json_property_key",
+    "json_locked_key",
+    "json_xy_key",
+)
+_JSON_RENDER_REPLAY_MAX_INDEXES_PER_CALL = 40000
+
+
+class JsonRenderCacheEntry:
+    """Rendered text, line offsets and highlight tag ranges for one node value."""
+
+    __slots__ = ("value", "text", "line_starts", "tag_ranges", "done", "nbytes")
+
+    def __init__(self, value: Any, text: str, line_starts: Any, tag_ranges: dict[str, list[str]], done: Any) -> None:
+        self.value = value
+        self.text = text
+        self.line_starts = line_starts
+        self.tag_ranges = tag_ranges
+        self.done = done
+        index_count = sum(len(indexes) for indexes in tag_ranges.values())
+        index_count += len(line_starts or ())
+        self.nbytes = sys.getsizeof(text) + index_count * JSON_RENDER_CACHE_INDEX_BYTES
+
+
+class JsonRenderCache:
+    """LRU keyed by node path; entries are valid while the node value object is unchanged."""
+
+    def __init__(self, budget_bytes: int = JSON_RENDER_CACHE_BUDGET_BYTES) -> None:
+        self.budget_bytes = int(budget_bytes)
+        self.total_bytes = 0
+        self.entries: "OrderedDict[tuple[Any, ...], JsonRenderCacheEntry]" = OrderedDict()
+
+    def get(self, path: Any, value: Any) -> JsonRenderCacheEntry | None:
+        key = tuple(path or ())
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry.value is not value:
+            self.discard(key)
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, path: Any, entry: JsonRenderCacheEntry) -> None:
+        key = tuple(path or ())
+        self.discard(key)
+        if entry.nbytes > self.budget_bytes // 4:
             return
-        owner._apply_json_view_key_highlights(snapshot_path)
-        owner._apply_json_view_value_highlights(snapshot_path)
+        self.entries[key] = entry
+        self.total_bytes += entry.nbytes
+        while self.total_bytes > self.budget_bytes and self.entries:
+            _old_key, old_entry = self.entries.popitem(last=False)
+            self.total_bytes -= old_entry.nbytes
+
+    def discard(self, key: tuple[Any, ...]) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.nbytes
+
+    def invalidate(self, path: Any=None) -> None:
+        """Drop entries for path, its ancestors and its descendants; everything when path is None."""
+        if path is None:
+            self.entries.clear()
+            self.total_bytes = 0
+            return
+        edited = tuple(path)
+        size = len(edited)
+        for key in list(self.entries):
+            common = min(size, len(key))
+            if key[:common] == edited[:common]:
+                self.discard(key)
+
+
+def json_render_cache(owner: Any) -> JsonRenderCache:
+    cache = getattr(owner, "_json_render_cache", None)
+    if not isinstance(cache, JsonRenderCache):
+        cache = JsonRenderCache()
+        owner._json_render_cache = cache
+    return cache
+
 
+def invalidate_json_render_cache(owner: Any, path: Any=None) -> None:
+    """Called from value commits (path) and document loads (None)."""
+    cache = getattr(owner, "_json_render_cache", None)
+    if isinstance(cache, JsonRenderCache):
+        cache.invalidate(None if path is None else list(path))
+
+
+def remember_json_view_render(owner: Any) -> None:
+    """Capture the outgoing node's text and tag ranges when the view is still an untouched render."""
+    snapshot = getattr(owner, "_json_view_text_snapshot", None)
+    state = getattr(owner, "_json_view_highlight_state", None)
+    text_widget = getattr(owner, "text", None)
+    if not isinstance(snapshot, dict) or not isinstance(state, dict) or text_widget is None:
+        return
+    if "value" not in snapshot or snapshot.get("dirty") or snapshot.get("widget") is not text_widget:
+        return
+    render_seq = int(getattr(owner, "_json_render_seq", 0) or 0)
+    if int(snapshot.get("render_seq", -1)) != render_seq or int(state.get("render_seq", -1)) != render_seq:
+        return
+    if str(getattr(owner, "_editor_mode", "JSON")).upper() != "JSON":
+        return
+    path = snapshot.get("path") or []
+    value = snapshot.get("value")
     try:
-        owner._json_lock_apply_after_id = owner.root.after_idle(_apply_pending)
+        if text_widget.edit_modified():
+            return
+        # Group views render a fresh item list; only whole-node values can be re-selected by identity.
+        if owner._get_value(path) is not value:
+            return
+        tag_ranges = {
+            tag: [str(index) for index in text_widget.tag_ranges(tag)]
+            for tag in JSON_VIEW_HIGHLIGHT_TAGS
+        }
     except EXPECTED_ERRORS as exc:
         _LOG.debug('expected_error', exc_info=exc)
-        owner._json_lock_apply_after_id = None
-        owner._apply_json_view_key_highlights(snapshot_path)
-        owner._apply_json_view_value_highlights(snapshot_path)
+        return
+    done = LineIntervalSet()
+    done.starts = list(state["done"].starts)
+    done.ends = list(state["done"].ends)
+    entry = JsonRenderCacheEntry(value, str(snapshot.get("text", "")), snapshot.get("line_starts"), tag_ranges, done)
+    json_render_cache(owner).put(path, entry)
+
 
+def replay_json_view_render(owner: Any, path: Any, entry: JsonRenderCacheEntry, render_seq: Any=None) -> None:
+    """Re-apply cached tag ranges and resume viewport slices only for lines never tagged."""
+    text_widget = owner.text
+    step = _JSON_RENDER_REPLAY_MAX_INDEXES_PER_CALL
+    for tag_name, indexes in entry.tag_ranges.items():
+        for pos in range(0, len(indexes), step):
+            try:
+                text_widget.tag_add(tag_name, *indexes[pos:pos + step])
+            except EXPECTED_ERRORS as exc:
+                _LOG.debug('expected_error', exc_info=exc)
+                break
+    reset_json_view_highlight_state(owner, path, render_seq=render_seq)
+    done = owner._json_view_highlight_state["done"]
+    done.starts = list(entry.done.starts)
+    done.ends = list(entry.done.ends)
+    run_json_view_highlight_slice(owner)
 
 # --- Merged from json_view_service.py ---
 from typing import Any
@@ -740,6 +740,8 @@ def _apply_input_edit(owner: Any):
         owner.data = working_root
         owner._clear_input_group_selection_cache()
         owner._reset_find_state()
+        owner._invalidate_json_find_disk_index()
+        owner._invalidate_json_render_cache(list(path or []))
         owner._log_input_mode_apply_result(path, changed)
         owner._log_input_mode_apply_trace("applied", path, len(specs), changed=changed)
         if owner._is_bank_input_style_path(path):
@@ -762,6 +764,10 @@ def apply_edit(owner: Any):
             if callable(status_setter):
                 status_setter(str(message or ""))
 
+        if getattr(owner, "_json_progressive_render", None) is not None:
+            # The widget still holds only the head of a large node; applying it would truncate the value.
+            _set_status("Still loading this node. Apply once it has finished rendering.")
+            return
         item_id = owner.tree.focus()
         if not item_id:
             _set_status("Select a node in the tree.")
@@ -776,33 +782,47 @@ def apply_edit(owner: Any):
             return
 
         raw = owner.text.get("1.0", "end").strip()
-        is_valid_input, input_reason = validation_service.validate_editor_text_payload(raw)
-        if not is_valid_input:
-            _set_status(str(input_reason or "Invalid editor input."))
-            return
-        try:
-            new_value = json.loads(raw)
-        except EXPECTED_ERRORS as exc:
-            corrected_raw = validation_service.autocorrect_boolean_literal_payload(
-                raw,
-                error_lineno=getattr(exc, "lineno", None),
-            )
-            if corrected_raw == raw:
-                _set_status(owner._format_json_error(exc))
+        if not owner._auto_apply_in_progress:
+            # Batch-fix every spacing/phone/missing-@ issue the background lint marked in this buffer.
+            raw = json_diagnostics_service.apply_json_lint_fixes(owner, raw)
+        # Auto-apply reuses the background worker's parse when it validated exactly this text.
+        prepared, new_value = validation_service.take_auto_apply_verdict(owner, raw)
+        if not prepared:
+            is_valid_input, input_reason = validation_service.validate_editor_text_payload(raw)
+            if not is_valid_input:
+                _set_status(str(input_reason or "Invalid editor input."))
                 return
             try:
-                new_value = json.loads(corrected_raw)
-                raw = corrected_raw
-            except EXPECTED_ERRORS as parse_exc:
-                _set_status(owner._format_json_error(parse_exc))
-                return
-            try:
-                owner.text.delete("1.0", "end")
-                owner.text.insert("1.0", raw)
-            except EXPECTED_ERRORS as text_exc:
-                _LOG.debug('expected_error', exc_info=text_exc)
-                pass
+                known, parse_error = owner._known_incremental_json_parse_error(raw)
+                if known and parse_error is not None:
+                    # The live parser already holds this exact buffer; its error matches json.loads.
+                    raise parse_error
+                new_value = json.loads(raw)
+            except EXPECTED_ERRORS as exc:
+                corrected_raw = validation_service.autocorrect_boolean_literal_payload(
+                    raw,
+                    error_lineno=getattr(exc, "lineno", None),
+                )
+                if corrected_raw == raw:
+                    _set_status(owner._format_json_error(exc))
+                    return
+                try:
+                    new_value = json.loads(corrected_raw)
+                    raw = corrected_raw
+                except EXPECTED_ERRORS as parse_exc:
+                    _set_status(owner._format_json_error(parse_exc))
+                    return
+                try:
+                    owner.text.delete("1.0", "end")
+                    owner.text.insert("1.0", raw)
+                except EXPECTED_ERRORS as text_exc:
+                    _LOG.debug('expected_error', exc_info=text_exc)
+                    pass
         owner._clear_json_error_highlight()
+        paged_ok, new_value = json_view_service.expand_paged_json_edit(owner, path, new_value)
+        if not paged_ok:
+            _set_status(str(new_value))
+            return
 
         if not owner._is_json_edit_allowed(path, new_value, show_feedback=True, auto_restore=True):
             return
@@ -810,6 +830,7 @@ def apply_edit(owner: Any):
         if not owner._is_edit_allowed(path, new_value):
             return
         json_apply_commit_service.commit_json_edit(owner, item_id, path, new_value)
+        json_view_service.commit_paged_json_edit(owner, path)
 
 
 def _set_startup_loader_bar_fill(fill_widget, pct):
@@ -901,28 +922,11 @@ def export_hhsave(owner: Any):
         owner.set_status(str(getattr(owner, "STATUS_EXPORTED_HHSAV", "Exported .hhsav")))
 
 
-def _apply_json_view_key_highlights(owner: Any, path, line_limit=None):
+def _apply_json_view_key_highlights(owner: Any, path, line_limit=None, line_range=None):
         if str(getattr(owner, "_editor_mode", "JSON")).upper() != "JSON":
             return
-        owner._tag_json_brace_tokens(line_limit=line_limit)
-        owner._tag_json_boolean_literals(line_limit=line_limit)
-        owner._tag_json_property_keys(line_limit=line_limit)
-        use_path = list(path or [])
-        xy_keys = ("x", "y") if len(use_path) == 1 else ()
-        dimension_keys = ("width", "height")
-        locked_path = bool(highlight_label_service.is_locked_field_path(use_path))
-        locked_fields = tuple(highlight_label_service.locked_highlight_fields_for_path(use_path))
-        if not locked_path:
-            if owner._should_batch_tag_locked_keys(locked_fields):
-                owner._tag_json_key_occurrences_batch(locked_fields, xy_key_names=xy_keys, line_limit=line_limit)
-            else:
-                for coord_key in xy_keys:
-                    owner._tag_json_xy_key_occurrences(coord_key)
-                for field_name in locked_fields:
-                    owner._tag_json_locked_key_occurrences(field_name)
-        for dim_key in dimension_keys:
-            owner._tag_json_xy_key_occurrences(dim_key)
-        owner._tag_json_string_value_literals(line_limit=line_limit)
+        # One lexer pass covers brace/bool/key/locked/xy/dimension/value tags.
+        owner._tag_json_highlight_tokens(path, line_limit=line_limit, line_range=line_range)
 
 
 def _apply_startup_loader_title_variant(owner: Any):
@@ -1056,7 +1060,7 @@ def _handle_threading_excepthook(owner: Any, args):
         )
 
 
-def _apply_json_view_value_highlights(owner: Any, path):
+def _apply_json_view_value_highlights(owner: Any, path, line_range=None):
         if str(getattr(owner, "_editor_mode", "JSON")).upper() != "JSON":
             return
         use_path = list(path or [])
@@ -1068,7 +1072,12 @@ def _apply_json_view_value_highlights(owner: Any, path):
                 continue
             ignore_case = bool(rule.get("ignore_case", False))
             for literal in tuple(rule.get("values") or ()):
-                owner._tag_json_locked_value_occurrences(field_name, literal, ignore_case=ignore_case)
+                owner._tag_json_locked_value_occurrences(
+                    field_name,
+                    literal,
+                    ignore_case=ignore_case,
+                    line_range=line_range,
+                )
 
 
 def load_document_payload(path: Any) -> Any:
@@ -1080,11 +1089,14 @@ def apply_loaded_document(owner: Any, path: Any, data: Any) -> Any:
         """Apply loaded document payload to editor state and refresh dependent UI surfaces."""
         owner.data = data
         owner._clear_input_group_selection_cache()
+        owner._invalidate_json_render_cache()
+        owner._json_view_page_window = None
         owner.path = path
         owner.root.title(
             f"SIINDBAD's HackHub Editor - {os.path.basename(path)} - v{owner.APP_VERSION}"
         )
         owner._rebuild_tree()
+        owner._prepare_json_find_disk_index(path)
         # Post-open responsiveness: ensure all theme variants are warmed so
         # switching themes immediately after file load does not cold-start.
         if getattr(owner, "_startup_loader_ready_ts", None) is not None:
@@ -1261,8 +1273,11 @@ def _show_json_no_file_message(owner: Any):
         text = getattr(owner, "text", None)
         if text is None:
             return
+        json_view_service.cancel_progressive_json_render(owner)
+        json_view_service.cancel_bulk_json_paste(owner)
         owner._set_json_text_editable(True)
         owner._clear_json_lock_highlight()
+        owner._json_view_text_snapshot = None
         json_view_service.show_json_no_file_message(text)
 
 
@@ -1310,6 +1325,8 @@ def _set_value(owner: Any, path, new_value):
         owner.data = json_path_service.set_value(owner.data, path, new_value)
         owner._clear_input_group_selection_cache()
         owner._reset_find_state()
+        owner._invalidate_json_find_disk_index()
+        owner._invalidate_json_render_cache(path)
 
 
 def _show_error_overlay(owner: Any, title, message, actions=None):
@@ -1,5 +1,6 @@
 import copy
 import difflib
+from collections import OrderedDict
 from typing import Any
 from core.exceptions import EXPECTED_ERRORS
 import logging
@@ -422,6 +423,97 @@ def _compile_policy(raw):
 
 _LOCK_POLICIES = tuple(_compile_policy(item) for item in LOCK_POLICY_REGISTRY)
 
+LOCK_PATH_MEMO_SIZE = 4096
+# (policy, locked canonical, matched segment, value rule, value-rule segment, highlight fields, highlight value rules)
+_NO_LOCK_PATH = (None, None, None, None, None, (), ())
+
+
+def _compile_lock_policy_trie(policies):
+    # Root segment -> policy node; deeper segments resolve through the node's locked-key and value-rule maps.
+    # setdefault keeps the first policy per root/field, matching the old first-match linear scans.
+    trie = {}
+    for policy in policies:
+        value_rules = {}
+        for rule in policy.get("locked_value_rules", ()):
+            value_rules.setdefault(rule.get("field_lookup", ""), rule)
+        node = {"policy": policy, "locked": policy.get("locked_lookup", {}), "value_rules": value_rules}
+        for root_key in policy.get("root_lookup", {}):
+            trie.setdefault(root_key, node)
+    return trie
+
+
+_LOCK_POLICY_TRIE = _compile_lock_policy_trie(_LOCK_POLICIES)
+
+
+def _resolve_lock_path(parts):
+    if not parts:
+        return _NO_LOCK_PATH
+    node = _LOCK_POLICY_TRIE.get(_normalize_root_key(parts[0]))
+    if node is None:
+        return _NO_LOCK_PATH
+    policy = node["policy"]
+    if len(parts) < 2:
+        return (policy, None, None, None, None, tuple(policy.get("highlight_keys", ())), tuple(policy.get("locked_value_rules", ())))
+    segments = list(parts[1:])
+    lookups = [_normalize_lookup_key(segment) for segment in segments]
+    locked = node["locked"]
+    direct_canonical = locked.get(lookups[0])
+    canonical = matched = None
+    if policy.get("direct_child_lock_only", False):
+        if direct_canonical is not None:
+            canonical, matched = direct_canonical, str(segments[0])
+    else:
+        for segment, lookup in zip(reversed(segments), reversed(lookups)):
+            if lookup in locked:
+                canonical, matched = locked[lookup], str(segment)
+                break
+    rule = rule_field = None
+    value_rules = node["value_rules"]
+    if value_rules:
+        for segment, lookup in zip(reversed(segments), reversed(lookups)):
+            if lookup in value_rules:
+                rule, rule_field = value_rules[lookup], str(segment)
+                break
+    fields = rules = ()
+    if not policy.get("highlight_root_only", False):
+        fields = (direct_canonical,) if canonical is not None and direct_canonical else ()
+        rules = (rule,) if rule is not None else ()
+    return (policy, canonical, matched, rule, rule_field, fields, rules)
+
+
+class LockPathMemo:
+    """LRU of resolved lock answers keyed by tuple(path); on_select, highlight and edit checks repeat the same paths."""
+
+    def __init__(self, maxsize=LOCK_PATH_MEMO_SIZE):
+        self.maxsize = max(1, int(maxsize))
+        self._entries = OrderedDict()
+
+    def lookup(self, path):
+        parts = tuple(path) if path else ()
+        try:
+            entry = self._entries.get(parts)
+        except TypeError:
+            # Unhashable segments are never produced by the tree, but stay correct without caching.
+            return _resolve_lock_path(parts)
+        if entry is not None:
+            self._entries.move_to_end(parts)
+            return entry
+        entry = _resolve_lock_path(parts)
+        self._entries[parts] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_LOCK_PATH_MEMO = LockPathMemo()
+_lock_path_record = _LOCK_PATH_MEMO.lookup
+
 
 def _policy_by_id(policy_id):
     target = str(policy_id or "").strip()
@@ -432,20 +524,12 @@ def _policy_by_id(policy_id):
 
 
 def _policy_for_root_value(root_value):
-    key = _normalize_root_key(root_value)
-    if not key:
-        return None
-    for policy in _LOCK_POLICIES:
-        if key in policy.get("root_lookup", {}):
-            return policy
-    return None
+    node = _LOCK_POLICY_TRIE.get(_normalize_root_key(root_value))
+    return None if node is None else node["policy"]
 
 
 def lock_policy_for_path(path: Any) -> Any:
-    parts = list(path or [])
-    if not parts:
-        return None
-    return _policy_for_root_value(parts[0])
+    return _lock_path_record(path)[0]
 
 
 def _canonical_locked_key_for_policy(policy, key_value):
@@ -484,49 +568,16 @@ def is_locked_root_path(path: Any) -> Any:
 
 
 def is_locked_field_path(path: Any) -> Any:
-    parts = list(path or [])
-    if len(parts) < 2:
-        return False
-    policy = lock_policy_for_path(parts)
-    if policy is None:
-        return False
-    canonical, _matched = _locked_segment_for_parts(policy, parts)
-    return canonical is not None
+    # Canonical is only set under a policy, so no separate policy check is needed.
+    return _lock_path_record(path)[1] is not None
 
 
 def locked_highlight_fields_for_path(path: Any) -> Any:
-    parts = list(path or [])
-    if not parts:
-        return ()
-    policy = lock_policy_for_path(parts)
-    if policy is None:
-        return ()
-    if len(parts) == 1:
-        return tuple(policy.get("highlight_keys", ()))
-    if is_locked_field_path(parts) and not policy.get("highlight_root_only", False):
-        canonical = _canonical_locked_key_for_policy(policy, parts[1])
-        if canonical:
-            return (canonical,)
-    return ()
+    return _lock_path_record(path)[5]
 
 
 def locked_highlight_value_rules_for_path(path: Any) -> Any:
-    parts = list(path or [])
-    if not parts:
-        return ()
-    policy = lock_policy_for_path(parts)
-    if policy is None:
-        return ()
-    rules = tuple(policy.get("locked_value_rules", ()))
-    if not rules:
-        return ()
-    if len(parts) == 1:
-        return rules
-    if not policy.get("highlight_root_only", False):
-        rule, _matched = _locked_value_rule_for_parts(policy, parts)
-        if rule is not None:
-            return (rule,)
-    return ()
+    return _lock_path_record(path)[6]
 
 
 def _dict_get_ignore_case(data, key_name):
@@ -539,6 +590,27 @@ def _dict_get_ignore_case(data, key_name):
     return False, None, None
 
 
+def _ignore_case_index(data):
+    # One pass per object instead of one key scan per locked field; first key wins like _dict_get_ignore_case.
+    index = {}
+    if isinstance(data, dict):
+        for key, value in data.items():
+            index.setdefault(_normalize_lookup_key(key), (key, value))
+    return index
+
+
+def _indexed_get(index, key_name):
+    entry = index.get(_normalize_lookup_key(key_name))
+    if entry is None:
+        return False, None, None
+    return True, entry[0], entry[1]
+
+
+def _same_json_value(left, right):
+    # Identity first: branches shared between the saved and current trees never compare deeply.
+    return left is right or left == right
+
+
 def _find_policy_container(data, policy):
     if not isinstance(data, dict) or not policy:
         return None, None
@@ -610,13 +682,11 @@ def _find_locked_change_for_policy(policy, path, current_value, new_value):
     if policy is None:
         return None
     if parts:
-        path_policy = lock_policy_for_path(parts)
+        path_policy, canonical, matched, value_rule, value_field, _fields, _rules = _lock_path_record(parts)
         if path_policy is None or path_policy.get("id") != policy.get("id"):
             return None
         if len(parts) >= 2:
-            canonical, matched = _locked_segment_for_parts(policy, parts)
             if canonical is None:
-                value_rule, value_field = _locked_value_rule_for_parts(policy, parts)
                 if value_rule is None:
                     return None
                 if current_value != new_value and _value_matches_locked_rule(value_rule, current_value):
@@ -704,6 +774,42 @@ def find_locked_json_change(path: Any, current_value: Any, new_value: Any) -> An
     return None
 
 
+def find_locked_category_drift(root_key: Any, saved_value: Any, current_value: Any) -> Any:
+    """Every locked field of one root category that differs from the saved copy (not just the first)."""
+    policy = lock_policy_for_path([root_key])
+    if policy is None or not isinstance(current_value, dict):
+        return []
+    saved_index = _ignore_case_index(saved_value)
+    current_index = _ignore_case_index(current_value)
+    drift = []
+    seen = set()
+    checks = [(field_name, None) for field_name in policy.get("locked_keys", ())]
+    checks.extend((str(rule.get("field") or "").strip(), rule) for rule in policy.get("locked_value_rules", ()))
+    for field_name, rule in checks:
+        lookup = _normalize_lookup_key(field_name)
+        if not lookup or lookup in seen:
+            continue
+        saved_found, saved_key, saved_field = _indexed_get(saved_index, field_name)
+        found, key, field = _indexed_get(current_index, field_name)
+        if _same_json_value(saved_field, field):
+            continue
+        if rule is not None and not (saved_found and _value_matches_locked_rule(rule, saved_field)):
+            continue
+        seen.add(lookup)
+        drift.append(
+            {
+                "path": [root_key, key if found else (saved_key if saved_found else field_name)],
+                "field": str(key if found else (saved_key if saved_found else field_name)),
+                "saved_found": saved_found,
+                "saved_value": _copy_json_value(saved_field),
+                "found": found,
+                "value": field,
+                "policy": policy,
+            }
+        )
+    return drift
+
+
 def _restore_locked_fields_for_policy_dict(policy, current_obj, edited_obj):
     if not isinstance(edited_obj, dict):
         return False, edited_obj
@@ -807,13 +913,9 @@ def is_appstore_root_path(path: Any) -> Any:
 
 
 def is_appstore_locked_path(path: Any) -> Any:
-    parts = list(path or [])
-    policy = lock_policy_for_path(parts)
+    policy, canonical, _matched, _rule, _rule_field, _fields, _rules = _lock_path_record(path)
     if not (policy and policy.get("id") == "appstore_progression"):
         return False
-    if len(parts) < 2:
-        return False
-    canonical, _matched = _locked_segment_for_parts(policy, parts)
     return canonical is not None
 
 
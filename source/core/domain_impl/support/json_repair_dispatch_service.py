@@ -41,14 +41,14 @@ _EXPECTED_APP_ERRORS = (
 def _json_token_followed_by_colon(owner, end_index, lookahead_chars=24):
     return json_repair_service._json_token_followed_by_colon(owner, end_index, lookahead_chars)
 
-def _tag_json_locked_key_occurrences(owner, key_name):
-    return json_diagnostics_service._tag_json_locked_key_occurrences(owner, key_name)
+def _tag_json_locked_key_occurrences(owner, key_name, line_range=None):
+    return json_diagnostics_service._tag_json_locked_key_occurrences(owner, key_name, line_range)
 
-def _tag_json_xy_key_occurrences(owner, key_name):
-    return json_diagnostics_service._tag_json_xy_key_occurrences(owner, key_name)
+def _tag_json_xy_key_occurrences(owner, key_name, line_range=None):
+    return json_diagnostics_service._tag_json_xy_key_occurrences(owner, key_name, line_range)
 
-def _should_batch_tag_locked_keys(owner, key_names):
-    return json_diagnostics_service._should_batch_tag_locked_keys(owner, key_names)
+def _should_batch_tag_locked_keys(owner, key_names, raw=None):
+    return json_diagnostics_service._should_batch_tag_locked_keys(owner, key_names, raw)
 
 def _tag_json_key_occurrences_batch(owner, locked_key_names, xy_key_names=(), line_limit=None):
     return json_diagnostics_service._tag_json_key_occurrences_batch(owner, locked_key_names, xy_key_names, line_limit)
@@ -56,6 +56,9 @@ def _tag_json_key_occurrences_batch(owner, locked_key_names, xy_key_names=(), li
 def _tag_json_string_value_literals(owner, line_limit=None):
     return json_diagnostics_service._tag_json_string_value_literals(owner, line_limit)
 
+def _tag_json_highlight_tokens(owner, path, line_limit=None, line_range=None):
+    return json_diagnostics_service._tag_json_highlight_tokens(owner, path, line_limit, line_range)
+
 def _tag_json_brace_tokens(owner, line_limit=None):
     return json_diagnostics_service._tag_json_brace_tokens(owner, line_limit)
 
@@ -68,18 +71,18 @@ def _tag_json_property_keys(owner, line_limit=None):
 def _json_literal_offsets_after_key(owner, key_end_index, literal_token, lookahead_chars=120, ignore_case=False):
     return json_diagnostics_service._json_literal_offsets_after_key(owner, key_end_index, literal_token, lookahead_chars, ignore_case)
 
-def _tag_json_locked_value_occurrences(owner, field_name, literal_value, ignore_case=False):
-    return json_diagnostics_service._tag_json_locked_value_occurrences(owner, field_name, literal_value, ignore_case)
+def _tag_json_locked_value_occurrences(owner, field_name, literal_value, ignore_case=False, line_range=None):
+    return json_diagnostics_service._tag_json_locked_value_occurrences(owner, field_name, literal_value, ignore_case, line_range)
 
 def _apply_json_view_lock_state(owner, path):
     return json_diagnostics_service._apply_json_view_lock_state(owner, path)
 
-def _apply_json_view_key_highlights(owner, path, line_limit=None):
+def _apply_json_view_key_highlights(owner, path, line_limit=None, line_range=None):
     # Legacy wiring token kept for regression checks: xy_keys = ("x", "y") if len(use_path) == 1 else ()
-    return editor_purge_service._apply_json_view_key_highlights(owner, path, line_limit)
+    return editor_purge_service._apply_json_view_key_highlights(owner, path, line_limit, line_range)
 
-def _apply_json_view_value_highlights(owner, path):
-    return editor_purge_service._apply_json_view_value_highlights(owner, path)
+def _apply_json_view_value_highlights(owner, path, line_range=None):
+    return editor_purge_service._apply_json_view_value_highlights(owner, path, line_range)
 
 def _describe(owner, value):
     return json_diagnostics_service._describe(owner, value)
@@ -104,7 +107,7 @@ def _maybe_restore_locked_parse_error(owner, path, diag, exc=None):
     return editor_purge_service._maybe_restore_locked_parse_error(owner, path, diag, exc)
 
 def _format_json_error(owner, exc):
-    return json_error_diagnostics_core.format_json_error(owner, exc)
+    return json_diagnostics_service.memoized_format_json_error(owner, exc)
 
 def _example_for_error(owner, exc):
     return json_diagnostics_service._example_for_error(owner, exc)
@@ -538,12 +541,18 @@ def _format_phone(owner, value):
 def _find_phone_format_issue(owner):
     return json_repair_service._find_phone_format_issue(owner)
 
+def _find_phone_format_issue_in_text(owner, text):
+    return json_repair_service._find_phone_format_issue_in_text(owner, text)
+
 def _fix_missing_space_after_colon(owner, line_text):
     return json_repair_service._fix_missing_space_after_colon(owner, line_text)
 
 def _find_json_spacing_issue(owner):
     return json_repair_service._find_json_spacing_issue(owner)
 
+def _find_json_spacing_issue_in_text(owner, text):
+    return json_repair_service._find_json_spacing_issue_in_text(owner, text)
+
 def _find_missing_email_at(owner):
     return json_repair_service._find_missing_email_at(owner)
 
@@ -635,6 +644,12 @@ def _begin_diag_action(owner, action_name):
 def _clear_json_error_highlight(owner):
     return json_diagnostics_service._clear_json_error_highlight(owner)
 
+def _incremental_json_parse_error(owner, raw):
+    return json_diagnostics_service.incremental_json_parse_error(owner, raw)
+
+def _known_incremental_json_parse_error(owner, raw):
+    return json_diagnostics_service.known_incremental_json_parse_error(owner, raw)
+
 _REPAIR_DISPATCH_HANDLERS: dict[str, Callable[..., Any]] = {
     "_json_token_followed_by_colon": _json_token_followed_by_colon,
     "_tag_json_locked_key_occurrences": _tag_json_locked_key_occurrences,
@@ -642,6 +657,7 @@ _REPAIR_DISPATCH_HANDLERS: dict[str, Callable[..., Any]] = {
     "_should_batch_tag_locked_keys": _should_batch_tag_locked_keys,
     "_tag_json_key_occurrences_batch": _tag_json_key_occurrences_batch,
     "_tag_json_string_value_literals": _tag_json_string_value_literals,
+    "_tag_json_highlight_tokens": _tag_json_highlight_tokens,
     "_tag_json_brace_tokens": _tag_json_brace_tokens,
     "_tag_json_boolean_literals": _tag_json_boolean_literals,
     "_tag_json_property_keys": _tag_json_property_keys,
@@ -801,8 +817,10 @@ _REPAIR_DISPATCH_HANDLERS: dict[str, Callable[..., Any]] = {
     "_fix_missing_at": _fix_missing_at,
     "_format_phone": _format_phone,
     "_find_phone_format_issue": _find_phone_format_issue,
+    "_find_phone_format_issue_in_text": _find_phone_format_issue_in_text,
     "_fix_missing_space_after_colon": _fix_missing_space_after_colon,
     "_find_json_spacing_issue": _find_json_spacing_issue,
+    "_find_json_spacing_issue_in_text": _find_json_spacing_issue_in_text,
     "_find_missing_email_at": _find_missing_email_at,
     "_path_targets_email": _path_targets_email,
     "_looks_like_email_candidate": _looks_like_email_candidate,
@@ -833,6 +851,8 @@ _REPAIR_DISPATCH_HANDLERS: dict[str, Callable[..., Any]] = {
     "_log_input_mode_apply_trace": _log_input_mode_apply_trace,
     "_begin_diag_action": _begin_diag_action,
     "_clear_json_error_highlight": _clear_json_error_highlight,
+    "_incremental_json_parse_error": _incremental_json_parse_error,
+    "_known_incremental_json_parse_error": _known_incremental_json_parse_error,
 }
 
 
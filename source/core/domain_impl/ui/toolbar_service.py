@@ -430,10 +430,22 @@ def _build_toolbar_structure(owner: Any, top, inter_button_pad):
         )
         owner.find_entry.pack(fill="none", expand=False, padx=0, pady=(5, 3), ipady=1)
         owner.find_entry.bind("<Return>", owner.find_next)
+        owner.find_entry.bind("<KeyRelease>", owner._schedule_typeahead_find, add="+")
         owner.find_entry.bind("<Button-3>", owner._show_find_entry_context_menu, add="+")
         owner.find_entry.bind("<Shift-F10>", owner._show_find_entry_context_menu, add="+")
         owner.find_entry.bind("<Menu>", owner._show_find_entry_context_menu, add="+")
 
+        owner._find_match_count_label = tk.Label(
+            right_actions,
+            text="",
+            width=11,
+            anchor="e",
+            bd=0,
+            bg=theme.get("bg", "#0f131a"),
+            fg=theme.get("credit_label_fg", "#b5cade"),
+            font=(owner._preferred_mono_family(), 9),
+        )
+        owner._find_match_count_label.pack(side="left", padx=(2, 0))
         find_btn = owner._make_toolbar_button(right_actions, "Find Next", owner.find_next, image_key="find")
         owner._pack_toolbar_control(find_btn, side="left", padx=find_btn_pad)
         owner._find_button_default_padx = find_btn_pad
@@ -339,8 +339,8 @@ def build_ui(owner: Any, tk: Any, ttk: Any) -> Any:
         right, orient="vertical", command=owner.text.yview, style=scroll_style
     )
     text_scroll.pack(fill="y", side="right", pady=(editor_mode_top_inset, 0))
-    owner.text.configure(yscrollcommand=text_scroll.set)
     owner._text_scroll = text_scroll
+    owner.text.configure(yscrollcommand=owner._on_json_text_yscroll)
     owner._build_input_mode_panel(right, scroll_style)
     owner._style_text_widget()
     owner._build_editor_mode_toggle(right)
@@ -356,6 +356,9 @@ def build_ui(owner: Any, tk: Any, ttk: Any) -> Any:
     owner.text.bind("<Button-3>", owner._show_text_context_menu, add="+")
     owner.text.bind("<Shift-F10>", owner._show_text_context_menu, add="+")
     owner.text.bind("<Menu>", owner._show_text_context_menu, add="+")
+    owner.text.bind("<Configure>", owner._schedule_json_find_window_refresh, add="+")
+    owner.text.bind("<<Modified>>", owner._on_json_text_modified, add="+")
+    owner.text.bind("<Double-Button-1>", owner._on_json_page_placeholder_double_click, add="+")
     owner.root.bind("<FocusOut>", owner._on_root_focus_out, add="+")
     owner.root.bind("<FocusIn>", owner._on_root_focus_in, add="+")
     owner.root.bind("<Configure>", owner._on_root_configure, add="+")
@@ -529,6 +532,8 @@ def build_ui(owner: Any, tk: Any, ttk: Any) -> Any:
     owner.root.bind("<Control-plus>", lambda e: owner.increase_font_size())
     owner.root.bind("<Control-equal>", lambda e: owner.increase_font_size())  # Ctrl+= on some keyboards
     owner.root.bind("<Control-minus>", lambda e: owner.decrease_font_size())
+    owner.root.bind("<Control-Shift-F>", lambda e: owner.search_in_folder())
+    owner.root.bind("<Control-Shift-V>", lambda e: owner.validate_save())
 
     all_variants = ("SIINDBAD", "KAMUE", "GLITCH")
     active_variant = str(getattr(owner, "_app_theme_variant", "SIINDBAD")).upper()
@@ -555,3 +560,125 @@ def build_ui(owner: Any, tk: Any, ttk: Any) -> Any:
             )
         if owner._auto_update_startup_enabled():
             owner._schedule_auto_update_check(delay_ms=500)
+
+
+def build_folder_search_window(owner: Any, tk: Any, ttk: Any) -> Any:
+    """Build (or reuse) the cross-save folder search results window."""
+    existing = getattr(owner, "_folder_search_window", None)
+    if existing is not None:
+        try:
+            if existing.winfo_exists():
+                existing.deiconify()
+                existing.lift()
+                return existing
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+    theme = getattr(owner, "_theme", {})
+    window = tk.Toplevel(owner.root)
+    owner._folder_search_window = window
+    window.title("Search in Folder")
+    window.transient(owner.root)
+    window.geometry("760x420")
+    window.configure(bg=theme.get("bg", "#0f131a"))
+
+    def _on_destroy(event: Any) -> None:
+        if event.widget is not window:
+            return
+        owner._cancel_folder_search()
+        owner._folder_search_window = None
+        owner._folder_search_results = None
+        owner._folder_search_status_label = None
+
+    window.bind("<Destroy>", _on_destroy, add="+")
+
+    footer = ttk.Frame(window)
+    footer.pack(fill="x", side="bottom", padx=8, pady=(0, 8))
+    status_label = tk.Label(
+        footer,
+        text="",
+        anchor="w",
+        bg=theme.get("bg", "#0f131a"),
+        fg=theme.get("fg", "#dce8f4"),
+    )
+    status_label.pack(fill="x", side="left", expand=True)
+    ttk.Button(footer, text="Cancel", command=owner._cancel_folder_search).pack(side="right")
+
+    body = ttk.Frame(window)
+    body.pack(fill="both", expand=True, padx=8, pady=8)
+    results = ttk.Treeview(body, columns=("file", "path", "snippet"), show="headings", selectmode="browse")
+    for column, heading, width in (("file", "File", 150), ("path", "Path", 260), ("snippet", "Match", 320)):
+        results.heading(column, text=heading, anchor="w")
+        results.column(column, width=width, anchor="w", stretch=True)
+    v_scroll_style = getattr(owner, "_v_scrollbar_style", "Vertical.TScrollbar")
+    v_scroll = ttk.Scrollbar(body, orient="vertical", command=results.yview, style=v_scroll_style)
+    results.configure(yscrollcommand=v_scroll.set)
+    v_scroll.pack(fill="y", side="right")
+    results.pack(fill="both", expand=True, side="left")
+    results.bind("<Double-1>", lambda _evt: owner._open_selected_folder_search_hit())
+    results.bind("<Return>", lambda _evt: owner._open_selected_folder_search_hit())
+    owner._folder_search_results = results
+    owner._folder_search_status_label = status_label
+    owner._folder_search_hits = {}
+    return window
+
+
+def build_save_validation_window(owner: Any, tk: Any, ttk: Any) -> Any:
+    """Build (or reuse) the whole-save validation results window."""
+    existing = getattr(owner, "_save_validation_window", None)
+    if existing is not None:
+        try:
+            if existing.winfo_exists():
+                existing.deiconify()
+                existing.lift()
+                return existing
+        except EXPECTED_ERRORS as exc:
+            _LOG.debug('expected_error', exc_info=exc)
+    theme = getattr(owner, "_theme", {})
+    window = tk.Toplevel(owner.root)
+    owner._save_validation_window = window
+    window.title("Validate Save")
+    window.transient(owner.root)
+    window.geometry("820x440")
+    window.configure(bg=theme.get("bg", "#0f131a"))
+
+    def _on_destroy(event: Any) -> None:
+        if event.widget is not window:
+            return
+        owner._cancel_save_validation()
+        owner._save_validation_window = None
+        owner._save_validation_results = None
+        owner._save_validation_status_label = None
+
+    window.bind("<Destroy>", _on_destroy, add="+")
+
+    footer = ttk.Frame(window)
+    footer.pack(fill="x", side="bottom", padx=8, pady=(0, 8))
+    status_label = tk.Label(
+        footer,
+        text="",
+        anchor="w",
+        bg=theme.get("bg", "#0f131a"),
+        fg=theme.get("fg", "#dce8f4"),
+    )
+    status_label.pack(fill="x", side="left", expand=True)
+    ttk.Button(footer, text="Cancel", command=owner._cancel_save_validation).pack(side="right")
+    ttk.Button(footer, text="Fix all", command=lambda: owner._fix_save_validation_rows(selected_only=False)).pack(side="right", padx=(0, 6))
+    ttk.Button(footer, text="Fix selected", command=lambda: owner._fix_save_validation_rows(selected_only=True)).pack(side="right", padx=(0, 6))
+
+    body = ttk.Frame(window)
+    body.pack(fill="both", expand=True, padx=8, pady=8)
+    results = ttk.Treeview(body, columns=("path", "rule", "value", "suggested"), show="headings", selectmode="extended")
+    for column, heading, width in (("path", "Path", 260), ("rule", "Rule", 130), ("value", "Value", 190), ("suggested", "Suggested fix", 190)):
+        results.heading(column, text=heading, anchor="w")
+        results.column(column, width=width, anchor="w", stretch=True)
+    v_scroll_style = getattr(owner, "_v_scrollbar_style", "Vertical.TScrollbar")
+    v_scroll = ttk.Scrollbar(body, orient="vertical", command=results.yview, style=v_scroll_style)
+    results.configure(yscrollcommand=v_scroll.set)
+    v_scroll.pack(fill="y", side="right")
+    results.pack(fill="both", expand=True, side="left")
+    results.bind("<Double-1>", lambda _evt: owner._open_selected_save_validation_finding())
+    results.bind("<Return>", lambda _evt: owner._open_selected_save_validation_finding())
+    owner._save_validation_results = results
+    owner._save_validation_status_label = status_label
+    owner._save_validation_findings = {}
+    return window
@@ -267,6 +267,18 @@ def _cancel_scheduled_after_callbacks(self):
         "_input_mode_layout_finalize_after_id",
         "_input_mode_paned_recheck_after_id",
         "_document_load_async_after_id",
+        "_folder_search_after_id",
+        "_save_validation_after_id",
+        "_json_find_window_after_id",
+        "_find_typeahead_after_id",
+        "_find_typeahead_poll_after_id",
+        "_json_lock_apply_after_id",
+        "_json_progressive_render_after_id",
+        "_auto_apply_validate_poll_after_id",
+        "_json_lint_after_id",
+        "_json_lint_poll_after_id",
+        "_json_lint_window_after_id",
+        "_json_bulk_paste_after_id",
     ):
         after_id = getattr(self, attr, None)
         if after_id:
@@ -70,10 +70,18 @@ def find_wrong_closing_symbol_line(
     line_getter: LineGetter,
     lineno: int,
     lookback: int = 2,
+    expected_closer_fn: Optional[Callable[[int, int], Optional[str]]] = None,
 ) -> Optional[Tuple[int, int, int, str, str, str, str]]:
-    """Detect mismatched closing symbol, e.g. `]` when `}` is expected."""
+    """Detect mismatched closing symbol, e.g. `]` when `}` is expected.
+
+    expected_closer_fn(line, col) answers from a prebuilt bracket index; without
+    it each candidate line re-walks the text from line 1.
+    """
     if not lineno:
         return None
+    if expected_closer_fn is None:
+        def expected_closer_fn(ln: int, col: int) -> Optional[str]:
+            return expected_closer_before_position(line_getter, ln, col)
 
     candidates = [max(int(lineno), 1)]
     line = max(int(lineno) - 1, 1)
@@ -101,7 +109,7 @@ def find_wrong_closing_symbol_line(
                 break
         if first_col is None:
             continue
-        expected = expected_closer_before_position(line_getter, ln, first_col)
+        expected = expected_closer_fn(ln, first_col)
         if not expected:
             continue
         found = raw[first_col]
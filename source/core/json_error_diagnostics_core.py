@@ -228,7 +228,7 @@ def format_json_error(owner: Any, exc: Any) -> Any:
             line_text = ""
             if lineno:
                 try:
-                    line_text = owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend").strip()
+                    line_text = owner._line_text(lineno).strip()
                 except EXPECTED_ERRORS as exc:
                     _LOG.debug('expected_error', exc_info=exc)
                     line_text = ""
@@ -277,7 +277,7 @@ def format_json_error(owner: Any, exc: Any) -> Any:
             try:
                 lineno = getattr(exc, "lineno", None)
                 if lineno:
-                    line_text = owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend").strip()
+                    line_text = owner._line_text(lineno).strip()
             except EXPECTED_ERRORS as exc:
                 _LOG.debug('expected_error', exc_info=exc)
                 line_text = ""
@@ -321,7 +321,7 @@ def format_json_error(owner: Any, exc: Any) -> Any:
             try:
                 lineno = getattr(exc, "lineno", None)
                 if lineno:
-                    line_text = owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend").strip()
+                    line_text = owner._line_text(lineno).strip()
             except EXPECTED_ERRORS as exc:
                 _LOG.debug('expected_error', exc_info=exc)
                 line_text = ""
@@ -344,7 +344,7 @@ def format_json_error(owner: Any, exc: Any) -> Any:
             try:
                 lineno = getattr(exc, "lineno", None)
                 if lineno:
-                    line_text = owner.text.get(f"{lineno}.0", f"{lineno}.0 lineend").strip()
+                    line_text = owner._line_text(lineno).strip()
             except EXPECTED_ERRORS as exc:
                 _LOG.debug('expected_error', exc_info=exc)
                 line_text = ""
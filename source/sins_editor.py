@@ -1,7 +1,9 @@
+import concurrent.futures
 import hashlib
 import importlib
 import json
 import logging
+import multiprocessing
 import os
 import platform
 import re
@@ -1198,6 +1200,7 @@ if button._siindbad_base_image is None:
         self._find_entry_edge_line = None
         self._find_entry_inner_edge_line = None
         self.find_entry = None
+        self._find_match_count_label = None
         self.font_size_combo = None
         self.font_size_var = None
 
@@ -1300,6 +1303,8 @@ if button._siindbad_base_image is None:
         self._destroy_text_context_menu()
         self._destroy_input_context_menu()
         self._cancel_scheduled_after_callbacks()
+        json_find_service.cancel_folder_search(self)
+        json_diagnostics_service.cancel_save_validation(self)
         self._active_document_load_request_id = 0
         self._document_load_depth = 0
         self._document_load_in_progress = False
@@ -2356,6 +2361,10 @@ if button._siindbad_base_image is None:
                 self.text.delete("sel.first", "sel.last")
         except _EXPECTED_APP_ERRORS:
             pass
+        if str(getattr(self, "_editor_mode", "JSON")).upper() == "JSON":
+            # Large pastes insert in timed chunks and set auto-apply pending when done.
+            if json_view_render_service.start_bulk_json_paste(self, safe_text):
+                return
         try:
             self.text.insert("insert", safe_text)
             self.text.see("insert")
@@ -3809,6 +3818,9 @@ if button._siindbad_base_image is None:
         self._json_find_window_tag_widget = None
         self._json_find_active_palette_key = None
         self._json_find_window_palette_key = None
+        self._json_find_window_state = None
+        json_find_service.cancel_typeahead_find(self)
+        json_find_service.update_find_match_counter(self, "")
         focus_after_id = getattr(self, "_json_find_focus_after_id", None)
         self._json_find_focus_after_id = None
         if focus_after_id is not None and getattr(self, "root", None) is not None:
@@ -3896,6 +3908,12 @@ if button._siindbad_base_image is None:
 
     def _build_json_find_matches(self, query_lower): return json_find_service.build_json_find_matches(self, query_lower)
 
+    def _prepare_json_find_disk_index(self, path):
+        json_find_service.prepare_json_find_disk_index(self, path)
+
+    def _invalidate_json_find_disk_index(self):
+        json_find_service.invalidate_json_find_disk_index(self)
+
     def _filter_json_find_matches(self, prior_matches, query_lower): return json_find_service.filter_json_find_matches(self, prior_matches, query_lower)
 
     def _find_next_json_text_match(self, query): return json_text_find_service.find_next_json_text_match(self, query)
@@ -3903,9 +3921,79 @@ if button._siindbad_base_image is None:
     def _focus_json_find_match(self, query):
         json_text_find_service.focus_json_find_match(self, query)
 
+    def _schedule_typeahead_find(self, event=None):
+        json_find_service.schedule_typeahead_find(self, event)
+
+    def _on_json_text_yscroll(self, first, last):
+        json_text_find_service.on_json_text_yscroll(self, first, last)
+
+    def _schedule_json_find_window_refresh(self, event=None):
+        json_text_find_service.schedule_json_find_window_refresh(self, event)
+
+    def _on_json_text_modified(self, event=None):
+        json_view_render_service.on_json_text_modified(self, event)
+
+    def _schedule_json_lint(self):
+        json_diagnostics_service.schedule_json_lint(self)
+
+    def _schedule_json_lint_window_refresh(self):
+        json_diagnostics_service.schedule_json_lint_window_refresh(self)
+
     def _clear_json_find_highlight_on_nav(self, event):
         json_text_find_service.clear_json_find_highlight_on_nav(self, event)
 
+    def search_in_folder(self, event=None): return json_find_service.search_in_folder(
+            self,
+            filedialog_module=filedialog,
+            executor_factory=concurrent.futures.ProcessPoolExecutor,
+            threading_module=threading,
+            expected_errors=_EXPECTED_APP_ERRORS,
+        )
+
+    def _build_folder_search_window(self): return ui_build_service.build_folder_search_window(self, tk=tk, ttk=ttk)
+
+    def _on_folder_search_rows(self, rows, error_file="", error_text=""):
+        json_find_service.append_folder_search_rows(self, rows, error_file=error_file, error_text=error_text)
+
+    def _on_folder_search_progress(self, finished, total, hit_count, done):
+        json_find_service.update_folder_search_progress(self, finished, total, hit_count, done)
+
+    def _cancel_folder_search(self):
+        json_find_service.cancel_folder_search_from_ui(self)
+
+    def _open_selected_folder_search_hit(self): return json_find_service.open_selected_folder_search_hit(
+            self,
+            expected_errors=_EXPECTED_APP_ERRORS,
+        )
+
+    def validate_save(self, event=None): return json_diagnostics_service.validate_save(
+            self,
+            executor_factory=concurrent.futures.ProcessPoolExecutor,
+            expected_errors=_EXPECTED_APP_ERRORS,
+        )
+
+    def _build_save_validation_window(self): return ui_build_service.build_save_validation_window(self, tk=tk, ttk=ttk)
+
+    def _on_save_validation_rows(self, findings, error_root="", error_text=""):
+        json_diagnostics_service.append_save_validation_rows(self, findings, error_root=error_root, error_text=error_text)
+
+    def _on_save_validation_progress(self, finished, total, finding_count, done):
+        json_diagnostics_service.update_save_validation_progress(self, finished, total, finding_count, done)
+
+    def _cancel_save_validation(self):
+        json_diagnostics_service.cancel_save_validation_from_ui(self)
+
+    def _fix_save_validation_rows(self, selected_only=False): return json_diagnostics_service.fix_save_validation_rows(
+            self,
+            selected_only=selected_only,
+            expected_errors=_EXPECTED_APP_ERRORS,
+        )
+
+    def _open_selected_save_validation_finding(self): return json_diagnostics_service.open_selected_save_validation_finding(
+            self,
+            expected_errors=_EXPECTED_APP_ERRORS,
+        )
+
     def _find_next_input_mode(self):
         input_mode_find_service.find_next_input_mode(self, tk_module=tk)
 
@@ -3949,6 +4037,7 @@ if button._siindbad_base_image is None:
         self._refresh_tree_marker_for_item(item_id, selected=True)
         self._last_tree_selected_item = item_id
         self._auto_apply_pending = False
+        self._cancel_auto_apply_validation()
         self._destroy_error_overlay()
         self._clear_json_error_highlight()
         self._error_visual_mode = "guide"
@@ -3984,6 +4073,12 @@ if button._siindbad_base_image is None:
     def _show_value(self, value, path=None):
         json_view_render_service.show_value(self, value, path=path)
 
+    def _invalidate_json_render_cache(self, path=None):
+        json_view_render_service.invalidate_json_render_cache(self, path)
+
+    def _on_json_page_placeholder_double_click(self, event=None):
+        return json_view_render_service.on_json_page_placeholder_double_click(self, event)
+
     def _initial_highlight_line_limit(self): return json_view_render_service.initial_highlight_line_limit(self)
 
     def _cancel_pending_json_view_lock_state(self):
@@ -4048,21 +4143,28 @@ if button._siindbad_base_image is None:
                 return
             if self._auto_apply_in_progress:
                 return
-            if self._can_auto_apply_current_edit():
-                self._auto_apply_in_progress = True
-                self._auto_apply_pending = False
-                self._cancel_live_feedback_timer()
-                try:
-                    self._error_visual_mode = "guide"
-                    self.apply_edit()
-                finally:
-                    self._auto_apply_in_progress = False
-            else:
-                # User is actively fixing but still wrong: debounce expensive live parse/validation.
-                self._schedule_live_error_feedback()
+            # Parse/validation runs on a worker; a stale verdict is dropped when newer keys arrive.
+            self._request_auto_apply_validation()
         except _EXPECTED_APP_ERRORS:
             return
 
+    def _run_auto_apply(self):
+        if not self._auto_apply_pending or self._auto_apply_in_progress:
+            return
+        self._auto_apply_in_progress = True
+        self._auto_apply_pending = False
+        self._cancel_live_feedback_timer()
+        try:
+            self._error_visual_mode = "guide"
+            self.apply_edit()
+        finally:
+            self._auto_apply_in_progress = False
+            self._auto_apply_verdict = None
+
+    def _request_auto_apply_validation(self): return json_edit_flow_service.request_auto_apply_validation(self)
+
+    def _cancel_auto_apply_validation(self): return json_edit_flow_service.cancel_auto_apply_validation(self)
+
     def _cancel_live_feedback_timer(self):
         return ui_timer_service._cancel_live_feedback_timer(**locals())
 
@@ -4141,6 +4243,8 @@ for _repair_method_name in json_repair_dispatch_service.dispatch_method_names():
 
 
 def main():
+    # Frozen Windows builds re-enter main() in folder-search worker processes.
+    multiprocessing.freeze_support()
     path = None
     if len(sys.argv) > 1:
         path = sys.argv[1]
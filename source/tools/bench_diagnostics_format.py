@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Benchmark format_json_error over a corpus of malformed documents, counting Text widget round-trips."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from core.editor_state import EditorState  # noqa: E402
+from sins_editor import JsonEditor  # noqa: E402
+
+_INDEX_RE = re.compile(r"^\s*(\d+)\.(\d+)\s*(lineend|linestart)?\s*(?:([+-])\s*(\d+)\s*c(?:hars)?)?\s*$")
+
+
+class _CountingText:
+    """Text stand-in over a fixed buffer; every get/index call counts as one Tcl round-trip."""
+
+    def __init__(self, raw: str) -> None:
+        # Tk keeps one trailing newline after the buffer, so "end-1c" is the last character the user typed.
+        self.raw = raw + "\n"
+        self.line_starts = [0] + [match.end() for match in re.finditer("\n", raw)]
+        self.calls = 0
+
+    def _offset(self, index: str) -> int:
+        index = str(index)
+        if index.startswith("end"):
+            offset = len(self.raw)
+            rest = index[3:].strip()
+            if rest.endswith("c"):
+                offset += int(rest.rstrip("c").replace(" ", ""))
+            return max(0, min(len(self.raw), offset))
+        match = _INDEX_RE.match(index)
+        if match is None:
+            raise ValueError(f"bad text index {index!r}")
+        line, col = max(1, int(match.group(1))), int(match.group(2))
+        if line > len(self.line_starts):
+            return len(self.raw)
+        start = self.line_starts[line - 1]
+        line_end = self.raw.find("\n", start)
+        line_end = len(self.raw) if line_end < 0 else line_end
+        offset = min(start + col, line_end)
+        if match.group(3) == "lineend":
+            offset = line_end
+        elif match.group(3) == "linestart":
+            offset = start
+        if match.group(4):
+            offset += int(match.group(5)) * (1 if match.group(4) == "+" else -1)
+        return max(0, min(len(self.raw), offset))
+
+    def get(self, start: str, end: str | None = None) -> str:
+        self.calls += 1
+        begin = self._offset(start)
+        return self.raw[begin:self._offset(end) if end is not None else begin + 1]
+
+    def index(self, index: str) -> str:
+        self.calls += 1
+        offset = self._offset(index)
+        line = self.raw.count("\n", 0, offset) + 1
+        return f"{line}.{offset - (self.raw.rfind(chr(10), 0, offset) + 1)}"
+
+    def edit_modified(self, *_args):
+        return False
+
+    def __getattr__(self, _name):
+        return lambda *_args, **_kwargs: None
+
+
+def _document(rows: int) -> str:
+    return json.dumps(
+        {
+            "Network": [
+                {"ip": f"10.0.{row // 250}.{row % 250}", "name": f"node-{row}", "online": row % 2 == 0, "ports": [22, 80]}
+                for row in range(rows)
+            ],
+            "Bank": {"balance": 1200, "accounts": [{"iban": f"HH{row:08d}", "owner": f"user{row}"} for row in range(rows // 4)]},
+        },
+        indent=2,
+    )
+
+
+def _mutations(raw: str, count: int, seed: int) -> list[str]:
+    """Typical hand-edit mistakes at random lines: dropped or swapped closers, commas, unquoted values, typos, symbols."""
+    rng = random.Random(seed)
+    lines = raw.split("\n")
+    corpus = []
+    while len(corpus) < count:
+        lineno = rng.randrange(2, len(lines) - 2)
+        line = lines[lineno]
+        kind = rng.randrange(8)
+        if kind == 0 and line.endswith(","):
+            mutated = line[:-1]
+        elif kind == 1 and line.strip() in ("}", "},", "]", "],"):
+            mutated = ""
+        elif kind == 2 and ': "' in line:
+            mutated = line.replace(': "', ": ", 1).replace('",', ",").rstrip('"')
+        elif kind == 3 and ("true" in line or "false" in line):
+            mutated = line.replace("true", "ture").replace("false", "flase")
+        elif kind == 4 and line.endswith(","):
+            mutated = line + ","
+        elif kind == 5 and '": ' in line:
+            mutated = line.replace('": ', '" ', 1)
+        elif kind == 6 and line.strip().startswith('"'):
+            mutated = line.replace('"', "", 1)
+        elif kind == 7 and line.strip() in ("}", "},", "]", "],"):
+            mutated = line.translate(str.maketrans("}]", "]}"))
+        else:
+            continue
+        candidate = "\n".join(lines[:lineno] + [mutated] + lines[lineno + 1:])
+        try:
+            json.loads(candidate)
+        except json.JSONDecodeError:
+            corpus.append(candidate)
+    return corpus
+
+
+def _editor(raw: str) -> JsonEditor:
+    editor = JsonEditor.__new__(JsonEditor)
+    object.__setattr__(editor, "state", EditorState())
+    editor.text = _CountingText(raw)
+    editor.data = None
+    editor.path = None
+    editor.item_to_path = {}
+    return editor
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark JSON parse-error diagnostics.")
+    parser.add_argument("--rows", type=int, default=1500, help="Network rows in the base document.")
+    parser.add_argument("--docs", type=int, default=60, help="Malformed documents in the corpus.")
+    parser.add_argument("--seed", type=int, default=7, help="Mutation seed.")
+    args = parser.parse_args()
+
+    corpus = _mutations(_document(max(10, args.rows)), max(1, args.docs), args.seed)
+    total_s = 0.0
+    total_calls = 0
+    worst_calls = 0
+    failures = 0
+    for raw in corpus:
+        try:
+            json.loads(raw)
+        except json.JSONDecodeError as exc:
+            error = exc
+        editor = _editor(raw)
+        started = time.perf_counter()
+        try:
+            message = editor._format_json_error(error)
+        except Exception as exc:  # noqa: BLE001 - report and keep benchmarking the rest of the corpus
+            print(f"format_json_error raised {type(exc).__name__}: {exc}")
+            failures += 1
+            continue
+        total_s += time.perf_counter() - started
+        calls = editor.text.calls
+        total_calls += calls
+        worst_calls = max(worst_calls, calls)
+        if not str(message or "").strip():
+            failures += 1
+    count = max(1, len(corpus) - failures)
+    lines = corpus[0].count("\n") + 1 if corpus else 0
+    print(f"documents        {len(corpus)} x ~{lines} lines")
+    print(f"format time      {total_s / count * 1000:8.2f} ms/error")
+    print(f"widget calls     {total_calls / count:8.1f} avg  {worst_calls} worst (get/index round-trips)")
+    if failures:
+        print(f"Diagnostics benchmark failed: {failures} documents produced no message.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""Diagnostics regression harness: fault corpus per class, suggestion accuracy and p50/p95 latency against a baseline.
+
+The committed baseline holds accuracy only. Latency depends on the machine, so it is compared only when
+--latency-baseline names a local file recorded on the same machine with --write-latency-baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import pathlib
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from core import json_error_highlight_core  # noqa: E402
+from core.domain_impl.json import json_io_core  # noqa: E402
+from core.domain_impl.json import json_view_core  # noqa: E402
+from tools.bench_diagnostics_format import _document, _editor  # noqa: E402
+
+DEFAULT_BASELINE = pathlib.Path(__file__).with_name("bench_diagnostics_regression.json")
+DEFAULT_LATENCY_BASELINE = pathlib.Path(__file__).with_name("bench_diagnostics_regression.local.json")
+_ACCURACY_METRICS = ("cases", "fixed", "located", "autocorrect")
+_CLOSERS = ("}", "},", "]", "],")
+_SUGGESTION_RE = re.compile(r"^- Before: ?(.*)\n- After: {0,2}(.*)$", re.MULTILINE)
+_TRUE_TYPOS = ("ture", "treu", "tru", "trye")
+_FALSE_TYPOS = ("flase", "fasle", "fales", "fals")
+
+
+def _typo_literal(line: str, rng: random.Random) -> str:
+    if "true" in line:
+        return line.replace("true", rng.choice(_TRUE_TYPOS), 1)
+    return line.replace("false", rng.choice(_FALSE_TYPOS), 1)
+
+
+# Fault class -> (does the line qualify, rewrite). A rewrite returning None drops the line.
+FAULT_CLASSES = {
+    "missing_comma": (lambda line: line.endswith(","), lambda line, rng: line[:-1]),
+    "double_comma": (lambda line: line.endswith(","), lambda line, rng: line + ","),
+    "wrong_closer": (lambda line: line.strip() in _CLOSERS, lambda line, rng: line.translate(str.maketrans("}]", "]}"))),
+    "missing_closer": (lambda line: line.strip() in _CLOSERS, lambda line, rng: None),
+    "missing_colon": (lambda line: '": ' in line, lambda line, rng: line.replace('": ', '" ', 1)),
+    "unquoted_value": (
+        lambda line: re.search(r'": "[^"]+"', line) is not None,
+        lambda line, rng: re.sub(r'": "([^"]+)"', r'": \1', line, count=1),
+    ),
+    "boolean_typo": (lambda line: "true" in line or "false" in line, _typo_literal),
+    "missing_key_quote": (lambda line: line.strip().startswith('"'), lambda line, rng: line.replace('"', "", 1)),
+    "stray_quote": (
+        lambda line: re.search(r'": "[^"]+",?$', line) is not None,
+        lambda line, rng: re.sub(r'"(,?)$', r'""\1', line, count=1),
+    ),
+}
+
+
+def generate_corpus(sizes: list[int], cases: int, seed: int) -> list[dict]:
+    """Malformed documents with one injected fault each: every class at random lines in every document size."""
+    rng = random.Random(seed)
+    corpus = []
+    for rows in sizes:
+        raw = _document(max(2, rows))
+        lines = raw.split("\n")
+        for name, (applies, rewrite) in FAULT_CLASSES.items():
+            eligible = [idx for idx in range(1, len(lines) - 1) if applies(lines[idx])]
+            made = 0
+            for _attempt in range(cases * 20):
+                if made >= cases or not eligible:
+                    break
+                idx = rng.choice(eligible)
+                fault = rewrite(lines[idx], rng)
+                broken = lines[:idx] + ([] if fault is None else [fault]) + lines[idx + 1:]
+                candidate = "\n".join(broken)
+                try:
+                    json.loads(candidate)
+                except json.JSONDecodeError as exc:
+                    corpus.append(
+                        {"fault": name, "rows": rows, "line": idx + 1, "raw": candidate, "original": raw, "error": exc}
+                    )
+                    made += 1
+    return corpus
+
+
+def _apply_suggestion(raw: str, message: str, line: int) -> str | None:
+    """The buffer after applying the overlay's Before/After pair near line, or None when it cannot be placed."""
+    match = _SUGGESTION_RE.search(str(message or ""))
+    if match is None:
+        return None
+    before, after = match.group(1).strip(), match.group(2).strip()
+    lines = raw.split("\n")
+    if not before:
+        at = min(max(line, 1), len(lines) + 1) - 1
+        if at < len(lines) and not lines[at].strip():
+            lines[at] = after
+        else:
+            lines.insert(at, after)
+        return "\n".join(lines)
+    for lineno in sorted(range(line - 3, line + 4), key=lambda candidate: abs(candidate - line)):
+        if 1 <= lineno <= len(lines) and lines[lineno - 1].strip() == before:
+            text = lines[lineno - 1]
+            lines[lineno - 1] = text[: len(text) - len(text.lstrip())] + after
+            return "\n".join(lines)
+    return None
+
+
+def _parses_to(raw: str | None, expected) -> bool:
+    if raw is None:
+        return False
+    try:
+        return json.loads(raw) == expected
+    except json.JSONDecodeError:
+        return False
+
+
+def run_case(case: dict) -> dict:
+    """Time the three pipeline stages on a fresh editor and score the suggestion, highlight line and autocorrect."""
+    raw, exc = case["raw"], case["error"]
+    editor = _editor(raw)
+    editor.error_pin = None
+    editor.error_overlay = None
+    highlighted = []
+
+    def apply_highlight(owner, target_exc, line, start_index, end_index, note=""):
+        highlighted.append(int(line))
+        return json_view_core.apply_json_error_highlight(owner, target_exc, line, start_index, end_index, note=note)
+
+    started = time.perf_counter()
+    message = editor._format_json_error(exc)
+    format_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    json_error_highlight_core.highlight_json_error(
+        editor, exc, apply_highlight_fn=apply_highlight, log_error_fn=lambda *_args, **_kwargs: None
+    )
+    highlight_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    corrected = json_io_core.autocorrect_boolean_literal_payload(raw, error_lineno=exc.lineno)
+    autocorrect_ms = (time.perf_counter() - started) * 1000
+
+    expected = json.loads(case["original"])
+    line = highlighted[-1] if highlighted else exc.lineno
+    if case["fault"] == "boolean_typo":
+        autocorrect_ok = _parses_to(corrected, expected)
+    else:
+        # Other faults must be left alone (or genuinely repaired), never rewritten into a different document.
+        autocorrect_ok = corrected == raw or _parses_to(corrected, expected)
+    return {
+        "fixed": _parses_to(_apply_suggestion(raw, message, line), expected),
+        "located": bool(highlighted) and abs(line - case["line"]) <= 1,
+        "autocorrect": autocorrect_ok,
+        "format_ms": format_ms,
+        "highlight_ms": highlight_ms,
+        "autocorrect_ms": autocorrect_ms,
+    }
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def summarize(corpus: list[dict], results: list[dict]) -> dict:
+    classes = {}
+    for name in FAULT_CLASSES:
+        rows = [result for case, result in zip(corpus, results) if case["fault"] == name]
+        count = max(1, len(rows))
+        latency = {}
+        for stage in ("format", "highlight", "autocorrect", "total"):
+            if stage == "total":
+                samples = [row["format_ms"] + row["highlight_ms"] + row["autocorrect_ms"] for row in rows]
+            else:
+                samples = [row[f"{stage}_ms"] for row in rows]
+            latency[stage] = {"p50": round(_percentile(samples, 50), 4), "p95": round(_percentile(samples, 95), 4)}
+        classes[name] = {
+            "cases": len(rows),
+            "fixed": round(sum(row["fixed"] for row in rows) / count, 4),
+            "located": round(sum(row["located"] for row in rows) / count, 4),
+            "autocorrect": round(sum(row["autocorrect"] for row in rows) / count, 4),
+            "latency_ms": latency,
+        }
+    return classes
+
+
+def accuracy_report(report: dict) -> dict:
+    """report without latency: the machine-independent part that is safe to commit."""
+    return {
+        "config": report["config"],
+        "classes": {
+            name: {metric: numbers[metric] for metric in _ACCURACY_METRICS} for name, numbers in report["classes"].items()
+        },
+    }
+
+
+def regressions(
+    report: dict,
+    baseline: dict,
+    latency_baseline: dict | None = None,
+    latency_tolerance: float = 0.5,
+    latency_slack_ms: float = 1.0,
+) -> list[str]:
+    """Human-readable regressions: accuracy may not drop; with a latency baseline, p95 may not grow past tolerance."""
+    problems = []
+    for label, stored in (("baseline", baseline), ("latency baseline", latency_baseline)):
+        if stored is not None and report["config"] != stored.get("config"):
+            problems.append(f"{label} was recorded with {stored.get('config')}, this run used {report['config']}")
+    if problems:
+        return problems
+    for name, current in report["classes"].items():
+        expected = baseline.get("classes", {}).get(name)
+        if expected is not None:
+            for metric in ("fixed", "located", "autocorrect"):
+                if current[metric] < expected[metric]:
+                    problems.append(f"{name}: {metric} {current[metric]:.2%} < baseline {expected[metric]:.2%}")
+        timed = (latency_baseline or {}).get("classes", {}).get(name)
+        if timed is None:
+            continue
+        for stage, numbers in current["latency_ms"].items():
+            limit = timed["latency_ms"][stage]["p95"] * (1 + latency_tolerance) + latency_slack_ms
+            if numbers["p95"] > limit:
+                problems.append(f"{name}: {stage} p95 {numbers['p95']:.3f} ms > limit {limit:.3f} ms")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure JSON diagnostics accuracy and latency per fault class.")
+    parser.add_argument("--sizes", default="20,200,2000", help="Comma-separated Network row counts for the base documents.")
+    parser.add_argument("--cases", type=int, default=12, help="Faults per class per document size.")
+    parser.add_argument("--seed", type=int, default=11, help="Corpus seed.")
+    parser.add_argument("--baseline", type=pathlib.Path, default=DEFAULT_BASELINE, help="Stored accuracy baseline.")
+    parser.add_argument("--write-baseline", action="store_true", help="Store this run's accuracy as the new baseline.")
+    parser.add_argument(
+        "--latency-baseline",
+        type=pathlib.Path,
+        nargs="?",
+        const=DEFAULT_LATENCY_BASELINE,
+        help=f"Also compare p95 latency against this local (uncommitted) report; defaults to {DEFAULT_LATENCY_BASELINE.name}.",
+    )
+    parser.add_argument(
+        "--write-latency-baseline", action="store_true", help="Store this run as the local latency baseline."
+    )
+    parser.add_argument("--output", type=pathlib.Path, help="Write the JSON report here instead of stdout.")
+    parser.add_argument("--latency-tolerance", type=float, default=0.5, help="Allowed p95 growth as a fraction.")
+    parser.add_argument("--latency-slack-ms", type=float, default=1.0, help="Allowed p95 growth in absolute ms.")
+    args = parser.parse_args()
+
+    sizes = [int(part) for part in str(args.sizes).split(",") if part.strip()]
+    corpus = generate_corpus(sizes, max(1, args.cases), args.seed)
+    results = [run_case(case) for case in corpus]
+    report = {
+        "config": {"sizes": sizes, "cases": max(1, args.cases), "seed": args.seed},
+        "classes": summarize(corpus, results),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    latency_path = args.latency_baseline or DEFAULT_LATENCY_BASELINE
+    if args.write_baseline or args.write_latency_baseline:
+        if args.write_baseline:
+            args.baseline.write_text(json.dumps(accuracy_report(report), indent=2) + "\n", encoding="utf-8")
+        if args.write_latency_baseline:
+            latency_path.write_text(text + "\n", encoding="utf-8")
+        return 0
+    if not args.baseline.is_file():
+        print(f"No baseline at {args.baseline}; run with --write-baseline to record one.", file=sys.stderr)
+        return 0
+    latency_baseline = None
+    if args.latency_baseline is not None:
+        if not latency_path.is_file():
+            print(f"No latency baseline at {latency_path}; run with --write-latency-baseline on this machine first.", file=sys.stderr)
+            return 1
+        latency_baseline = json.loads(latency_path.read_text(encoding="utf-8"))
+    problems = regressions(
+        report,
+        json.loads(args.baseline.read_text(encoding="utf-8")),
+        latency_baseline,
+        args.latency_tolerance,
+        args.latency_slack_ms,
+    )
+    if problems:
+        for problem in problems:
+            print(problem, file=sys.stderr)
+        print(f"Diagnostics regression check failed: {len(problems)} regressions.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
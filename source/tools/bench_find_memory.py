@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Measure retained memory per JSON find match: path lists vs compact node-id match sets."""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import tracemalloc
+from types import SimpleNamespace
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from core.domain_impl.json import json_navigation_core as find_service  # noqa: E402
+
+
+def _synthetic_document(rows: int) -> dict:
+    return {
+        "Network": [
+            {"ip": f"10.0.{row // 250}.{row % 250}", "name": f"alpha-{row}", "tags": ["a", "b"], "meta": {"note": "data"}}
+            for row in range(rows)
+        ],
+        "Accounts": [{"user": f"user{row}", "email": f"user{row}@example.test"} for row in range(rows // 2)],
+    }
+
+
+def _owner(data: dict) -> SimpleNamespace:
+    return SimpleNamespace(
+        data=data,
+        _hidden_root_tree_keys_for_mode=lambda _mode: set(),
+        _normalize_root_tree_key=lambda key: str(key).casefold(),
+        _tree_display_label_for_key=lambda key: str(key),
+        _list_labelers={},
+        _is_database_table_rows_path=lambda _path: False,
+        _find_search_value_summary=lambda _value: "",
+    )
+
+
+def _retained_bytes(build) -> tuple[int, object]:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return retained, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare find-result memory for broad queries.")
+    parser.add_argument("--rows", type=int, default=40000, help="Network rows in the synthetic document.")
+    parser.add_argument("--query", default="a", help="Broad search text.")
+    parser.add_argument("--min-ratio", type=float, default=10.0, help="Required legacy/compact bytes-per-match ratio.")
+    args = parser.parse_args()
+
+    owner = _owner(_synthetic_document(max(1, args.rows)))
+    compact_bytes, compact = _retained_bytes(lambda: find_service.build_json_find_matches(owner, args.query))
+    match_count = len(compact)
+    if not match_count:
+        print("Find memory benchmark failed: query produced no matches.")
+        return 1
+
+    def _legacy():
+        # Pre-encoding representation: one list per path plus one cached token string per path.
+        paths = [list(path) for path in compact]
+        token_cache = {tuple(path): find_service._path_token_text(owner, path) for path in paths}
+        return paths, token_cache
+
+    legacy_bytes, _legacy_result = _retained_bytes(_legacy)
+    compact_per_match = compact_bytes / match_count
+    legacy_per_match = legacy_bytes / match_count
+    ratio = legacy_per_match / max(1e-9, compact_per_match)
+    print(f"matches           {match_count}")
+    print(f"path lists+tokens {legacy_per_match:8.1f} B/match")
+    print(f"node-id match set {compact_per_match:8.1f} B/match (includes node table)")
+    print(f"ratio             {ratio:8.1f}x")
+    if ratio < args.min_ratio:
+        print(f"Find memory benchmark failed: ratio below {args.min_ratio:.1f}x.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark cross-save folder search: serial scan vs process-pool scan over synthetic saves."""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import gzip
+import json
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from core.domain_impl.json import json_navigation_core as folder_search  # noqa: E402
+
+
+def _synthetic_save(index: int, rows: int) -> dict:
+    return {
+        "Network": [
+            {"ip": f"10.{index % 250}.{row // 250}.{row % 250}", "name": f"node-{index}-{row}", "ports": [22, 80, 443]}
+            for row in range(rows)
+        ],
+        "Accounts": [{"user": f"user{row}", "email": f"user{row}@example.test"} for row in range(rows // 4)],
+        "Bank": {"balance": index * 1000, "history": [{"amount": row, "memo": "transfer"} for row in range(rows // 2)]},
+    }
+
+
+def _write_corpus(folder: pathlib.Path, count: int, rows: int) -> None:
+    for index in range(count):
+        with gzip.open(folder / f"save_{index:03d}.hhsav", "wt", encoding="utf-8") as fh:
+            json.dump(_synthetic_save(index, rows), fh)
+
+
+def _run_serial(paths: list[str], query: str) -> tuple[float, int]:
+    started = time.perf_counter()
+    hits = sum(len(folder_search.scan_save_file_for_query(path, query)["rows"]) for path in paths)
+    return time.perf_counter() - started, hits
+
+
+def _run_pool(paths: list[str], query: str, workers: int) -> tuple[float, int]:
+    started = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(folder_search.scan_save_file_for_query, path, query) for path in paths]
+        hits = sum(len(future.result()["rows"]) for future in concurrent.futures.as_completed(futures))
+    return time.perf_counter() - started, hits
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Search in Folder throughput.")
+    parser.add_argument("--saves", type=int, default=50, help="Number of synthetic saves to generate.")
+    parser.add_argument("--rows", type=int, default=4000, help="Network rows per synthetic save.")
+    parser.add_argument("--query", default="10.7.", help="Search text.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="hh_folder_search_") as tmp:
+        folder = pathlib.Path(tmp)
+        _write_corpus(folder, max(1, args.saves), max(1, args.rows))
+        paths = folder_search.list_folder_save_paths(folder)
+        serial_s, serial_hits = _run_serial(paths, args.query)
+        print(f"serial      {serial_s:8.3f}s  {len(paths) / serial_s:7.1f} saves/s  hits={serial_hits}")
+        cpu = os.cpu_count() or 1
+        workers = 1
+        while workers <= cpu:
+            pool_s, pool_hits = _run_pool(paths, args.query, workers)
+            print(
+                f"pool x{workers:<3d}  {pool_s:8.3f}s  {len(paths) / pool_s:7.1f} saves/s  "
+                f"speedup={serial_s / pool_s:4.2f}  hits={pool_hits}"
+            )
+            if pool_hits != serial_hits:
+                print("Folder search benchmark failed: pool hit count differs from serial scan.")
+                return 1
+            workers *= 2
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark live JSON validation while typing: full json.loads per keystroke vs the incremental span tree."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from core.domain_impl.json import json_diagnostics_core as diagnostics  # noqa: E402
+
+
+def _synthetic_node(target_bytes: int) -> str:
+    rows = []
+    size = 0
+    row = 0
+    while size < target_bytes:
+        item = {
+            "id": row,
+            "ip": f"10.{row % 250}.{row // 250 % 250}.{row % 7}",
+            "name": f"node-{row}",
+            "ports": [22, 80, 443],
+            "owner": {"user": f"user{row}", "email": f"user{row}@example.test"},
+        }
+        rows.append(item)
+        size += 190
+        row += 1
+    return json.dumps({"Network": rows}, indent=2)
+
+
+def _keystrokes(raw: str, count: int) -> list[str]:
+    """Type a word into a string value mid-document, with a stray comma typed and removed halfway."""
+    anchor = raw.index('"name": "node-', len(raw) // 2) + len('"name": "node-')
+    texts = []
+    typed = ""
+    for index in range(count):
+        typed += "abcdefghij"[index % 10]
+        text = raw[:anchor] + typed + raw[anchor:]
+        texts.append(text)
+        if index == count // 2:
+            # A doubled comma after the value is invalid until the next keystroke drops it again.
+            close = text.index('"', anchor) + 1
+            texts.append(text[:close] + "," + text[close:])
+    return texts
+
+
+def _full_error(text: str):
+    try:
+        json.loads(text)
+    except json.JSONDecodeError as exc:
+        return exc
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare full vs incremental JSON validation per keystroke.")
+    parser.add_argument("--mb", type=float, default=10.0, help="Approximate node size in megabytes.")
+    parser.add_argument("--keys", type=int, default=40, help="Keystrokes to simulate.")
+    args = parser.parse_args()
+
+    raw = _synthetic_node(int(max(0.1, args.mb) * 1024 * 1024))
+    texts = _keystrokes(raw, max(2, args.keys))
+    incremental = diagnostics.IncrementalJsonParse()
+    started = time.perf_counter()
+    incremental.update(raw)
+    build_s = time.perf_counter() - started
+
+    full_s = 0.0
+    incr_s = 0.0
+    mismatches = 0
+    for text in texts:
+        started = time.perf_counter()
+        expected = _full_error(text)
+        full_s += time.perf_counter() - started
+        started = time.perf_counter()
+        actual = incremental.update(text)
+        incr_s += time.perf_counter() - started
+        expected_key = None if expected is None else (expected.msg, expected.pos)
+        actual_key = None if actual is None else (actual.msg, actual.pos)
+        if expected_key != actual_key:
+            mismatches += 1
+
+    count = len(texts)
+    print(f"node size        {len(raw) / (1024 * 1024):8.2f} MB")
+    print(f"span tree build  {build_s * 1000:8.1f} ms (once per node)")
+    print(f"full parse       {full_s / count * 1000:8.2f} ms/keystroke")
+    print(f"incremental      {incr_s / count * 1000:8.2f} ms/keystroke  (partial={incremental.partial_parses} full={incremental.full_parses})")
+    print(f"speedup          {full_s / max(1e-9, incr_s):8.1f}x")
+    if mismatches:
+        print(f"Incremental parse benchmark failed: {mismatches} error results differ from json.loads.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Benchmark JSON view highlighting: legacy per-tag passes vs the single-pass lexer."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from core.domain_impl.json import json_diagnostics_core as diagnostics  # noqa: E402
+
+LOCKED_FIELDS = ("id", "type", "owner", "hash", "seed", "uuid", "created", "modified", "kind", "rev", "ref", "src")
+XY_KEYS = ("x", "y", "width", "height")
+
+
+class _RecordingText:
+    """Minimal Text stand-in: serves one buffer and counts tag_add calls/ranges."""
+
+    def __init__(self, raw: str) -> None:
+        self.raw = raw
+        self.calls = 0
+        self.ranges = 0
+
+    def get(self, _start: str, _end: str) -> str:
+        return self.raw
+
+    def tag_add(self, _tag: str, *indexes: str) -> None:
+        self.calls += 1
+        self.ranges += len(indexes) // 2
+
+
+def _rendered_node(target_lines: int) -> str:
+    rows = []
+    lines = 2
+    row = 0
+    while lines < target_lines:
+        rows.append(
+            {
+                "id": row,
+                "name": f"node {row} [core]",
+                "enabled": row % 2 == 0,
+                "x": row,
+                "y": -row,
+                "width": 64,
+                "height": 32,
+                "tags": ["alpha", "beta"],
+                "owner": {"type": "user", "hash": "ab" * 8},
+            }
+        )
+        lines += 18
+        row += 1
+    return json.dumps(rows, indent=2, ensure_ascii=False)
+
+
+def _run_legacy(raw: str) -> _RecordingText:
+    text = _RecordingText(raw)
+    owner = SimpleNamespace(text=text)
+    diagnostics._tag_json_brace_tokens(owner)
+    diagnostics._tag_json_boolean_literals(owner)
+    diagnostics._tag_json_property_keys(owner)
+    diagnostics._tag_json_key_occurrences_batch(owner, LOCKED_FIELDS, xy_key_names=XY_KEYS)
+    diagnostics._tag_json_string_value_literals(owner)
+    return text
+
+
+def _run_single_pass(raw: str) -> _RecordingText:
+    text = _RecordingText(raw)
+    owner = SimpleNamespace(text=text)
+    ranges = diagnostics._lex_json_highlight_ranges(raw, locked_key_names=LOCKED_FIELDS, xy_key_names=XY_KEYS)
+    diagnostics._apply_json_highlight_ranges(owner, ranges)
+    return text
+
+
+def _best_of(fn, raw: str, repeats: int) -> tuple[float, _RecordingText]:
+    best = float("inf")
+    result = None
+    for _ in range(max(1, repeats)):
+        started = time.perf_counter()
+        result = fn(raw)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark JSON highlight tagging passes.")
+    parser.add_argument("--lines", type=int, default=50000, help="Approximate rendered line count.")
+    parser.add_argument("--repeats", type=int, default=3, help="Best-of repeat count.")
+    args = parser.parse_args()
+
+    raw = _rendered_node(max(10, args.lines))
+    line_count = raw.count("\n") + 1
+    legacy_s, legacy = _best_of(_run_legacy, raw, args.repeats)
+    single_s, single = _best_of(_run_single_pass, raw, args.repeats)
+    print(f"lines        {line_count}")
+    print(f"legacy       {legacy_s * 1000:8.1f} ms  tag_add calls={legacy.calls}  ranges={legacy.ranges}")
+    print(f"single pass  {single_s * 1000:8.1f} ms  tag_add calls={single.calls}  ranges={single.ranges}")
+    print(f"speedup      {legacy_s / max(1e-9, single_s):8.2f}x (Python side; Tk call overhead excluded)")
+    if legacy.ranges != single.ranges:
+        print("Highlight benchmark failed: range counts differ between legacy and single pass.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Benchmark fixing spacing/phone/missing-@ issues one Apply at a time vs one lint pass with a batch fix."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from core.domain_impl.json import json_diagnostics_core as diagnostics  # noqa: E402
+from tools.bench_diagnostics_format import _editor  # noqa: E402
+
+
+def _document(rows: int, every: int) -> str:
+    contacts = []
+    for row in range(rows):
+        bad = row % every == 0
+        contacts.append(
+            {
+                "name": f"contact-{row}",
+                "phone": f"555{row % 10}12{row % 10000:04d}" if bad else "555-123-4567",
+                "email": f"user{row}gmail.com" if bad and row % (every * 2) == 0 else f"user{row}@gmail.com",
+            }
+        )
+    raw = json.dumps({"Contacts": contacts}, indent=2)
+    lines = raw.split("\n")
+    for idx in range(3, len(lines), every * 3):
+        # "name" lines: drop the space after the colon.
+        lines[idx] = lines[idx].replace('": ', '":', 1)
+    return "\n".join(lines)
+
+
+def _first_issue(raw: str):
+    editor = _editor(raw)
+    for finder in (
+        lambda: editor._find_json_spacing_issue_in_text(raw),
+        lambda: editor._find_phone_format_issue_in_text(raw),
+        editor._find_missing_email_at,
+    ):
+        issue = finder()
+        if issue:
+            return issue
+    return None
+
+
+def _one_per_apply(raw: str) -> tuple[str, int]:
+    """The old loop: each Apply surfaces the first issue, the user accepts its suggestion, repeat."""
+    applies = 0
+    while True:
+        issue = _first_issue(raw)
+        if issue is None:
+            return raw, applies
+        line, _start, _end, _before, after = issue
+        lines = raw.split("\n")
+        text = lines[line - 1]
+        lines[line - 1] = text[: len(text) - len(text.lstrip())] + after
+        raw = "\n".join(lines)
+        applies += 1
+
+
+def _lint_and_batch_fix(raw: str) -> tuple[str, int]:
+    editor = _editor(raw)
+    issues = diagnostics.collect_json_lint_issues(editor, raw)
+    editor._json_lint_state = {"render_seq": 0, "text": raw, "issues": issues, "lines": [issue[1] for issue in issues]}
+    return diagnostics.apply_json_lint_fixes(editor, raw.strip()), len(issues)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark batch lint fixes against one fix per Apply.")
+    parser.add_argument("--rows", type=int, default=3000, help="Contacts in the document.")
+    parser.add_argument("--every", type=int, default=40, help="One contact in this many carries a bad phone/email.")
+    args = parser.parse_args()
+
+    raw = _document(max(10, args.rows), max(2, args.every))
+    started = time.perf_counter()
+    iterative, applies = _one_per_apply(raw)
+    iterative_s = time.perf_counter() - started
+    started = time.perf_counter()
+    batched, issues = _lint_and_batch_fix(raw)
+    batched_s = time.perf_counter() - started
+    print(f"document         {raw.count(chr(10)) + 1} lines")
+    print(f"one per apply    {iterative_s * 1000:8.1f} ms ({applies} applies)")
+    print(f"lint + batch     {batched_s * 1000:8.1f} ms ({issues} issues, 1 apply)")
+    if batched != iterative.strip() or _first_issue(batched) is not None:
+        print("Lint benchmark failed: the batch fix differs from fixing one issue per Apply.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Micro-benchmark lock-policy path lookups: linear policy scans vs the compiled trie with memoized answers."""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from core.domain_impl.support import highlight_label_service as locks  # noqa: E402
+
+_ROOTS = ("Network", "Bank", "Computer", "Database", "Files", "BCC.News", "App.Store", "Esc.Menu", "Mail", "Browser.Session")
+_SEGMENTS = ("accounts", "iban", "balance", "name", "type", "id", "data", "title", "value", "notes", "visible", "x", "users")
+
+
+def _legacy_policy(path):
+    parts = list(path or [])
+    if not parts:
+        return None
+    key = locks._normalize_root_key(parts[0])
+    if not key:
+        return None
+    for policy in locks._LOCK_POLICIES:
+        if key in policy.get("root_lookup", {}):
+            return policy
+    return None
+
+
+def _legacy_is_locked_field(path):
+    parts = list(path or [])
+    if len(parts) < 2:
+        return False
+    policy = _legacy_policy(parts)
+    if policy is None:
+        return False
+    return locks._locked_segment_for_parts(policy, parts)[0] is not None
+
+
+def _legacy_highlight_fields(path):
+    parts = list(path or [])
+    if not parts:
+        return ()
+    policy = _legacy_policy(parts)
+    if policy is None:
+        return ()
+    if len(parts) == 1:
+        return tuple(policy.get("highlight_keys", ()))
+    if _legacy_is_locked_field(parts) and not policy.get("highlight_root_only", False):
+        canonical = locks._canonical_locked_key_for_policy(policy, parts[1])
+        if canonical:
+            return (canonical,)
+    return ()
+
+
+def _legacy_highlight_rules(path):
+    parts = list(path or [])
+    if not parts:
+        return ()
+    policy = _legacy_policy(parts)
+    if policy is None:
+        return ()
+    rules = tuple(policy.get("locked_value_rules", ()))
+    if not rules:
+        return ()
+    if len(parts) == 1:
+        return rules
+    if not policy.get("highlight_root_only", False):
+        rule = locks._locked_value_rule_for_parts(policy, parts)[0]
+        if rule is not None:
+            return (rule,)
+    return ()
+
+
+def _legacy_answers(path):
+    # Pre-trie public functions: each call re-normalizes and re-scans the policy table.
+    return _legacy_policy(path), _legacy_is_locked_field(path), _legacy_highlight_fields(path), _legacy_highlight_rules(path)
+
+
+def _trie_answers(path):
+    return (
+        locks.lock_policy_for_path(path),
+        locks.is_locked_field_path(path),
+        locks.locked_highlight_fields_for_path(path),
+        locks.locked_highlight_value_rules_for_path(path),
+    )
+
+
+def _paths(count: int, distinct: int, seed: int) -> list[list]:
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(max(1, distinct)):
+        path = [rng.choice(_ROOTS)]
+        for _depth in range(rng.randrange(0, 5)):
+            path.append(rng.randrange(0, 50) if rng.random() < 0.3 else rng.choice(_SEGMENTS))
+        pool.append(path)
+    return [list(rng.choice(pool)) for _ in range(count)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark lock-policy path lookups.")
+    parser.add_argument("--lookups", type=int, default=100000, help="Paths to resolve.")
+    parser.add_argument("--distinct", type=int, default=800, help="Distinct paths (tree nodes being revisited).")
+    parser.add_argument("--seed", type=int, default=3, help="Path generator seed.")
+    args = parser.parse_args()
+
+    paths = _paths(max(1, args.lookups), args.distinct, args.seed)
+    locks._LOCK_PATH_MEMO.clear()
+    started = time.perf_counter()
+    legacy = [_legacy_answers(path) for path in paths]
+    legacy_s = time.perf_counter() - started
+    started = time.perf_counter()
+    trie = [_trie_answers(path) for path in paths]
+    trie_s = time.perf_counter() - started
+    mismatches = sum(1 for expected, actual in zip(legacy, trie) if expected != actual)
+    print(f"lookups          {len(paths)} x 4 answers ({args.distinct} distinct paths)")
+    print(f"linear scans     {legacy_s * 1000:8.1f} ms")
+    print(f"trie + memo      {trie_s * 1000:8.1f} ms  (memo entries={len(locks._LOCK_PATH_MEMO)})")
+    print(f"speedup          {legacy_s / max(1e-9, trie_s):8.1f}x")
+    if mismatches:
+        print(f"Lock policy benchmark failed: {mismatches} answers differ from the linear scans.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark whole-save validation: in-process category scan vs the process pool split on root categories."""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from core.domain_impl.json import json_diagnostics_core as diagnostics  # noqa: E402
+
+
+def _synthetic_save(rows: int) -> dict:
+    return {
+        "Network": [
+            {"ip": f"10.0.{row // 250}.{row % 250}", "name": f"node-{row}", "owner": {"email": f"user{row}@example.test"}}
+            for row in range(rows)
+        ],
+        "Mail": [
+            {"from": f"user{row}gmail.com" if row % 40 == 0 else f"user{row}@example.test", "to": "admin@example.test"}
+            for row in range(rows // 2)
+        ],
+        "Contacts": {
+            f"contact{row}": {"phone": f"555{row % 10}123{row % 1000:03d}" if row % 25 == 0 else "555-123-4567"}
+            for row in range(rows // 2)
+        },
+        "Bank": {"accounts": [{"iban": f"HH{row:08d}", "email": f"x@l{row}.net"} for row in range(rows // 8)]},
+    }
+
+
+def _finding_keys(findings: list[dict]) -> list[tuple]:
+    return sorted((repr(item["path"]), item["rule"], repr(item["suggested"])) for item in findings)
+
+
+def _serial(data: dict) -> list[dict]:
+    findings = []
+    for job in diagnostics.split_save_validation_jobs(data):
+        findings.extend(diagnostics.scan_save_validation_job(job, ((), ()))["findings"])
+    return findings
+
+
+def _pooled(data: dict, workers: int) -> list[dict]:
+    findings = []
+    jobs = diagnostics.split_save_validation_jobs(data)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max(1, min(workers, len(jobs)))) as executor:
+        futures = [
+            executor.submit(diagnostics.scan_save_validation_job, diagnostics.serialize_save_validation_job(job), ((), ()))
+            for job in jobs
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            findings.extend(future.result()["findings"])
+    return findings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark whole-save validation across a process pool.")
+    parser.add_argument("--rows", type=int, default=200000, help="Network rows in the synthetic save.")
+    parser.add_argument("--workers", type=int, default=4, help="Process pool size.")
+    args = parser.parse_args()
+
+    data = _synthetic_save(max(10, args.rows))
+    jobs = diagnostics.split_save_validation_jobs(data)
+    started = time.perf_counter()
+    serial = _serial(data)
+    serial_s = time.perf_counter() - started
+    started = time.perf_counter()
+    pooled = _pooled(data, args.workers)
+    pooled_s = time.perf_counter() - started
+    print(f"jobs             {len(jobs)} ({len(data)} root categories)")
+    print(f"findings         {len(serial)} ({sum(1 for item in serial if item['fixable'])} fixable)")
+    print(f"in-process scan  {serial_s * 1000:8.1f} ms (blocks the UI thread)")
+    print(f"process pool     {pooled_s * 1000:8.1f} ms ({args.workers} workers, includes pickling)")
+    if _finding_keys(serial) != _finding_keys(pooled):
+        print("Save validation benchmark failed: pooled findings differ from the in-process scan.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Check the nearby-line rule registry: stored format_json_error messages, then the single sweep against per-rule scans.
+
+The fixture (check_nearby_line_rules.json) holds messages recorded before the rule registry replaced the
+hand-written detectors, so it catches changes the sweep and the per-rule scans would share.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from core.domain_impl.json import json_diagnostics_core as diagnostics  # noqa: E402
+from tools.bench_diagnostics_format import _document, _editor  # noqa: E402
+
+DEFAULT_FIXTURE = pathlib.Path(__file__).with_name("check_nearby_line_rules.json")
+
+# Line edits that trip the nearby-line detectors: (predicate on the original line, rewrite).
+_LINE_EDITS = (
+    (lambda line: line.endswith(","), lambda line: line[:-1]),
+    (lambda line: line.endswith(","), lambda line: line + ","),
+    (lambda line: line.endswith(","), lambda line: line + " ,,"),
+    (lambda line: line.endswith(","), lambda line: line[:-1] + '",'),
+    (lambda line: line.endswith(","), lambda line: line[:-1] + "x#,"),
+    (lambda line: '": ' in line, lambda line: line.replace('": ', '" ', 1)),
+    (lambda line: '": ' in line, lambda line: line.replace('": ', '",: ', 1)),
+    (lambda line: '": ' in line, lambda line: line.replace('": ', '": ,', 1)),
+    (lambda line: '": "' in line, lambda line: line.replace('": "', '": ', 1)),
+    (lambda line: '": "' in line, lambda line: line.replace('": "', '": "a"b', 1)),
+    (lambda line: '",' in line, lambda line: line.replace('",', ",", 1)),
+    (lambda line: line.strip().startswith('"'), lambda line: line.replace('"', "", 1)),
+    (lambda line: line.strip().startswith('"'), lambda line: line.replace('"', "'", 1)),
+    (lambda line: "true" in line or "false" in line, lambda line: line.replace("true", "ture").replace("false", "flase")),
+    (lambda line: line.strip() in ("}", "},", "]", "],"), lambda line: line + ";"),
+    (lambda line: line.strip() in ("}", "},", "]", "],"), lambda line: ""),
+    (lambda line: line.rstrip().endswith(("{", "[")), lambda line: line + "%"),
+    (lambda line: '"' in line, lambda line: line.replace('"', '"\\q', 1)),
+)
+
+
+def _corpus(raw: str, count: int, seed: int) -> list[tuple[str, json.JSONDecodeError, int, int]]:
+    """(document, error, line index, edit index) per malformed document; the indexes let a fixture replay the edit."""
+    rng = random.Random(seed)
+    lines = raw.split("\n")
+    corpus = []
+    while len(corpus) < count:
+        lineno = rng.randrange(1, len(lines))
+        edit = rng.randrange(len(_LINE_EDITS))
+        applies, rewrite = _LINE_EDITS[edit]
+        if not applies(lines[lineno]):
+            continue
+        case = _replay(lines, lineno, edit)
+        if case is not None:
+            corpus.append(case)
+    return corpus
+
+
+def _replay(lines: list[str], lineno: int, edit: int):
+    candidate = "\n".join(lines[:lineno] + [_LINE_EDITS[edit][1](lines[lineno])] + lines[lineno + 1:])
+    try:
+        json.loads(candidate)
+    except json.JSONDecodeError as exc:
+        return candidate, exc, lineno, edit
+    return None
+
+
+def _format_message(raw: str, exc: json.JSONDecodeError) -> str:
+    return str(_editor(raw)._format_json_error(exc) or "")
+
+
+def _check_fixture(path: pathlib.Path) -> int:
+    """Replay each stored edit and compare format_json_error with the recorded message; returns mismatches."""
+    fixture = json.loads(path.read_text(encoding="utf-8"))
+    raw = _document(int(fixture["rows"]))
+    if hashlib.sha256(raw.encode("utf-8")).hexdigest() != fixture["document_sha256"]:
+        print(f"fixture {path.name} was recorded against a different base document; re-record it from a known-good tree.")
+        return 1
+    lines = raw.split("\n")
+    mismatches = 0
+    for case in fixture["cases"]:
+        replayed = _replay(lines, int(case["line"]), int(case["edit"]))
+        message = _format_message(replayed[0], replayed[1]) if replayed is not None else ""
+        if message != case["message"]:
+            mismatches += 1
+            print(f"fixture mismatch  line={case['line'] + 1} edit={case['edit']}:\n  expected {case['message']!r}\n  actual   {message!r}")
+    print(f"fixture cases    {len(fixture['cases'])}")
+    return mismatches
+
+
+def _write_fixture(path: pathlib.Path, rows: int, count: int, seed: int) -> None:
+    raw = _document(rows)
+    cases = [
+        {"line": lineno, "edit": edit, "message": _format_message(candidate, exc)}
+        for candidate, exc, lineno, edit in _corpus(raw, count, seed)
+    ]
+    fixture = {
+        "rows": rows,
+        "seed": seed,
+        "document_sha256": hashlib.sha256(raw.encode("utf-8")).hexdigest(),
+        "cases": cases,
+    }
+    path.write_text(json.dumps(fixture, indent=1) + "\n", encoding="utf-8")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Verify nearby-line rule sweeps match per-rule scans.")
+    parser.add_argument("--rows", type=int, default=60, help="Network rows in the base document.")
+    parser.add_argument("--docs", type=int, default=800, help="Malformed documents to check.")
+    parser.add_argument("--seed", type=int, default=5, help="Mutation seed.")
+    parser.add_argument("--fixture", type=pathlib.Path, default=DEFAULT_FIXTURE, help="Stored messages to compare against.")
+    parser.add_argument("--write-fixture", action="store_true", help="Record the fixture from this tree and exit.")
+    args = parser.parse_args()
+
+    if args.write_fixture:
+        _write_fixture(args.fixture, max(10, args.rows), max(1, args.docs), args.seed)
+        return 0
+    mismatches = _check_fixture(args.fixture)
+    rules = list(diagnostics._NEARBY_LINE_RULES.values())
+    hits = 0
+    scan_s = 0.0
+    sweep_s = 0.0
+    for raw, exc, _lineno, _edit in _corpus(_document(max(10, args.rows)), max(1, args.docs), args.seed):
+        editor = _editor(raw)
+        for lineno in (exc.lineno - 1, exc.lineno, exc.lineno + 1):
+            if lineno < 1:
+                continue
+            started = time.perf_counter()
+            expected = {rule.name: diagnostics.scan_nearby_line_rule(editor, rule.name, lineno, rule.lookback) for rule in rules}
+            scan_s += time.perf_counter() - started
+            started = time.perf_counter()
+            actual = {rule.name: diagnostics.nearby_line_rule_match(editor, rule.name, lineno) for rule in rules}
+            sweep_s += time.perf_counter() - started
+            for rule in rules:
+                if expected[rule.name] != actual[rule.name]:
+                    mismatches += 1
+                    print(f"mismatch  rule={rule.name} line={lineno}: {expected[rule.name]!r} != {actual[rule.name]!r}")
+                elif expected[rule.name][0] is not None:
+                    hits += 1
+    print(f"rules            {len(rules)}")
+    print(f"rule hits        {hits}")
+    print(f"per-rule scans   {scan_s * 1000:8.1f} ms")
+    print(f"single sweep     {sweep_s * 1000:8.1f} ms")
+    if mismatches:
+        print(f"Nearby-line rule check failed: {mismatches} results differ from the fixture or per-rule scans.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())